@@ -1,4 +1,6 @@
-from core.api.eventmanager import EventManager, event_handler
+from core.api.eventmanager import EventManager, HandlerPolicy, event_handler
+from core.api.inputrouter import InputRouter
+from core.api.profiler import Profiler
 from core.api.renderer import Renderer
 from core.api.win32methods import Win32Methods
 from core.api.window import Window
@@ -0,0 +1,151 @@
+import numpy as np
+
+# Opcodes of the draw commands.
+FILL, RECT, LINE, BLIT, LINES, CIRCLE = range(6)
+
+# The name, type and row shape of each column.
+_COLUMNS = {
+    "op": (np.uint8, ()),
+    "layer": (np.uint8, ()),
+    "color": (np.uint32, ()),
+    "coords": (np.int32, (4,)),
+    "width": (np.int16, ()),
+    "radius": (np.int16, (4,)),
+    "alpha": (np.int16, ()),
+    "area": (np.int32, (4,)),
+    "bounds": (np.int32, (4,)),
+}
+
+
+class CommandBuffer:
+    """
+    This class stores draw commands in preallocated, typed arrays.
+
+    The arrays are reused between frames and only grow, when more commands are
+    queued in a frame than ever before.
+
+    Attributes
+    ----------
+        count : int
+            The number of commands queued.
+
+        op : numpy.ndarray[uint8]
+            The opcode of each command.
+
+        layer : numpy.ndarray[uint8]
+            The layer index of each command.
+
+        color : numpy.ndarray[uint32]
+            The color of each command packed as `0xRRGGBBAA`.
+
+        coords : numpy.ndarray[int32]
+            The coordinates of each command. These are `(x, y, w, h)` for
+            rectangles, `(x1, y1, x2, y2)` for lines, `(x, y, 0, 0)` for
+            surfaces, `(closed, 0, 0, 0)` for polylines and `(x, y, r, 0)` for
+            circles.
+
+        width : numpy.ndarray[int16]
+            The line width of each command.
+
+        radius : numpy.ndarray[int16]
+            The border radii of each command, or `-1` if not rounded.
+
+        alpha : numpy.ndarray[int16]
+            The alpha value of each surface, or `-1` if not set.
+
+        area : numpy.ndarray[int32]
+            The area `(x, y, w, h)` of each surface to draw.
+
+        bounds : numpy.ndarray[int32]
+            The bounding rectangle `(x, y, w, h)` of each command.
+
+        objects : list
+            The surface or the points of each command, or `None`.
+    """
+
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.capacity = 0
+        self.objects: list = []
+        self._resize(capacity)
+
+    def _resize(self, capacity):
+        """
+        Reallocate the arrays with a new capacity, keeping the queued commands.
+        """
+        n = self.count
+        for name, (dtype, shape) in _COLUMNS.items():
+            array = np.zeros((capacity, *shape), dtype)
+            if n:
+                array[:n] = getattr(self, name)[:n]
+            setattr(self, name, array)
+
+        self.objects.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    def clear(self):
+        """
+        Remove all queued commands.
+        """
+        self.count = 0
+
+    def push(self, op, layer, color, coords, width, radius, alpha, area, obj, bounds):
+        """
+        Queue a command.
+        """
+        i = self.count
+        if i == self.capacity:
+            self._resize(2 * self.capacity)
+
+        self.op[i] = op
+        self.layer[i] = layer
+        self.color[i] = color
+        self.coords[i] = coords
+        self.width[i] = width
+        self.radius[i] = radius
+        self.alpha[i] = alpha
+        self.area[i] = area
+        self.objects[i] = obj
+        self.bounds[i] = bounds
+        self.count = i + 1
+
+    def extend(
+        self, n, op, layer, color, coords, width, radius, alpha, area, objs, bounds
+    ):
+        """
+        Queue `n` commands at once. The columns are broadcast to `n` rows, and
+        `objs` is either a list of `n` objects or `None`.
+        """
+        i = self.count
+        j = i + n
+        if j > self.capacity:
+            self._resize(max(j, 2 * self.capacity))
+
+        self.op[i:j] = op
+        self.layer[i:j] = layer
+        self.color[i:j] = color
+        self.coords[i:j] = coords
+        self.width[i:j] = width
+        self.radius[i:j] = radius
+        self.alpha[i:j] = alpha
+        self.area[i:j] = area
+        self.objects[i:j] = [None] * n if objs is None else objs
+        self.bounds[i:j] = bounds
+        self.count = j
+
+    def take(self, other: "CommandBuffer", order: np.ndarray):
+        """
+        Replace the commands with the commands of another buffer in the
+        given order.
+        """
+        n = len(order)
+        if n > self.capacity:
+            self.count = 0
+            self._resize(max(n, 2 * self.capacity))
+
+        for name in _COLUMNS:
+            np.take(getattr(other, name), order, axis=0, out=getattr(self, name)[:n])
+
+        objects = other.objects
+        self.objects[:n] = [objects[i] for i in order.tolist()]
+        self.count = n
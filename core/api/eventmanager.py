@@ -1,4 +1,5 @@
 from collections import deque
+from enum import Enum
 from functools import partial, wraps
 from itertools import count
 from typing import Callable
@@ -8,7 +9,27 @@ import pygame as pg
 from core.api._singletontype import SingletonType
 
 
-def event_handler(type: int, pass_event=False):
+class HandlerPolicy(Enum):
+    """
+    This enum describes how often an event handler is called in a frame.
+
+    Members
+    -------
+        ONCE
+            The handler is called with the first matching event of the frame.
+        EVERY
+            The handler is called with every matching event of the frame.
+        LATEST
+            The handler is called once with the last matching event of the frame,
+            after all other events have been dispatched.
+    """
+
+    ONCE = 0
+    EVERY = 1
+    LATEST = 2
+
+
+def event_handler(type: int, pass_event=False, policy=HandlerPolicy.ONCE):
     """
     Decorate a function and convert it into a event handler.
 
@@ -18,6 +39,8 @@ def event_handler(type: int, pass_event=False):
             The pygame event type to listen to.
         pass_event : bool, default `False`
             Whether to pass the event to the function.
+        policy : HandlerPolicy, default `HandlerPolicy.ONCE`
+            How often the function is called in a frame.
 
     Note
     ----
@@ -27,16 +50,20 @@ def event_handler(type: int, pass_event=False):
     """
 
     def decorator(function):
-        @wraps(function)
-        def wrapper(event, **kwargs):
-            correct_type = event.type == type
-            if correct_type:
-                if pass_event:
-                    function(event, **kwargs)
-                else:
-                    function(**kwargs)
-            return correct_type
+        if pass_event:
 
+            @wraps(function)
+            def wrapper(event, **kwargs):
+                function(event, **kwargs)
+
+        else:
+
+            @wraps(function)
+            def wrapper(event, **kwargs):
+                function(**kwargs)
+
+        wrapper.event_type = type
+        wrapper.policy = policy
         return wrapper
 
     return decorator
@@ -49,6 +76,9 @@ class EventManager(metaclass=SingletonType):
     Additionally, as a singleton class, it can be invoked anywhere in the code to
     create event handlers.
 
+    Handlers are stored in a table indexed by the event type they listen to, so
+    dispatching an event only touches the handlers interested in it.
+
     Attributes
     ----------
         events : list[pygame.event.Event]
@@ -57,12 +87,15 @@ class EventManager(metaclass=SingletonType):
 
     def __init__(self, window) -> None:
         self._window = window
-        self._handlers: dict[str, Callable] = {}
+        self._handlers: dict[int, dict[int, tuple[HandlerPolicy, Callable]]] = {}
+        self._id_to_type: dict[int, int] = {}
         self._id_count = count()
         self._id_to_remove: deque[int] = deque()
         self.events: list[pg.event.Event] = []
 
-    def add_new_handler(self, func, type, pass_event=False, **kwargs):
+    def add_new_handler(
+        self, func, type, pass_event=False, policy=HandlerPolicy.ONCE, **kwargs
+    ):
         """
         Convert a function to a handler and add it.
 
@@ -75,6 +108,8 @@ class EventManager(metaclass=SingletonType):
             pass_event : bool, default False
                 Whether to pass the event to the function, when the event it
                 was listening to is found, as the function's first parameter.
+            policy : HandlerPolicy, default HandlerPolicy.ONCE
+                How often the function is called in a frame.
 
         Additional keyword-arguments can be passed, which will be passed to the
         function.
@@ -84,10 +119,10 @@ class EventManager(metaclass=SingletonType):
             int
                 The id of the event handler, which can be used to remove it.
         """
-        handler = event_handler(type, pass_event)(func)
+        handler = event_handler(type, pass_event, policy)(func)
         return self.add_handler(handler, **kwargs)
 
-    def add_handler(self, handlers, **kwargs):
+    def add_handler(self, handler, **kwargs):
         """
         Add a event handler to be used.
 
@@ -105,7 +140,12 @@ class EventManager(metaclass=SingletonType):
                 The id of the event handler, which can be used to remove it.
         """
         id = next(self._id_count)
-        self._handlers[id] = partial(handlers, **kwargs)
+        type = handler.event_type
+        self._handlers.setdefault(type, {})[id] = (
+            handler.policy,
+            partial(handler, **kwargs),
+        )
+        self._id_to_type[id] = type
         return id
 
     def remove_handler(self, id):
@@ -127,18 +167,37 @@ class EventManager(metaclass=SingletonType):
         """
         self.events = pg.event.get()
 
-        # Create a clone of the collection of handlers.
-        handlers = self._handlers.values()
+        table = self._handlers
+        called: set[int] = set()
+        latest: dict[int, tuple[Callable, pg.event.Event]] = {}
+        # Handlers may add handlers, which are called from the next frame on,
+        # so the handlers of each type are copied once before dispatching.
+        snapshots: dict[int, tuple] = {}
 
         for event in self.events:
-            # Filter handlers that return True i.e. they have found the event
-            # they were listening to.
-            handlers = [handler for handler in handlers if not handler(event)]
-
-        # Check if queue is not empty.
-        if self._id_to_remove:
-            # Remove any events to be removed.
-            for id in self._id_to_remove:
-                # by iterating through the queue, the elements in the queue are
-                # also removed.
-                del self._handlers[id]
+            handlers = snapshots.get(event.type)
+            if handlers is None:
+                handlers = snapshots[event.type] = tuple(
+                    table.get(event.type, {}).items()
+                )
+            if not handlers:
+                continue
+
+            for id, (policy, handler) in handlers:
+                if policy is HandlerPolicy.EVERY:
+                    handler(event)
+                elif policy is HandlerPolicy.LATEST:
+                    latest[id] = (handler, event)
+                elif id not in called:
+                    called.add(id)
+                    handler(event)
+
+        for handler, event in latest.values():
+            handler(event)
+
+        # Remove any handlers to be removed.
+        while self._id_to_remove:
+            id = self._id_to_remove.popleft()
+            type = self._id_to_type.pop(id, None)
+            if type is not None:
+                del self._handlers[type][id]
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from itertools import count
+from typing import TYPE_CHECKING
+
+import pygame as pg
+
+from core.api._singletontype import SingletonType
+from core.api.eventmanager import EventManager, HandlerPolicy
+
+if TYPE_CHECKING:
+    # Avoid non-actual recursive imports due to type hinting
+    from core.api.renderer import Renderer
+
+# The index is rebuilt after the layout handlers of the targets.
+_LAYOUT_ORDER = 100
+
+
+class InputRouter(metaclass=SingletonType):
+    """
+    This class routes the mouse to the interactive objects on the screen.
+
+    Instead of each object listening to the mouse events and testing it's own
+    rectangle, the rectangles of the objects are kept in a uniform grid. A
+    mouse event only tests the few objects in the cell under the mouse, and is
+    passed to the topmost of them, so the cost of an event does not grow with
+    the number of objects.
+
+    A target is an object with a `rect` attribute and the following methods:
+    - on_mouse_enter()       the mouse moved onto the target
+    - on_mouse_leave()       the mouse moved off the target
+    - on_mouse_down(event)   a mouse button was pressed on the target
+    - on_mouse_up(event)     a mouse button pressed on the target was released
+    - on_mouse_motion(event) the mouse moved, while pressed on the target
+
+    A target pressed by the mouse receives the motion and the release of the
+    button, even if the mouse left it meanwhile.
+
+    The index is rebuilt in the layout pass, after the targets have recomputed
+    their rectangles, see `Renderer.add_layout_handler`. Targets, whose
+    rectangle changes otherwise, have to be moved with `update`.
+
+    Additionally, as a singleton class, it can be invoked anywhere in the code to
+    add targets.
+
+    Attributes
+    ----------
+        cell_size : int
+            The width and height of a cell of the grid in pixels.
+
+        hovered : object | None
+            The target under the mouse.
+
+        pressed : object | None
+            The target a mouse button was pressed on.
+    """
+
+    def __init__(self, eventmanager: EventManager, renderer: Renderer, cell_size=64):
+        """
+        Initialize the router.
+        """
+        self.cell_size = cell_size
+        self.hovered = None
+        self.pressed = None
+
+        self._targets: dict[object, tuple[int, int]] = {}
+        self._target_cells: dict[object, list[tuple[int, int]]] = {}
+        self._cells: dict[tuple[int, int], list[object]] = {}
+        self._order = count()
+        self._mouse_pos: tuple[int, int] | None = None
+
+        eventmanager.add_new_handler(
+            self._on_down,
+            pg.MOUSEBUTTONDOWN,
+            pass_event=True,
+            policy=HandlerPolicy.EVERY,
+        )
+        eventmanager.add_new_handler(
+            self._on_up, pg.MOUSEBUTTONUP, pass_event=True, policy=HandlerPolicy.EVERY
+        )
+        # Only the latest position of the mouse matters for hovering.
+        eventmanager.add_new_handler(
+            self._on_motion,
+            pg.MOUSEMOTION,
+            pass_event=True,
+            policy=HandlerPolicy.LATEST,
+        )
+        eventmanager.add_new_handler(self._on_window_leave, pg.WINDOWLEAVE)
+        renderer.add_layout_handler(self.reindex, order=_LAYOUT_ORDER)
+
+    def add(self, target, z=0):
+        """
+        Add a target to be routed the mouse to.
+
+        Parameters
+        ----------
+            target : object
+                The target, see the description of this class.
+            z : int, default 0
+                The stacking order of the target. Of overlapping targets, the
+                one with the highest `z` is hit, and of the same `z` the one
+                added last.
+        """
+        self.remove(target)
+        self._targets[target] = (z, next(self._order))
+        self._insert(target)
+
+    def remove(self, target):
+        """
+        Remove a target. Nothing happens, if it was not added.
+
+        Parameters
+        ----------
+            target : object
+                The target to be removed.
+        """
+        if self._targets.pop(target, None) is None:
+            return
+
+        self._discard(target)
+        if self.hovered is target:
+            self.hovered = None
+        if self.pressed is target:
+            self.pressed = None
+
+    def update(self, target):
+        """
+        Move a target in the index after it's rectangle has changed.
+
+        Parameters
+        ----------
+            target : object
+                The target, which was added before.
+        """
+        self._discard(target)
+        self._insert(target)
+
+    def reindex(self):
+        """
+        Rebuild the index from the rectangles of all targets.
+        """
+        self._cells.clear()
+        self._target_cells.clear()
+        for target in self._targets:
+            self._insert(target)
+
+        # The target under the mouse may have changed.
+        if self._mouse_pos is not None:
+            self._hover(self.hit(self._mouse_pos))
+
+    def hit(self, pos):
+        """
+        Get the topmost target at a position.
+
+        Parameters
+        ----------
+            pos : tuple[int, int]
+                The position on the screen.
+
+        Returns
+        -------
+            object | None
+                The topmost target, or `None` if there is no target.
+        """
+        size = self.cell_size
+        cell = self._cells.get((pos[0] // size, pos[1] // size))
+        if cell is None:
+            return None
+
+        # The targets of a cell are sorted from the top.
+        for target in cell:
+            if target.rect.collidepoint(pos):
+                return target
+        return None
+
+    def _insert(self, target):
+        rect: pg.Rect = target.rect
+        if rect.w <= 0 or rect.h <= 0:
+            self._target_cells[target] = []
+            return
+
+        size = self.cell_size
+        cells = [
+            (x, y)
+            for x in range(rect.left // size, (rect.right - 1) // size + 1)
+            for y in range(rect.top // size, (rect.bottom - 1) // size + 1)
+        ]
+        for cell in cells:
+            targets = self._cells.setdefault(cell, [])
+            targets.append(target)
+            targets.sort(key=self._targets.__getitem__, reverse=True)
+        self._target_cells[target] = cells
+
+    def _discard(self, target):
+        for cell in self._target_cells.pop(target, ()):
+            targets = self._cells[cell]
+            targets.remove(target)
+            if not targets:
+                del self._cells[cell]
+
+    def _hover(self, target):
+        if target is self.hovered:
+            return
+
+        previous = self.hovered
+        self.hovered = target
+        if previous is not None:
+            previous.on_mouse_leave()
+        if target is not None:
+            target.on_mouse_enter()
+
+    def _on_motion(self, event):
+        self._mouse_pos = event.pos
+        self._hover(self.hit(event.pos))
+        if self.pressed is not None:
+            self.pressed.on_mouse_motion(event)
+
+    def _on_down(self, event):
+        self._mouse_pos = event.pos
+        target = self.hit(event.pos)
+        self._hover(target)
+        if target is not None:
+            if event.button == 1:
+                self.pressed = target
+            target.on_mouse_down(event)
+
+    def _on_up(self, event):
+        self._mouse_pos = event.pos
+        target = self.pressed if event.button == 1 else self.hit(event.pos)
+        if event.button == 1:
+            self.pressed = None
+        if target is not None:
+            target.on_mouse_up(event)
+
+    def _on_window_leave(self):
+        self._mouse_pos = None
+        self._hover(None)
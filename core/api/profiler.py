@@ -0,0 +1,232 @@
+import json
+from collections import deque
+from time import perf_counter
+from typing import Callable
+
+import numpy as np
+
+from core.api._singletontype import SingletonType
+
+
+def summarize(durations) -> dict[str, float]:
+    """
+    Summarize durations in seconds as milliseconds.
+
+    Parameters
+    ----------
+        durations : Iterable[float]
+            The durations in seconds.
+
+    Returns
+    -------
+        dict[str, float]
+            The `mean`, `p50`, `p90`, `p99` and `max` in milliseconds, or an
+            empty dictionary if there are no durations.
+    """
+    ms = np.fromiter(durations, np.float64) * 1000
+    if len(ms) == 0:
+        return {}
+    p50, p90, p99 = np.percentile(ms, (50, 90, 99))
+    return {
+        "mean": float(ms.mean()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "max": float(ms.max()),
+    }
+
+
+class Profiler(metaclass=SingletonType):
+    """
+    This class measures where the time of each frame is spent.
+
+    The main loop times it's phases, and the states time the updates and draws
+    of their objects. Each timed call is a span with a name and a category. The
+    spans of a frame are summed up by name, and the sums of the recent frames
+    are kept to compute rolling statistics. The spans of the recent frames are
+    also kept, to be exported as a trace.
+
+    The profiler is disabled by default, in which case each hook is a single
+    branch on `enabled`.
+
+    Additionally, as a singleton class, it can be invoked anywhere in the code.
+
+    Attributes
+    ----------
+        enabled : bool
+            Whether the frames are profiled.
+
+        window : int
+            The number of recent frames of the rolling statistics.
+
+        trace_frames : int
+            The number of recent frames kept for the trace. Changes apply once
+            the profiler is reset.
+
+        frames : int
+            The number of profiled frames.
+    """
+
+    def __init__(self, window=240, trace_frames=600):
+        """
+        Initialize this class.
+
+        Parameters
+        ----------
+            window : int, default 240
+                The number of recent frames of the rolling statistics.
+            trace_frames : int, default 600
+                The number of recent frames kept for the trace.
+        """
+        self.enabled = False
+        self.window = window
+        self.trace_frames = trace_frames
+        self.frames = 0
+
+        self._origin = perf_counter()
+        self._frame_start = 0.0
+        self._spans: list[tuple[str, str, float, float]] = []
+        self._totals: dict[str, deque[float]] = {}
+        self._trace: deque[list] = deque(maxlen=trace_frames)
+        self._frame_handlers: list[Callable] = []
+
+    def reset(self):
+        """
+        Discard the statistics and the trace.
+        """
+        self.frames = 0
+        self._spans = []
+        self._totals.clear()
+        self._trace = deque(maxlen=self.trace_frames)
+
+    def call(self, name: str, category: str, function: Callable, *args):
+        """
+        Call a function and time it as a span of the current frame.
+
+        Parameters
+        ----------
+            name : str
+                The name of the span, by which the statistics are kept.
+            category : str
+                The category of the span, e.g. "phase" or "object".
+            function : Callable
+                The function to call.
+
+        Additional positional arguments are passed to the function.
+
+        Returns
+        -------
+            Any
+                The return value of the function.
+        """
+        start = perf_counter()
+        result = function(*args)
+        self._spans.append((name, category, start, perf_counter() - start))
+        return result
+
+    def begin_frame(self):
+        """
+        Begin a frame, which is called by the main loop.
+        """
+        self._frame_start = perf_counter()
+        self._spans = []
+
+    def end_frame(self):
+        """
+        End a frame, which is called by the main loop. The sums of the frame's
+        spans by their name are passed to the frame handlers.
+        """
+        start = self._frame_start
+        spans = self._spans
+        spans.append(("frame", "frame", start, perf_counter() - start))
+
+        totals: dict[str, float] = {}
+        for name, _, _, duration in spans:
+            totals[name] = totals.get(name, 0.0) + duration
+
+        for name, total in totals.items():
+            samples = self._totals.get(name)
+            if samples is None:
+                samples = self._totals[name] = deque(maxlen=self.window)
+            samples.append(total)
+
+        self._trace.append(spans)
+        self.frames += 1
+
+        # Handlers may remove themselves.
+        for handler in tuple(self._frame_handlers):
+            handler(totals)
+
+    def add_frame_handler(self, handler: Callable[[dict[str, float]], None]):
+        """
+        Add a function to be called at the end of each profiled frame.
+
+        Parameters
+        ----------
+            handler : Callable[[dict[str, float]], None]
+                The function, which is passed the time spent in each span of the
+                frame in seconds by it's name. The whole frame is named "frame".
+        """
+        self._frame_handlers.append(handler)
+
+    def remove_frame_handler(self, handler: Callable[[dict[str, float]], None]):
+        """
+        Remove a function added by `add_frame_handler`.
+        """
+        self._frame_handlers.remove(handler)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Get the rolling statistics of the time spent in each span per frame.
+
+        Returns
+        -------
+            dict[str, dict[str, float]]
+                The summary of each span by it's name, see `summarize`, along
+                with the number of recent frames it occurred in as `frames`.
+        """
+        return {
+            name: {"frames": len(samples), **summarize(samples)}
+            for name, samples in self._totals.items()
+        }
+
+    def export_trace(self, path):
+        """
+        Write the spans of the recent frames in the Chrome trace event format,
+        which can be opened in `chrome://tracing` or Perfetto.
+
+        Parameters
+        ----------
+            path : str
+                The path of the JSON file.
+        """
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 0,
+                "tid": 0,
+                "args": {"name": "main loop"},
+            }
+        ]
+        for spans in self._trace:
+            for name, category, start, duration in spans:
+                events.append(
+                    {
+                        "name": name,
+                        "cat": category,
+                        "ph": "X",
+                        "ts": (start - self._origin) * 1e6,  # in microseconds
+                        "dur": duration * 1e6,
+                        "pid": 0,
+                        "tid": 0,
+                    }
+                )
+
+        trace = {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"frames": self.frames, "stats": self.stats()},
+        }
+        with open(path, "w") as f:
+            json.dump(trace, f)
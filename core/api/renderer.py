@@ -1,25 +1,66 @@
 from __future__ import annotations
 
 from functools import partial
+from itertools import count
 from typing import TYPE_CHECKING, Callable
 
 import numpy as np
 import pygame as pg
 
+from core.api._commandbuffer import (
+    BLIT,
+    CIRCLE,
+    FILL,
+    LINE,
+    LINES,
+    RECT,
+    CommandBuffer,
+)
 from core.api._singletontype import SingletonType
+from core.api.eventmanager import EventManager, HandlerPolicy
 
 if TYPE_CHECKING:
     # Avoid non-actual recursive imports due to type hinting
-    from core.api.eventmanager import EventManager
     from core.api.windowextended import WindowExtended
 
 
+_NO_RADIUS = (-1, -1, -1, -1)
+_NO_AREA = (0, 0, 0, 0)
+
+
+def _pack_color(color) -> int:
+    """
+    Pack a color as an integer of the form `0xRRGGBBAA`.
+    """
+    if not isinstance(color, pg.Color):
+        color = pg.Color(color)
+    return int(color)
+
+
+def _pack_colors(colors):
+    """
+    Pack a color, or pass through an array of packed colors.
+    """
+    if isinstance(colors, np.ndarray):
+        return colors
+    return _pack_color(colors)
+
+
 class Renderer(metaclass=SingletonType):
     """
     This class provides a centralised way of managing drawing tasks.
 
     It draws elements to the screen by the order of their layer index.
 
+    The draw calls are queued as commands in preallocated arrays, which are
+    reused between frames. The commands of a frame are retained, and in the
+    next frame only the regions where the commands differ are cleared, redrawn
+    and updated on the display. Static scenes therefore cost no drawing at all.
+
+    When the window is resized, the drawable area and everything depending on
+    it's size is recomputed in a single layout pass, see `add_layout_handler`.
+    A burst of resize events is coalesced into one pass with the latest size.
+
     Additionally, as a singleton class, it can be invoked anywhere in the code to
     draw things to the screen.
 
@@ -32,8 +73,15 @@ class Renderer(metaclass=SingletonType):
             The number of layers to use. Drawable layers are in the range
             between `0` and `layer_count` with the latter not included.
 
+        max_dirty_rects : int
+            The maximum number of regions to update separately in a frame. If
+            more regions have changed, their union is updated instead.
+
         outside_color : pygame.Color
             The color outside the drawable area.
+
+        presented : bool
+            Whether anything was redrawn in the last frame.
     """
 
     def __init__(self, window: WindowExtended, eventmanager: EventManager):
@@ -47,7 +95,17 @@ class Renderer(metaclass=SingletonType):
         self.bg_color = pg.Color(225, 225, 225)
 
         self.layer_count = 5
-        self._layers: list[list[Callable]] = [[] for _ in range(self.layer_count)]
+
+        # Retained mode related things:
+        self.max_dirty_rects = 32
+        self._queue = CommandBuffer()
+        self._scene = CommandBuffer()
+        self._prev_scene = CommandBuffer()
+        self._colors: dict[int, pg.Color] = {}
+        self._scene_bg_color = pg.Color(self.bg_color)
+        self._forced: list[pg.Rect] = []
+        self._invalid = True
+        self.presented = False
 
         # Resize related things:
         self._w_to_h_ratio = self.screen_size[0] / self.screen_size[1]
@@ -58,62 +116,514 @@ class Renderer(metaclass=SingletonType):
         self.dsize = np.array(self.screen_size)
         self.dpos = np.array((0, 0))
 
-        def on_resize(renderer: Renderer, window):
-            win_size = window.size
-            new_size = (renderer._w_to_h_ratio * win_size[1], win_size[1])
+        # The layout pass is run at most once a frame with the latest size.
+        self._layout_handlers: dict[int, tuple[int, Callable]] = {}
+        self._layout_order: list[Callable] | None = None
+        self._layout_ids = count()
+        eventmanager.add_new_handler(
+            self.layout, type=pg.VIDEORESIZE, policy=HandlerPolicy.LATEST
+        )
 
-            # Prevent rectangle width from being larger than screen width.
-            if new_size[0] > win_size[0]:
-                window.size = new_size
-                win_size = new_size
+    def _resize(self):
+        """
+        Fit the drawable area into the window.
+        """
+        window = self._window
+        win_w, win_h = window.size
+        new_size = (round(self._w_to_h_ratio * win_h), win_h)
+
+        # Prevent rectangle width from being larger than screen width. The mode
+        # is only set, when the size of the window actually has to change.
+        if new_size[0] > win_w:
+            window.size = new_size
+            win_w = new_size[0]
+
+        new_pos = ((win_w - new_size[0]) // 2, 0)
+        new_rect = pg.Rect(new_pos, new_size)
+        left_outer_area = ((0, 0), new_rect.bottomleft)
+        right_outer_area = (new_rect.topright, (win_w, win_h))
+
+        self.drect = new_rect
+        self.dsize = np.array(new_size)
+        self.dpos = np.array(new_pos)
+        self._h_scale = win_h / self._org_h
+        self._invalid = True
+
+        for area in (left_outer_area, right_outer_area):
+            self.screen.fill(self.outside_color, area)
+        self._present((left_outer_area, right_outer_area))
+
+    def layout(self):
+        """
+        Fit the drawable area into the window, and call the layout handlers by
+        their order.
 
-            new_pos = ((win_size[0] - new_size[0]) / 2, 0)
-            new_rect = pg.Rect(new_pos, new_size)
-            new_h_scale = win_size[1] / renderer._org_h
-            left_outer_area = ((0, 0), new_rect.bottomleft)
-            right_outer_area = (new_rect.topright, win_size)
+        This is done once in a frame, in which the window was resized, after
+        all other events have been handled.
+        """
+        self._resize()
 
-            renderer.drect = new_rect
-            renderer.dsize = np.array(new_size)
-            renderer.dpos = np.array(new_pos)
-            renderer._h_scale = new_h_scale
+        if self._layout_order is None:
+            handlers = sorted(self._layout_handlers.values(), key=lambda h: h[0])
+            self._layout_order = [handler for _, handler in handlers]
 
-            pg.display.update((left_outer_area, right_outer_area))
+        # Handlers may add or remove handlers.
+        for handler in tuple(self._layout_order):
+            handler()
 
-        eventmanager.add_new_handler(
-            on_resize, type=pg.VIDEORESIZE, renderer=self, window=window
-        )
+    def add_layout_handler(self, func, order=0, **kwargs):
+        """
+        Add a function to be called in the layout pass, which recomputes what
+        depends on the size of the drawable area.
+
+        Parameters
+        ----------
+            func : Callable
+                The function to call.
+            order : int, default 0
+                The position of the function in the layout pass. Functions of
+                a lower order are called first, functions of the same order in
+                the order they were added.
+
+        Additional keyword-arguments can be passed, which will be passed to the
+        function.
+
+        Returns
+        -------
+            int
+                The id of the layout handler, which can be used to remove it.
+        """
+        id = next(self._layout_ids)
+        self._layout_handlers[id] = (order, partial(func, **kwargs))
+        self._layout_order = None
+        return id
+
+    def remove_layout_handler(self, id):
+        """
+        Remove a layout handler by it's id.
 
-        self._on_resize = on_resize
+        Parameters
+        ----------
+            id : int
+                The id of the layout handler to be removed.
+        """
+        if self._layout_handlers.pop(id, None) is not None:
+            self._layout_order = None
 
     def _update(self):
-        self.screen.fill(self.bg_color, self.drect)
+        """
+        Present the commands queued in this frame.
+
+        The commands are compared to the ones presented in the previous frame,
+        and only the regions covered by commands that changed are cleared,
+        redrawn and updated on the display.
+        """
+        queue = self._queue
+        order = np.argsort(queue.layer[: queue.count], kind="stable")
 
-        for layer in self._layers:
-            for draw_callback in layer:
-                draw_callback()
+        # Reuse the buffer of the previous scene for the new scene.
+        old, new = self._scene, self._prev_scene
+        new.take(queue, order)
+        queue.clear()
+        self._scene, self._prev_scene = new, old
 
-        pg.display.update(self.drect)
+        if self.bg_color != self._scene_bg_color:
+            self._scene_bg_color = pg.Color(self.bg_color)
+            self._invalid = True
 
-        self._layers = [[] for _ in range(self.layer_count)]
+        if self._invalid:
+            dirty = [self.drect]
+        else:
+            dirty = self._get_dirty_rects(old, new)
 
-    def draw_surface(self, layer_id, surface, pos):
-        def blit_callback(renderer):
-            renderer.screen.blit(surface, pos)
+        self._invalid = False
+        self._forced.clear()
 
-        self._layers[layer_id].append(partial(blit_callback, self))
+        self.presented = bool(dirty)
+        if dirty:
+            self._redraw(new, dirty)
+            self._present(dirty)
 
-    def draw_color(self, layer_id, color, rect):
-        def fill_callback(renderer):
-            renderer.screen.fill(color, rect)
+    def _present(self, rects):
+        """
+        Update regions of the display. Nothing is updated in headless mode, as
+        there is no real display.
+        """
+        if not self._window.headless:
+            pg.display.update(rects)
+
+    def _get_dirty_rects(self, old: CommandBuffer, new: CommandBuffer):
+        """
+        Get the regions of the drawable area that differ between two scenes.
+        """
+        m = min(old.count, new.count)
+
+        moved = (old.bounds[:m] != new.bounds[:m]).any(1)
+        changed = (
+            moved
+            | (old.op[:m] != new.op[:m])
+            | (old.color[:m] != new.color[:m])
+            | (old.coords[:m] != new.coords[:m]).any(1)
+            | (old.width[:m] != new.width[:m])
+            | (old.radius[:m] != new.radius[:m]).any(1)
+            | (old.alpha[:m] != new.alpha[:m])
+            | (old.area[:m] != new.area[:m]).any(1)
+        )
+        # Surfaces and points are compared by identity, not by content.
+        with_objects = (new.op[:m] == BLIT) | (new.op[:m] == LINES)
+        for i in np.flatnonzero(with_objects).tolist():
+            if old.objects[i] is not new.objects[i]:
+                changed[i] = True
+
+        bounds = np.concatenate(
+            (
+                old.bounds[:m][changed],
+                new.bounds[:m][moved],
+                old.bounds[m : old.count],
+                new.bounds[m : new.count],
+            )
+        )
+
+        rects = [r.clip(self.drect) for r in self._forced]
+        rects += [self.drect.clip(b) for b in bounds.tolist()]
+        rects = [r for r in rects if r.w > 0 and r.h > 0]
+
+        # Many small regions cost more to present than a single larger one.
+        # They are merged before growing them, which is quadratic in the
+        # number of regions.
+        if len(rects) > self.max_dirty_rects:
+            rects = [rects[0].unionall(rects[1:])]
+
+        rects = self._grow_to_lines(new, rects)
+        if len(rects) > self.max_dirty_rects:
+            rects = [rects[0].unionall(rects[1:])]
 
-        self._layers[layer_id].append(partial(fill_callback, self))
+        return rects
+
+    def _grow_to_lines(self, scene: CommandBuffer, rects):
+        """
+        Grow the regions to contain the lines they overlap, and merge the
+        regions that overlap afterwards.
+
+        Pygame rasterizes a line differently when it is clipped, so redrawing a
+        part of a line would not match the pixels drawn before. As the merged
+        regions do not overlap, each line is also drawn at most once.
+        """
+        n = scene.count
+        op = scene.op[:n]
+        lines = scene.bounds[:n][(op == LINE) | (op == LINES)].tolist()
+        if not lines:
+            return rects
+
+        grown: list[pg.Rect] = []
+        for rect in rects:
+            while True:
+                union = rect.unionall([lines[i] for i in rect.collidelistall(lines)])
+                i = union.collidelist(grown)
+                while i >= 0:
+                    union.union_ip(grown.pop(i))
+                    i = union.collidelist(grown)
+                union = union.clip(self.drect)
+                if union == rect:
+                    break
+                rect = union
+            grown.append(rect)
+        return grown
+
+    def _redraw(self, scene: CommandBuffer, dirty):
+        """
+        Clear and redraw the commands in the scene overlapping the dirty regions.
+        """
+        screen = self.screen
+        n = scene.count
+
+        x0, y0, w, h = scene.bounds[:n].T
+        x1, y1 = x0 + w, y0 + h
+
+        commands = (
+            scene.op[:n].tolist(),
+            scene.color[:n].tolist(),
+            scene.coords[:n].tolist(),
+            scene.width[:n].tolist(),
+            scene.radius[:n].tolist(),
+            scene.alpha[:n].tolist(),
+            scene.area[:n].tolist(),
+            scene.objects,
+        )
+
+        for rect in dirty:
+            screen.set_clip(rect)
+            screen.fill(self.bg_color, rect)
+
+            hits = (x0 < rect.right) & (x1 > rect.left)
+            hits &= (y0 < rect.bottom) & (y1 > rect.top)
+            self._execute(screen, commands, np.flatnonzero(hits).tolist())
+
+        screen.set_clip(None)
+
+    def _execute(self, screen: pg.Surface, commands, indices: list[int]):
+        """
+        Execute the commands at the given indices in one loop.
+
+        Consecutive lines of the same color and width, that are connected, are
+        drawn as a single polyline, and consecutive surfaces are blitted in a
+        single batch.
+        """
+        ops, colors, coords, widths, radii, alphas, areas, objects = commands
+        color_of = self._color_of
+
+        i = 0
+        k = len(indices)
+        while i < k:
+            c = indices[i]
+            op = ops[c]
+            j = i + 1
+
+            if op == LINE:
+                x1, y1, x2, y2 = coords[c]
+                points = [(x1, y1), (x2, y2)]
+                while j < k:
+                    d = indices[j]
+                    if ops[d] != LINE or colors[d] != colors[c]:
+                        break
+                    x1, y1, x2, y2 = coords[d]
+                    if widths[d] != widths[c] or (x1, y1) != points[-1]:
+                        break
+                    points.append((x2, y2))
+                    j += 1
+
+                closed = len(points) > 3 and points[0] == points[-1]
+                if closed:
+                    points.pop()
+                pg.draw.lines(screen, color_of(colors[c]), closed, points, widths[c])
+
+            elif op == BLIT:
+                surface = objects[c]
+                alpha = alphas[c]
+                own_alpha = surface.get_alpha()
+                if alpha >= 0 and alpha != own_alpha:
+                    surface.set_alpha(alpha)
+                    screen.blit(surface, coords[c][:2], areas[c])
+                    surface.set_alpha(own_alpha)
+                    i = j
+                    continue
+
+                blits = [(surface, coords[c][:2], areas[c])]
+                while j < k and ops[indices[j]] == BLIT:
+                    d = indices[j]
+                    if alphas[d] >= 0 and alphas[d] != objects[d].get_alpha():
+                        break
+                    blits.append((objects[d], coords[d][:2], areas[d]))
+                    j += 1
+                screen.blits(blits, doreturn=False)
+
+            elif op == LINES:
+                closed = coords[c][0]
+                pg.draw.lines(
+                    screen, color_of(colors[c]), closed, objects[c], widths[c]
+                )
+
+            elif op == CIRCLE:
+                x, y, r, _ = coords[c]
+                pg.draw.circle(screen, color_of(colors[c]), (x, y), r, widths[c])
+
+            elif op == FILL:
+                screen.fill(color_of(colors[c]), coords[c])
+
+            elif op == RECT:
+                r = radii[c]
+                if r[0] >= 0:
+                    pg.draw.rect(
+                        screen,
+                        color_of(colors[c]),
+                        coords[c],
+                        border_top_left_radius=r[0],
+                        border_top_right_radius=r[1],
+                        border_bottom_left_radius=r[2],
+                        border_bottom_right_radius=r[3],
+                    )
+                else:
+                    pg.draw.rect(screen, color_of(colors[c]), coords[c])
+
+            i = j
+
+    def _color_of(self, packed: int) -> pg.Color:
+        """
+        Get the color of a packed color.
+        """
+        color = self._colors.get(packed)
+        if color is None:
+            color = self._colors[packed] = pg.Color(packed)
+        return color
+
+    def invalidate(self, rect=None):
+        """
+        Force a region of the drawable area to be redrawn in the next frame.
+
+        This is needed when the content of a surface, that was drawn in the
+        previous frame, is changed in place.
+
+        Parameters
+        ----------
+            rect : pygame.Rect | None, default None
+                The region to redraw. The whole drawable area is redrawn if
+                `None` is given.
+        """
+        if rect is None:
+            self._invalid = True
+        else:
+            self._forced.append(pg.Rect(rect))
+
+    def draw_surface(self, layer_id, surface, pos, alpha=None, area=None):
+        """
+        Draw a surface.
+
+        Parameters
+        ----------
+            layer_id : int
+                The layer to draw the surface in.
+            surface : pygame.Surface
+                The surface to draw.
+            pos : ArrayLike
+                The position of the top left corner of the surface.
+            alpha : int | None, default None
+                The alpha value to draw the surface with. The surface's own
+                alpha value is used if `None` is given. As the surface itself
+                is not modified, this can be used for shared surfaces.
+            area : pygame.Rect | None, default None
+                The area of the surface to draw. The whole surface is drawn if
+                `None` is given.
+        """
+        x, y = int(pos[0]), int(pos[1])
+        if area is None:
+            area = surface.get_rect()
+        else:
+            area = pg.Rect(area).clip(surface.get_rect())
+        if alpha is None:
+            alpha = surface.get_alpha()
+        self._queue.push(
+            BLIT,
+            layer_id % self.layer_count,
+            0,
+            (x, y, 0, 0),
+            0,
+            _NO_RADIUS,
+            -1 if alpha is None else max(0, min(255, int(alpha))),
+            area,
+            surface,
+            (x, y, area.w, area.h),
+        )
+
+    def draw_color(self, layer_id, color, rect):
+        rect = pg.Rect(rect)
+        self._queue.push(
+            FILL,
+            layer_id % self.layer_count,
+            _pack_color(color),
+            rect,
+            0,
+            _NO_RADIUS,
+            -1,
+            _NO_AREA,
+            None,
+            rect,
+        )
 
     def draw_line(self, layer_id, color, start_pos, end_pos, width=1):
-        def line_callback(renderer):
-            pg.draw.line(renderer.screen, color, start_pos, end_pos, width)
+        x1, y1 = int(start_pos[0]), int(start_pos[1])
+        x2, y2 = int(end_pos[0]), int(end_pos[1])
+        self._queue.push(
+            LINE,
+            layer_id % self.layer_count,
+            _pack_color(color),
+            (x1, y1, x2, y2),
+            width,
+            _NO_RADIUS,
+            -1,
+            _NO_AREA,
+            None,
+            (
+                min(x1, x2) - width,
+                min(y1, y2) - width,
+                abs(x2 - x1) + 2 * width + 1,
+                abs(y2 - y1) + 2 * width + 1,
+            ),
+        )
 
-        self._layers[layer_id].append(partial(line_callback, self))
+    def draw_lines(self, layer_id, color, points, width=1, closed=False):
+        """
+        Draw connected lines.
+
+        Parameters
+        ----------
+            layer_id : int
+                The layer to draw the lines in.
+            color : pygame.Color
+                The color of the lines.
+            points : ArrayLike
+                The points to connect with shape `(n, 2)`, where `n >= 2`.
+            width : int, default 1
+                The width of the lines.
+            closed : bool, default False
+                Whether to connect the last point to the first point.
+
+        Notes
+        -----
+            The points are compared by identity between frames, so they should
+            be reused while they are unchanged, and replaced rather than
+            modified in place when they change.
+        """
+        array = np.asarray(points)
+        x1, y1 = array.min(axis=0).tolist()
+        x2, y2 = array.max(axis=0).tolist()
+        self._queue.push(
+            LINES,
+            layer_id % self.layer_count,
+            _pack_color(color),
+            (int(closed), 0, 0, 0),
+            width,
+            _NO_RADIUS,
+            -1,
+            _NO_AREA,
+            points,
+            (
+                int(x1) - width,
+                int(y1) - width,
+                int(x2 - x1) + 2 * width + 2,
+                int(y2 - y1) + 2 * width + 2,
+            ),
+        )
+
+    def draw_circle(self, layer_id, color, center, radius, width=0):
+        """
+        Draw a circle.
+
+        Parameters
+        ----------
+            layer_id : int
+                The layer to draw the circle in.
+            color : pygame.Color
+                The color of the circle.
+            center : ArrayLike
+                The center of the circle.
+            radius : int
+                The radius of the circle.
+            width : int, default 0
+                The width of the outline. The circle is filled if `0` is given.
+        """
+        x, y, r = int(center[0]), int(center[1]), int(radius)
+        self._queue.push(
+            CIRCLE,
+            layer_id % self.layer_count,
+            _pack_color(color),
+            (x, y, r, 0),
+            width,
+            _NO_RADIUS,
+            -1,
+            _NO_AREA,
+            None,
+            (x - r, y - r, 2 * r + 1, 2 * r + 1),
+        )
 
     def draw_rect(
         self,
@@ -122,19 +632,159 @@ class Renderer(metaclass=SingletonType):
         rect,
         border_radius: tuple[int, int, int, int] | None = None,
     ):
-        def line_callback(renderer: Renderer):
-            if border_radius:
-                kwargs = {
-                    "border_top_left_radius": border_radius[0],
-                    "border_top_right_radius": border_radius[1],
-                    "border_bottom_left_radius": border_radius[2],
-                    "border_bottom_right_radius": border_radius[3],
-                }
-            else:
-                kwargs = {}
-            pg.draw.rect(renderer.screen, color, rect, **kwargs)
-
-        self._layers[layer_id].append(partial(line_callback, self))
+        rect = pg.Rect(rect)
+        self._queue.push(
+            RECT,
+            layer_id % self.layer_count,
+            _pack_color(color),
+            rect,
+            0,
+            border_radius or _NO_RADIUS,
+            -1,
+            _NO_AREA,
+            None,
+            rect,
+        )
+
+    def draw_rects(self, layer_id, colors, rects):
+        """
+        Draw many rectangles at once, e.g. the entities of a `ComponentStore`.
+
+        Parameters
+        ----------
+            layer_id : int
+                The layer to draw the rectangles in.
+            colors : pygame.Color | numpy.ndarray
+                The color of all rectangles, or the color of each rectangle
+                packed as `0xRRGGBBAA`.
+            rects : ArrayLike
+                The rectangles `(x, y, w, h)` with shape `(n, 4)`.
+        """
+        rects = np.asarray(rects).astype(np.int32).reshape(-1, 4)
+        n = len(rects)
+        if n == 0:
+            return
+
+        self._queue.extend(
+            n,
+            RECT,
+            layer_id % self.layer_count,
+            _pack_colors(colors),
+            rects,
+            0,
+            _NO_RADIUS,
+            -1,
+            _NO_AREA,
+            None,
+            rects,
+        )
+
+    def draw_circles(self, layer_id, colors, centers, radii, width=0):
+        """
+        Draw many circles at once, e.g. the entities of a `ComponentStore`.
+
+        Parameters
+        ----------
+            layer_id : int
+                The layer to draw the circles in.
+            colors : pygame.Color | numpy.ndarray
+                The color of all circles, or the color of each circle packed
+                as `0xRRGGBBAA`.
+            centers : ArrayLike
+                The centers of the circles with shape `(n, 2)`.
+            radii : int | ArrayLike
+                The radius of all circles, or the radius of each circle.
+            width : int, default 0
+                The width of the outlines. The circles are filled if `0` is
+                given.
+        """
+        centers = np.asarray(centers).astype(np.int32).reshape(-1, 2)
+        n = len(centers)
+        if n == 0:
+            return
+
+        radii = np.broadcast_to(np.asarray(radii, np.int32), (n,))
+        coords = np.zeros((n, 4), np.int32)
+        coords[:, :2] = centers
+        coords[:, 2] = radii
+        bounds = np.empty((n, 4), np.int32)
+        bounds[:, :2] = centers - radii[:, None]
+        bounds[:, 2] = bounds[:, 3] = 2 * radii + 1
+
+        self._queue.extend(
+            n,
+            CIRCLE,
+            layer_id % self.layer_count,
+            _pack_colors(colors),
+            coords,
+            width,
+            _NO_RADIUS,
+            -1,
+            _NO_AREA,
+            None,
+            bounds,
+        )
+
+    def draw_surfaces(self, layer_id, surfaces, positions, ids=None):
+        """
+        Draw many surfaces at once, e.g. the sprites of the entities of a
+        `ComponentStore`.
+
+        Parameters
+        ----------
+            layer_id : int
+                The layer to draw the surfaces in.
+            surfaces : Sequence[pygame.Surface]
+                The surfaces to draw, or the sprite sheet `ids` index into.
+            positions : ArrayLike
+                The positions of the top left corners with shape `(n, 2)`.
+            ids : ArrayLike | None, default None
+                The index of the surface in `surfaces` of each position. The
+                surfaces are drawn at the positions in order if `None` is given.
+        """
+        positions = np.asarray(positions).astype(np.int32).reshape(-1, 2)
+        n = len(positions)
+        if n == 0:
+            return
+
+        sizes = np.array([s.get_size() for s in surfaces], np.int32).reshape(-1, 2)
+        alphas = [s.get_alpha() for s in surfaces]
+        alphas = np.array([-1 if a is None else a for a in alphas], np.int16)
+        if ids is None:
+            objs = list(surfaces)
+        else:
+            ids = np.asarray(ids)
+            objs = [surfaces[i] for i in ids.tolist()]
+            sizes = sizes[ids]
+            alphas = alphas[ids]
+
+        coords = np.zeros((n, 4), np.int32)
+        coords[:, :2] = positions
+        area = np.zeros((n, 4), np.int32)
+        area[:, 2:] = sizes
+        bounds = np.concatenate((positions, sizes), axis=1)
+
+        self._queue.extend(
+            n,
+            BLIT,
+            layer_id % self.layer_count,
+            0,
+            coords,
+            0,
+            _NO_RADIUS,
+            alphas,
+            area,
+            objs,
+            bounds,
+        )
+
+    @property
+    def interpolation(self) -> float:
+        """
+        How far the current frame is between the last and the next simulation
+        tick. See `WindowExtended.alpha`.
+        """
+        return self._window.alpha
 
     @property
     def screen(self):
@@ -2,17 +2,32 @@ import functools
 import os
 
 import pygame as pg
-import win32con as w32c
-import win32gui as w32g
 
 
 class Win32Methods:
     """
     This class uses Win32 API to extend the pygame window's functionality.
+
+    The Win32 modules are imported, when they are first used, so this module
+    can be imported on other platforms.
     """
 
     supported = os.name == "nt"
 
+    @staticmethod
+    @functools.lru_cache
+    def _get_modules():
+        """
+        Returns
+        -------
+            tuple[module, module]
+                The `win32con` and `win32gui` modules.
+        """
+        import win32con
+        import win32gui
+
+        return win32con, win32gui
+
     @staticmethod
     @functools.lru_cache
     def get_hwnd():
@@ -32,6 +47,7 @@ class Win32Methods:
             bool
                 Whether the window is minimized.
         """
+        w32c, w32g = cls._get_modules()
         hWnd = cls.get_hwnd()
         return w32g.GetWindowPlacement(hWnd)[1] == w32c.SW_SHOWMINIMIZED
 
@@ -43,6 +59,7 @@ class Win32Methods:
             bool
                 Whether the window is minimized.
         """
+        w32c, w32g = cls._get_modules()
         hWnd = cls.get_hwnd()
         return w32g.GetWindowPlacement(hWnd)[1] == w32c.SW_SHOWMAXIMIZED
 
@@ -51,6 +68,7 @@ class Win32Methods:
         """
         Maximize the window.
         """
+        w32c, w32g = cls._get_modules()
         hWnd = cls.get_hwnd()
         w32g.ShowWindow(hWnd, w32c.SW_MAXIMIZE)
 
@@ -59,6 +77,7 @@ class Win32Methods:
         """
         Minimize the window.
         """
+        w32c, w32g = cls._get_modules()
         hWnd = cls.get_hwnd()
         w32g.ShowWindow(hWnd, w32c.SW_MINIMIZE)
 
@@ -67,5 +86,6 @@ class Win32Methods:
         """
         Restore the state of the window after it was maximized or minimized.
         """
+        w32c, w32g = cls._get_modules()
         hWnd = cls.get_hwnd()
         w32g.ShowWindow(hWnd, w32c.SW_RESTORE)
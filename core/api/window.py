@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 import numpy.typing as npt
 import pygame as pg
@@ -11,7 +13,7 @@ class Window(metaclass=SingletonType):
 
     It stores the icon and flags internally, but otherwise uses pygame's own
     `display` module to set and get attributes.
-    
+
     Additionally, as a singleton class, it is only initialized once, so the
     flags and icon are saved until all references to this class are deleted.
 
@@ -29,6 +31,10 @@ class Window(metaclass=SingletonType):
         - pygame.SHOWN         window is opened in visible mode (default)
         - pygame.HIDDEN        window is opened in hidden mode
 
+        headless : bool
+            Whether the window is run without a real display, using SDL's dummy
+            video driver. The display surface then only exists in memory.
+
         icon : pygame.Surface
             The pygame Surface object used as the window's icon.
 
@@ -45,6 +51,7 @@ class Window(metaclass=SingletonType):
         icon: pg.Surface,
         size: tuple[int, int],
         flags: int,
+        headless: bool = False,
     ):
         """
         Initialize the window.
@@ -53,6 +60,8 @@ class Window(metaclass=SingletonType):
         ----------
             flags : int
                 The pygame flag to start the window with.
+            headless : bool, default False
+                Whether to run the window without a real display.
             icon : Surface
                 The pygame surface used as the window's icon.
             size : ArrayLike
@@ -60,6 +69,16 @@ class Window(metaclass=SingletonType):
             title : str
                 The title or caption of the window.
         """
+        self.headless = headless
+
+        if headless and not (
+            pg.display.get_init() and pg.display.get_driver() == "dummy"
+        ):
+            # The video driver can only be chosen when the display is initialized.
+            pg.display.quit()
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            pg.display.init()
+
         self.title = title
         self.icon = icon
         self._flags = flags  # store flags internally.
@@ -110,7 +129,9 @@ class Window(metaclass=SingletonType):
 
     @size.setter
     def size(self, value):
-        self._set_new_mode(size=value)
+        # Setting the mode is slow and emits another resize event.
+        if tuple(np.asarray(value, int)) != tuple(self.size):
+            self._set_new_mode(size=value)
 
     @property
     def title(self):
@@ -1,6 +1,10 @@
+import math
+
 import pygame as pg
 
 from core.api.eventmanager import EventManager, event_handler
+from core.api.inputrouter import InputRouter
+from core.api.profiler import Profiler
 from core.api.renderer import Renderer
 from core.api.window import Window
 
@@ -15,6 +19,19 @@ class WindowExtended(Window):
 
     Attributes
     ----------
+        alpha : float
+            How far the time of the current frame is between the last and the
+            next simulation tick, as a fraction of a tick. Can be used to
+            interpolate between simulation states when drawing.
+
+        busy_loop : bool
+            Whether the main loop is delayed by busy waiting, which is more
+            precise but keeps a CPU core busy.
+
+        drawing : bool
+            Whether the frame is drawn, which is when `render` is set and the
+            window is visible.
+
         dt : float
             The time between iterations of the main loop in seconds.
 
@@ -38,13 +55,48 @@ class WindowExtended(Window):
         - pygame.SHOWN          window is opened in visible mode (default)
         - pygame.HIDDEN         window is opened in hidden mode
 
+        headless : bool
+            Whether the window is run without a real display, using SDL's dummy
+            video driver. The main loop is then not delayed, and `dt` is the
+            frame time at `max_fps`, so the simulation runs as fast as possible.
+
         icon : pygame.Surface
             The pygame Surface object used as the window's icon.
 
+        idle : bool
+            Whether the main loop is throttled to `idle_fps` in this frame.
+
+        idle_delay : float
+            The number of seconds without input and without changes on the
+            screen, after which the main loop is throttled.
+
+        idle_fps : int | None
+            The number of iterations each second, when the main loop is idle or
+            the window is not visible. The main loop is woken up by any event.
+            If `None`, the main loop is never throttled.
+
+        inputrouter : InputRouter
+            The window's input router responsible for passing the mouse to the
+            interactive objects.
+
         max_fps : int
             The maximum number of iterations each second to keep the main loop around.
             In turn controls how many frames, the renderer will render each second.
 
+        max_ticks_per_frame : int
+            The maximum number of simulation ticks to run in a frame, when the
+            simulation is behind. Any remaining time is dropped, so slow frames
+            do not cause ever more ticks to be run.
+
+        profiler : Profiler
+            The profiler of the main loop, which is disabled by default. When
+            enabled, the phases `events`, `loop`, `render` and `wait` of each
+            frame are timed.
+
+        render : bool
+            Whether frames are rendered. Can be disabled in headless mode to
+            only run the simulation.
+
         renderer : Renderer
             The window's renderer responsible for managing drawing tasks.
 
@@ -56,8 +108,16 @@ class WindowExtended(Window):
         size : numpy.typing.ArrayLike
             An integer array of size 2 describing the size of the window.
 
+        tick_rate : int | None
+            The number of simulation ticks each second. If `None`, the simulation
+            is updated once each frame with the frame's `dt`.
+
         title : str
             A string describing the title of the window.
+
+        visible : bool
+            Whether the window is visible. While it is minimized or hidden,
+            nothing is drawn, but the simulation is still updated.
     """
 
     def __init__(
@@ -67,6 +127,7 @@ class WindowExtended(Window):
         size: tuple[int, int],
         flags: int,
         max_fps: int,
+        headless: bool = False,
     ):
         """
         Initialize this class.
@@ -95,39 +156,192 @@ class WindowExtended(Window):
 
             max_fps : int
                 The window's maximum framerate.
+
+            headless : bool, default False
+                Whether to run the window without a real display.
         """
-        super().__init__(title, icon, size, flags)
+        super().__init__(title, icon, size, flags, headless)
 
         self._clock = pg.time.Clock()
         self.eventmanager = EventManager(self)
         self.renderer = Renderer(self, self.eventmanager)
+        self.inputrouter = InputRouter(self.eventmanager, self.renderer)
+        self.profiler = Profiler()
 
         self.dt = 0.0
         self.fps = 0
         self.max_fps = max_fps
+
+        self.tick_rate: int | None = None
+        self.max_ticks_per_frame = 8
+        self.alpha = 0.0
+        self._accumulator = 0.0
+        self.render = True
         self.running = False
 
+        self.busy_loop = False
+        self.idle_fps: int | None = 5
+        self.idle_delay = 0.5
+        self.idle = False
+        self.visible = not flags & pg.HIDDEN
+        self._last_activity = 0  # in milliseconds
+        self._last_tick = 0  # in milliseconds
+        self._waited = 0.0  # in seconds
+
         @event_handler(type=pg.QUIT)
         def on_quit(w: WindowExtended):
             w.running = False
 
         self.eventmanager.add_handler(on_quit, w=self)
 
-    def run(self):
+        def on_hide(w: WindowExtended):
+            w.visible = False
+
+        def on_show(w: WindowExtended):
+            # The content of the window may be lost while it was not visible.
+            if not w.visible:
+                w.renderer.invalidate()
+            w.visible = True
+
+        for type in (pg.WINDOWMINIMIZED, pg.WINDOWHIDDEN):
+            self.eventmanager.add_new_handler(on_hide, type, w=self)
+        for type in (pg.WINDOWRESTORED, pg.WINDOWSHOWN, pg.WINDOWMAXIMIZED):
+            self.eventmanager.add_new_handler(on_show, type, w=self)
+
+        # Only the changed regions are updated on the display, so the whole
+        # window is presented again, when the system needs it to be repainted.
+        self.eventmanager.add_new_handler(self.renderer.invalidate, pg.WINDOWEXPOSED)
+
+    def run(self, max_frames: int | None = None):
         """
         Run the main loop.
+
+        Parameters
+        ----------
+            max_frames : int | None, default None
+                The number of iterations after which the main loop is exited. The
+                main loop runs until it is exited otherwise if `None` is given.
         """
         self.running = True
+        frames = 0
 
         while self.running:
-            self.dt = self._clock.get_time() / 1000  # in seconds
-            self.fps = round(self._clock.get_fps())  # in whole numbers.
+            if self.headless:
+                self.dt = 1 / self.max_fps  # in seconds
+            else:
+                self.dt = self._clock.get_time() / 1000  # in seconds
+
+            fps = self._clock.get_fps()
+            self.fps = round(fps) if fps != float("inf") else 0  # in whole numbers.
+
+            if self.profiler.enabled:
+                self._profiled_frame()
+            else:
+                self.eventmanager._update()
+                self.loop_method()
+                if self.drawing:
+                    self.renderer._update()
+                self._wait()
+
+            frames += 1
+            if frames == max_frames:
+                self.running = False
+
+    def _profiled_frame(self):
+        """
+        Run the phases of a frame like the main loop, timing each of them.
+        """
+        profiler = self.profiler
+        profiler.begin_frame()
+        profiler.call("events", "phase", self.eventmanager._update)
+        profiler.call("loop", "phase", self.loop_method)
+        if self.drawing:
+            profiler.call("render", "phase", self.renderer._update)
+        profiler.call("wait", "phase", self._wait)
+        profiler.end_frame()
+
+    @property
+    def drawing(self) -> bool:
+        return self.render and self.visible
+
+    def _wait(self):
+        """
+        Delay the main loop until the next frame.
+        """
+        if self.headless:
+            self._clock.tick()  # measure the main loop without delaying it.
+            return
+
+        self.idle = self._is_idle()
+        self._waited = 0.0
+        if self.idle:
+            # Wait for the rest of an idle frame, unless an event arrives.
+            timeout = 1000 // self.idle_fps - (pg.time.get_ticks() - self._last_tick)
+            if timeout > 0 and not pg.event.peek():
+                start = pg.time.get_ticks()
+                event = pg.event.wait(timeout)
+                if event.type != pg.NOEVENT:
+                    # Put the event back in front of the ones that followed it.
+                    for e in (event, *pg.event.get()):
+                        pg.event.post(e)
+                self._waited = (pg.time.get_ticks() - start) / 1000
+
+        if self.busy_loop:
+            self._clock.tick_busy_loop(self.max_fps)
+        else:
+            self._clock.tick(self.max_fps)  # delay the main loop.
+        self._last_tick = pg.time.get_ticks()
 
-            self.eventmanager._update()
-            self.loop_method()
-            self.renderer._update()
+    def _is_idle(self) -> bool:
+        """
+        Whether there was neither input nor a change on the screen for
+        `idle_delay` seconds, or the window is not visible.
+        """
+        if self.idle_fps is None:
+            return False
 
-            self._clock.tick(self.max_fps)  # delay the main loop.
+        now = pg.time.get_ticks()
+        if self.eventmanager.events or (self.drawing and self.renderer.presented):
+            self._last_activity = now
+            return not self.visible
+
+        return not self.visible or now - self._last_activity >= self.idle_delay * 1000
+
+    def ticks(self):
+        """
+        Get the time steps to update the simulation with in this frame.
+
+        With a fixed `tick_rate`, the frame's time is accumulated and as many
+        ticks as fit into it are yielded. That can be none, if the frame was
+        shorter than a tick. Afterwards `alpha` is set to the remaining fraction
+        of a tick.
+
+        Yields
+        ------
+            float
+                The time step of a tick in seconds.
+        """
+        if self.tick_rate is None:
+            self.alpha = 1.0
+            yield self.dt
+            return
+
+        step = 1 / self.tick_rate
+        self._accumulator += self.dt
+
+        # The time waited while idle is caught up on, as it was not caused by
+        # slow frames.
+        max_ticks = self.max_ticks_per_frame + math.ceil(self._waited / step)
+        for _ in range(max_ticks):
+            if self._accumulator < step:
+                break
+            self._accumulator -= step
+            yield step
+        else:
+            # Prevent the simulation from falling further and further behind.
+            self._accumulator %= step
+
+        self.alpha = self._accumulator / step
 
     def exit(self):
         """
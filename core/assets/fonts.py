@@ -1,4 +1,9 @@
+import os as _os
+import threading as _threading
+from collections import OrderedDict as _OrderedDict
+from collections import namedtuple as _namedtuple
 from functools import lru_cache as _lru_cache
+from io import BytesIO as _BytesIO
 
 import pygame as _pg
 from pygame.font import Font as _Font
@@ -7,10 +12,184 @@ from core.api import EventManager as _EventManager
 from core.api import Renderer as _Renderer
 from core.api import event_handler as _event_handler
 
+TextCacheInfo = _namedtuple(
+    "TextCacheInfo", ["hits", "misses", "maxbytes", "currbytes", "currsize"]
+)
+
+
+# SDL_ttf is not thread-safe, so fonts are only loaded and used with this lock.
+_lock = _threading.RLock()
+
+# The font sizes registered to be loaded by `warm_up`.
+_preload_sizes: dict[str, set[int]] = {}
+
 
 @_lru_cache
+def _load_font_data(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@_lru_cache(maxsize=32)
 def _load_font(path, size):
-    return _Font(path, size)
+    with _lock:
+        return _Font(_BytesIO(_load_font_data(path)), size)
+
+
+def _quantize(size):
+    """
+    Round a scaled font size, so nearby scales share the same font.
+    """
+    size = max(1, round(size))
+    if size < 16:
+        return size
+    elif size < 48:
+        return size - size % 2
+    else:
+        return size - size % 4
+
+
+def font_cache_info():
+    """
+    Returns
+    -------
+        functools._CacheInfo
+            The number of hits and misses of the font cache, along with it's
+            maximum and current size.
+    """
+    return _load_font.cache_info()
+
+
+def warm_up(scales=None) -> _threading.Thread:
+    """
+    Load the font files and the registered font sizes in a background thread.
+
+    Afterwards fonts are created from memory, so the font files are never read
+    from the disk in the main loop.
+
+    Parameters
+    ----------
+        scales : Iterable[float] | None, default None
+            The scales to load the registered sizes at. The renderer's current
+            scale is used if `None` is given.
+
+    Returns
+    -------
+        threading.Thread
+            The started thread, which can be joined to wait for it.
+    """
+    if scales is None:
+        scales = (_Renderer()._h_scale,)
+
+    jobs = [
+        (path, _quantize(size * scale))
+        for path, sizes in _preload_sizes.items()
+        for size in sizes
+        for scale in scales
+    ]
+
+    def load():
+        for path in _preload_sizes:
+            _load_font_data(path)
+        for path, size in jobs:
+            _load_font(path, size)
+
+    thread = _threading.Thread(target=load, name="font-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+class _TextCache:
+    """
+    This class caches rendered text surfaces by least recent use within a
+    memory budget.
+
+    The cache is cleared whenever the renderer's scale changes, as the surfaces
+    rendered at the previous scale will not be used again.
+    """
+
+    def __init__(self, maxbytes):
+        self.maxbytes = maxbytes
+        self.currbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._h_scale = None
+        self._surfaces: _OrderedDict[tuple, _pg.Surface] = _OrderedDict()
+
+    def get(self, path, size, text, antialias, color, h_scale):
+        if h_scale != self._h_scale:
+            self.clear()
+            self._h_scale = h_scale
+
+        key = (path, size, text, antialias, color)
+        surface = self._surfaces.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        font = _load_font(path, size)
+        with _lock:
+            surface = font.render(text, antialias, _pg.Color(color))
+
+        nbytes = self._get_nbytes(surface)
+        if nbytes <= self.maxbytes:
+            self._surfaces[key] = surface
+            self.currbytes += nbytes
+            self.evict()
+
+        return surface
+
+    def evict(self):
+        while self.currbytes > self.maxbytes:
+            _, surface = self._surfaces.popitem(last=False)
+            self.currbytes -= self._get_nbytes(surface)
+
+    def clear(self):
+        self._surfaces.clear()
+        self.currbytes = 0
+
+    @staticmethod
+    def _get_nbytes(surface: _pg.Surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+_text_cache = _TextCache(maxbytes=16 * 1024 * 1024)
+
+
+def text_cache_info() -> TextCacheInfo:
+    """
+    Returns
+    -------
+        TextCacheInfo
+            The number of hits and misses of the text cache, it's memory
+            budget and usage in bytes, and the number of cached surfaces.
+    """
+    c = _text_cache
+    return TextCacheInfo(c.hits, c.misses, c.maxbytes, c.currbytes, len(c._surfaces))
+
+
+def set_text_cache_budget(maxbytes: int):
+    """
+    Set the memory budget of the text cache.
+
+    Parameters
+    ----------
+        maxbytes : int
+            The maximum number of bytes used by the cached text surfaces.
+    """
+    _text_cache.maxbytes = maxbytes
+    _text_cache.evict()
+
+
+def text_cache_clear():
+    """
+    Clear the text cache and it's statistics.
+    """
+    _text_cache.clear()
+    _text_cache.hits = _text_cache.misses = 0
 
 
 class _PartialFont:
@@ -18,15 +197,56 @@ class _PartialFont:
         self.path = path
 
     def of_size(self, size):
-        return _load_font(self.path, round(size * _Renderer()._h_scale))
+        return _load_font(self.path, _quantize(size * _Renderer()._h_scale))
+
+    def preload(self, *sizes):
+        """
+        Register unscaled sizes of the font to be loaded by `warm_up`.
+        """
+        _preload_sizes.setdefault(self.path, set()).update(sizes)
+
+    def render(self, size, text, antialias, color):
+        """
+        Render text with the font, reusing a previously rendered surface if
+        possible.
+
+        The returned surface is shared, and should not be modified.
+
+        Parameters
+        ----------
+            size : int
+                The unscaled size of the font.
+            text : str
+                The text to render.
+            antialias : bool
+                Whether to render the text with smooth edges.
+            color : pygame.Color
+                The color of the text.
+
+        Returns
+        -------
+            pygame.Surface
+                The rendered text.
+        """
+        h_scale = _Renderer()._h_scale
+        return _text_cache.get(
+            self.path,
+            _quantize(size * h_scale),
+            text,
+            antialias,
+            int(_pg.Color(color)),
+            h_scale,
+        )
+
 
+_DIR = _os.path.join("assets", "fonts")
 
-gui_regular = _PartialFont("assets\\fonts\\ClearSans Regular.ttf")
-gui_bold = _PartialFont("assets\\fonts\\ClearSans Bold.ttf")
-gui_italic = _PartialFont("assets\\fonts\\ClearSans Italic.ttf")
-gui_bolditalic = _PartialFont("assets\\fonts\\ClearSans BoldItalic.ttf")
+gui_regular = _PartialFont(_os.path.join(_DIR, "ClearSans Regular.ttf"))
+gui_bold = _PartialFont(_os.path.join(_DIR, "ClearSans Bold.ttf"))
+gui_italic = _PartialFont(_os.path.join(_DIR, "ClearSans Italic.ttf"))
+gui_bolditalic = _PartialFont(_os.path.join(_DIR, "ClearSans BoldItalic.ttf"))
 
-cmu_roman = _PartialFont("assets\\fonts\\CMU Serif Roman.ttf")
-cmu_bold = _PartialFont("assets\\fonts\\CMU Serif Bold.ttf")
-cmu_italic = _PartialFont("assets\\fonts\\CMU Serif Italic.ttf")
-cmu_bolditalic = _PartialFont("assets\\fonts\\CMU Serif BoldItalic.ttf")
+cmu_roman = _PartialFont(_os.path.join(_DIR, "CMU Serif Roman.ttf"))
+cmu_bold = _PartialFont(_os.path.join(_DIR, "CMU Serif Bold.ttf"))
+cmu_italic = _PartialFont(_os.path.join(_DIR, "CMU Serif Italic.ttf"))
+cmu_bolditalic = _PartialFont(_os.path.join(_DIR, "CMU Serif BoldItalic.ttf"))
@@ -1,9 +1,18 @@
+import os as _os
 from functools import lru_cache as _lru_cache
+from weakref import WeakSet as _WeakSet
 
 import pygame as _pg
 
-from core.api import EventManager as _EventManager
-from core.api import event_handler as _event_handler
+from core.api import Renderer as _Renderer
+
+# The converted images by their path and whether they have per-pixel alpha.
+_converted: dict[tuple[str, bool], _pg.Surface] = {}
+
+# The pixel format of the display surface, the converted images are in.
+_display_format = None
+
+_atlases: "_WeakSet[ImageAtlas]" = _WeakSet()
 
 
 @_lru_cache
@@ -11,17 +20,53 @@ def _load_image(path):
     return _pg.image.load(path)
 
 
-@_lru_cache
+def _get_display_format():
+    surface = _pg.display.get_surface()
+    return (surface.get_bitsize(), surface.get_masks())
+
+
+def _track_display_format():
+    global _display_format
+
+    if _display_format is None:
+        _display_format = _get_display_format()
+
+
 def _load_image_convert(path, alpha):
-    if alpha:
-        return _pg.image.load(path).convert_alpha()
-    else:
-        return _pg.image.load(path).convert()
+    key = (path, alpha)
+    surface = _converted.get(key)
+
+    if surface is None:
+        _track_display_format()
+
+        # Converting the image loaded previously avoids reading it again.
+        if alpha:
+            surface = _load_image(path).convert_alpha()
+        else:
+            surface = _load_image(path).convert()
+        _converted[key] = surface
+
+    return surface
+
+
+def _reconvert_if_format_changed():
+    """
+    Discard the converted images, if the pixel format of the display surface
+    has changed. They are reconverted from memory, when they are used next.
+    """
+    global _display_format
+
+    if _display_format is None or _display_format == _get_display_format():
+        return
+
+    _display_format = None
+    _converted.clear()
+    for atlas in _atlases:
+        atlas._surface = None
 
 
 def reconvert_on_resize():
-    handler = _event_handler(_pg.VIDEORESIZE)(_load_image_convert.cache_clear)
-    _EventManager().add_handler(handler)
+    _Renderer().add_layout_handler(_reconvert_if_format_changed)
 
 
 class PartialImage:
@@ -35,4 +80,116 @@ class PartialImage:
             return _load_image_convert(self.path, alpha)
 
 
-zls_icon = PartialImage("assets\\images\\zls_icon.png")
+class ImageAtlas:
+    """
+    This class packs small images into a single converted surface.
+
+    Drawing an image from the atlas is a blit of an area of the shared surface,
+    so a scene with many small images only needs one converted surface.
+
+    Attributes
+    ----------
+        images : tuple[PartialImage, ...]
+            The images in the atlas.
+
+        alpha : bool
+            Whether the atlas has per-pixel alpha.
+
+        padding : int
+            The number of pixels between the images in the atlas.
+    """
+
+    def __init__(self, images, alpha=True, padding=1, max_width=1024):
+        """
+        Initialize the atlas. The images are packed, when it is first used.
+
+        Parameters
+        ----------
+            images : Iterable[PartialImage]
+                The images to pack.
+            alpha : bool, default True
+                Whether the atlas has per-pixel alpha.
+            padding : int, default 1
+                The number of pixels between the images.
+            max_width : int, default 1024
+                The width of the atlas, unless an image is wider.
+        """
+        self.images = tuple(images)
+        self.alpha = alpha
+        self.padding = padding
+        self._max_width = max_width
+        self._rects: dict[str, _pg.Rect] | None = None
+        self._size = (0, 0)
+        self._surface: _pg.Surface | None = None
+        _atlases.add(self)
+
+    def _pack(self):
+        """
+        Pack the images into rows of decreasing height.
+        """
+        sizes = {
+            image.path: _load_image(image.path).get_size() for image in self.images
+        }
+        width = max([self._max_width, *(w for w, _ in sizes.values())])
+
+        self._rects = {}
+        x = y = row_h = used_w = 0
+
+        for path in sorted(sizes, key=lambda path: -sizes[path][1]):
+            w, h = sizes[path]
+            if x + w > width:
+                x = 0
+                y += row_h + self.padding
+                row_h = 0
+
+            self._rects[path] = _pg.Rect(x, y, w, h)
+            used_w = max(used_w, x + w)
+            row_h = max(row_h, h)
+            x += w + self.padding
+
+        self._size = (used_w, y + row_h)
+
+    def as_surface(self) -> _pg.Surface:
+        """
+        Returns
+        -------
+            pygame.Surface
+                The converted surface of the atlas.
+        """
+        if self._rects is None:
+            self._pack()
+
+        if self._surface is None:
+            _track_display_format()
+            surface = _pg.Surface(self._size, _pg.SRCALPHA if self.alpha else 0)
+            for image in self.images:
+                surface.blit(_load_image(image.path), self._rects[image.path])
+
+            self._surface = surface.convert_alpha() if self.alpha else surface.convert()
+
+        return self._surface
+
+    def get(self, image: PartialImage) -> tuple[_pg.Surface, _pg.Rect]:
+        """
+        Get the surface and area of an image in the atlas.
+
+        Parameters
+        ----------
+            image : PartialImage
+                The image to look up.
+
+        Returns
+        -------
+            tuple[pygame.Surface, pygame.Rect]
+                The surface of the atlas and the area of the image in it. These
+                can be passed to `Renderer.draw_surface` as surface and area.
+        """
+        surface = self.as_surface()
+        return surface, self._rects[image.path]
+
+
+_DIR = _os.path.join("assets", "images")
+
+zls_icon = PartialImage(_os.path.join(_DIR, "zls_icon.png"))
+
+icons = ImageAtlas((zls_icon,))
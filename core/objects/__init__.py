@@ -1,3 +1,8 @@
 from core.objects.animatebutton import AnimateButton
+from core.objects.button import Button
+from core.objects.figure import FigurePlot, SeriesFigure
+from core.objects.graph import Graph, Series
 from core.objects.introtext import IntroText
 from core.objects.layer import Layer
+from core.objects.replayplayer import ReplayPlayer
+from core.objects.zipline import Zipline
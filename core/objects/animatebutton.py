@@ -1,15 +1,28 @@
-import numpy as np
-import pygame as pg
-
-import core.simulation as s
+from core.objects.button import Button
 from core.objects.layer import Layer
-from core.types import Object
+from core.objects.zipline import Zipline
+
 
+class AnimateButton(Button):
+    """
+    This class is a button in the parameter panel, which pauses and resumes the
+    simulation of a zipline.
 
-class AnimateButton(Object):
-    def __init__(self):
+    Attributes
+    ----------
+        zipline : Zipline
+            The zipline to pause and resume.
+    """
+
+    def __init__(self, layer: Layer, zipline: Zipline):
         name = "animate_button"
-        super().__init__(name)
+        super().__init__(name, layer, (0.1, 0.04), (0.9, 0.12), self._get_text(zipline))
+        self.zipline = zipline
+
+    def click(self):
+        self.zipline.simulate = not self.zipline.simulate
+        self.text = self._get_text(self.zipline)
 
-    def start(self):
-        pass
+    @staticmethod
+    def _get_text(zipline: Zipline):
+        return "Pause" if zipline.simulate else "Animate"
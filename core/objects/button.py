@@ -0,0 +1,171 @@
+from typing import Callable
+
+import pygame as pg
+
+from core.api import InputRouter, Renderer
+from core.assets import colors, fonts
+from core.objects.layer import Layer
+from core.types import Object
+
+# The font size of the labels is loaded in the background at startup.
+fonts.gui_regular.preload(20)
+
+
+class Button(Object):
+    """
+    This class is a button inside a panel, which is clicked with the mouse.
+
+    The mouse is passed to the button by the `InputRouter`, so a button does
+    not listen to the mouse events itself.
+
+    Attributes
+    ----------
+        layer : Layer
+            The panel the button is placed in.
+
+        rel_start_pos : tuple[float, float]
+            The top left corner relative to the content area of the panel.
+
+        rel_end_pos : tuple[float, float]
+            The bottom right corner relative to the content area of the panel.
+
+        text : str
+            The label of the button.
+
+        on_click : Callable[[], None] | None
+            The function called, when the button is clicked.
+
+        rect : pygame.Rect
+            The area of the button on the screen.
+
+        hovered : bool
+            Whether the mouse is over the button.
+
+        pressed : bool
+            Whether the button is held down by the mouse.
+    """
+
+    def __init__(
+        self,
+        name,
+        layer: Layer,
+        rel_start_pos,
+        rel_end_pos,
+        text,
+        on_click: Callable[[], None] | None = None,
+        color=colors.gray,
+        hover_color=colors.light_gray,
+        press_color=colors.dark_blue,
+        line_color=colors.black,
+        line_thickness=2,
+        text_size=20,
+        text_color=colors.white,
+    ):
+        super().__init__(name)
+        self.layer = layer
+        self.rel_start_pos = rel_start_pos
+        self.rel_end_pos = rel_end_pos
+
+        self.text = text
+        self.on_click = on_click
+
+        self.color = color
+        self.hover_color = hover_color
+        self.press_color = press_color
+        self.line_color = line_color
+        self.line_thickness = line_thickness
+        self.text_size = text_size
+        self.text_color = text_color
+
+        self.rect = pg.Rect(0, 0, 0, 0)
+        self.hovered = False
+        self.pressed = False
+
+        self._handler_id = -1
+        self._surfaces: dict[tuple, pg.Surface] = {}
+        self._surface_key = None
+
+    def start(self):
+        def on_resize(b: Button):
+            area = b.layer.content_rect
+            left = area.left + round(area.w * b.rel_start_pos[0])
+            top = area.top + round(area.h * b.rel_start_pos[1])
+            right = area.left + round(area.w * b.rel_end_pos[0])
+            bottom = area.top + round(area.h * b.rel_end_pos[1])
+            b.rect = pg.Rect(left, top, right - left, bottom - top)
+
+        # The button is placed after it's panel, and before the input router
+        # rebuilds it's index.
+        self._handler_id = Renderer().add_layout_handler(on_resize, order=1, b=self)
+        on_resize(b=self)
+
+        InputRouter().add(self)
+
+    def end(self):
+        Renderer().remove_layout_handler(self._handler_id)
+        InputRouter().remove(self)
+        self.hovered = self.pressed = False
+
+    def click(self):
+        """
+        Click the button, which is done by the mouse.
+        """
+        if self.on_click is not None:
+            self.on_click()
+
+    def on_mouse_enter(self):
+        self.hovered = True
+
+    def on_mouse_leave(self):
+        self.hovered = False
+
+    def on_mouse_down(self, event):
+        if event.button == 1:
+            self.pressed = True
+
+    def on_mouse_up(self, event):
+        if event.button == 1 and self.pressed:
+            self.pressed = False
+            if self.rect.collidepoint(event.pos):
+                self.click()
+
+    def on_mouse_motion(self, event):
+        pass
+
+    def draw(self, renderer: Renderer):
+        if self.rect.w <= 0 or self.rect.h <= 0:
+            return
+
+        if self.pressed and self.hovered:
+            color = self.press_color
+        elif self.hovered:
+            color = self.hover_color
+        else:
+            color = self.color
+
+        key = (self.rect.size, renderer._h_scale, self.text)
+        if key != self._surface_key:
+            self._surfaces.clear()
+            self._surface_key = key
+
+        surface = self._surfaces.get(tuple(color))
+        if surface is None:
+            surface = self._surfaces[tuple(color)] = self._rasterize(color)
+
+        renderer.draw_surface(1, surface, self.rect.topleft)
+
+    def _rasterize(self, color) -> pg.Surface:
+        """
+        Render the button in a color into a offscreen surface.
+        """
+        w, h = self.rect.size
+        surface = pg.Surface((w, h))
+        surface.fill(color)
+
+        fs = fonts.gui_regular.render(self.text_size, self.text, True, self.text_color)
+        surface.blit(fs, fs.get_rect(center=(w // 2, h // 2)))
+
+        # The outline is drawn inside the edges, so it is not clipped.
+        pg.draw.rect(surface, self.line_color, (0, 0, w, h), self.line_thickness)
+
+        return surface
@@ -0,0 +1,236 @@
+from typing import Sequence
+
+import numpy as np
+import pygame as pg
+
+from core.api import Renderer
+from core.objects.graph import Series
+from core.objects.layer import Layer
+from core.types import Object
+
+
+def _import_agg():
+    """
+    Import the matplotlib classes, which takes a while, only once a figure is
+    actually used.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    return Figure, FigureCanvasAgg
+
+
+def _to_rgb(color) -> tuple[float, float, float]:
+    color = pg.Color(color)
+    return (color.r / 255, color.g / 255, color.b / 255)
+
+
+class FigurePlot(Object):
+    """
+    This class draws a matplotlib figure inside a panel.
+
+    The figure is rendered by the Agg canvas, and it's pixel buffer is wrapped
+    as a surface without copying. The static parts of the figure are rendered
+    once and cached, and each frame only the animated artists are redrawn on
+    top of the cached background. The figure is only laid out again, when the
+    window is resized.
+
+    Subclasses create the figure's content in `setup` and update it in
+    `refresh`.
+
+    Attributes
+    ----------
+        layer : Layer
+            The panel to draw the figure in.
+
+        dpi : float
+            The resolution of the figure at the original window size. It is
+            scaled with the window, so the text keeps it's relative size.
+
+        figure : matplotlib.figure.Figure | None
+            The figure, which exists after the object is started.
+
+        artists : tuple[matplotlib.artist.Artist, ...]
+            The artists redrawn every frame.
+    """
+
+    def __init__(self, name, layer: Layer, dpi=72):
+        super().__init__(name)
+        self.layer = layer
+        self.dpi = dpi
+
+        self.figure = None
+        self.canvas = None
+        self.artists = ()
+        self.handler_id = -1
+
+        self._surface: pg.Surface | None = None
+        self._background = None
+        self._needs_layout = True
+        self._needs_background = True
+
+    def prepare(self):
+        # Importing matplotlib and creating the figure is the slow part.
+        Figure, FigureCanvasAgg = _import_agg()
+        self.figure = Figure(facecolor=_to_rgb(self.layer.color), layout="constrained")
+        self.canvas = FigureCanvasAgg(self.figure)
+
+        self.artists = tuple(self.setup(self.figure))
+        for artist in self.artists:
+            artist.set_animated(True)
+
+    def start(self):
+        if self.figure is None:
+            self.prepare()
+
+        def on_resize(plot: FigurePlot):
+            plot._needs_layout = True
+
+        self.handler_id = Renderer().add_layout_handler(on_resize, plot=self)
+        super().start()
+
+    def setup(self, figure) -> Sequence:
+        """
+        Create the content of the figure.
+
+        Parameters
+        ----------
+            figure : matplotlib.figure.Figure
+                The figure to create the content in.
+
+        Returns
+        -------
+            Sequence[matplotlib.artist.Artist]
+                The artists to redraw every frame, which are excluded from the
+                cached background.
+        """
+        return ()
+
+    def refresh(self) -> bool:
+        """
+        Update the animated artists. If the static parts of the figure change,
+        e.g. the limits of an axes, `redraw_background` must be called.
+
+        Returns
+        -------
+            bool
+                Whether any artist has changed.
+        """
+        return False
+
+    def redraw_background(self):
+        """
+        Render the static parts of the figure again in the next frame.
+        """
+        self._needs_background = True
+
+    def draw(self, renderer: Renderer):
+        rect = self.layer.content_rect
+        if rect.w <= 0 or rect.h <= 0:
+            return
+
+        if self._needs_layout:
+            dpi = self.dpi * renderer._h_scale
+            self.figure.set_dpi(dpi)
+            self.figure.set_size_inches(rect.w / dpi, rect.h / dpi)
+            self._needs_layout = False
+            self._needs_background = True
+
+        changed = self.refresh()
+
+        if self._needs_background:
+            self._render_background()
+            changed = True
+
+        if changed:
+            self.canvas.restore_region(self._background)
+            for artist in self.artists:
+                self.figure.draw_artist(artist)
+            # The surface is the canvas' buffer, which was changed in place.
+            renderer.invalidate(self._surface.get_rect(topleft=rect.topleft))
+
+        renderer.draw_surface(1, self._surface, rect.topleft)
+
+    def _render_background(self):
+        """
+        Render the figure without the animated artists, cache it and wrap the
+        canvas' buffer as a surface.
+        """
+        self.canvas.draw()
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+
+        # The buffer is only reallocated, when the canvas is resized, so the
+        # surface is only wrapped again after a layout.
+        buffer = self.canvas.buffer_rgba()
+        size = self.canvas.get_width_height()
+        self._surface = pg.image.frombuffer(buffer, size, "RGBA")
+        self._needs_background = False
+
+    def end(self):
+        Renderer().remove_layout_handler(self.handler_id)
+
+
+class SeriesFigure(FigurePlot):
+    """
+    This class plots series with matplotlib, one axes per series.
+
+    The series are the same as the ones of `Graph`, which is the faster way to
+    plot them, so either can be used for the same data. The vertical limits
+    grow to fit the samples, which is the only time the static parts of the
+    figure are rendered again.
+
+    Attributes
+    ----------
+        series : tuple[Series, ...]
+            The plotted series.
+    """
+
+    def __init__(self, name, layer: Layer, series: Sequence[Series], dpi=72):
+        super().__init__(name, layer, dpi)
+        self.series = tuple(series)
+        self._versions = [-1] * len(self.series)
+        self._axes = []
+        self._lines = []
+
+    def setup(self, figure):
+        text_color = _to_rgb(self.layer.text_color)
+        self._axes = figure.subplots(len(self.series), 1, sharex=True, squeeze=False)
+        self._axes = self._axes[:, 0].tolist()
+
+        for axes, series in zip(self._axes, self.series):
+            axes.set_facecolor("none")
+            axes.set_xlim(0, series.capacity)
+            axes.set_ylim(-1, 1)
+            axes.set_ylabel(series.name, color=text_color)
+            axes.tick_params(colors=text_color, labelsize="small")
+            (line,) = axes.plot([], [], color=_to_rgb(series.color), linewidth=1)
+            self._lines.append(line)
+
+        return self._lines
+
+    def refresh(self):
+        changed = False
+
+        for i, (series, axes, line) in enumerate(
+            zip(self.series, self._axes, self._lines)
+        ):
+            if series.version == self._versions[i]:
+                continue
+            self._versions[i] = series.version
+            changed = True
+
+            values = series.values()
+            line.set_data(np.arange(len(values)), values)
+            if len(values) == 0:
+                continue
+
+            bottom, top = axes.get_ylim()
+            lo, hi = values.min(), values.max()
+            if lo < bottom or hi > top:
+                # The limits grow with some headroom, so the background is only
+                # rendered again a few times.
+                margin = 0.5 * max(hi - lo, top - bottom)
+                axes.set_ylim(min(bottom, lo - margin), max(top, hi + margin))
+                self.redraw_background()
+
+        return changed
@@ -0,0 +1,213 @@
+from typing import Callable, Sequence
+
+import numpy as np
+import pygame as pg
+
+from core.api import Renderer
+from core.assets import fonts
+from core.objects.layer import Layer
+from core.types import Object
+
+# The font size of the legend is loaded in the background at startup.
+fonts.gui_regular.preload(16)
+
+
+class Series:
+    """
+    This class stores the latest samples of a quantity in a ring buffer.
+
+    Attributes
+    ----------
+        name : str
+            The name of the series, shown in the legend.
+
+        color : pygame.Color
+            The color of the series.
+
+        capacity : int
+            The maximum number of samples kept.
+
+        count : int
+            The total number of samples appended since the series was cleared.
+
+        version : int
+            A number, which changes whenever the samples change.
+    """
+
+    def __init__(self, name, color, capacity=4096):
+        self.name = name
+        self.color = color
+        self.capacity = capacity
+        self.count = 0
+        self.version = 0
+        self._data = np.zeros(capacity)
+
+    def append(self, value: float):
+        self._data[self.count % self.capacity] = value
+        self.count += 1
+        self.version += 1
+
+    def extend(self, values):
+        values = np.asarray(values, np.float64)[-self.capacity :]
+        n = len(values)
+        i = self.count % self.capacity
+        first = min(n, self.capacity - i)
+        self._data[i : i + first] = values[:first]
+        self._data[: n - first] = values[first:]
+        self.count += n
+        self.version += 1
+
+    def clear(self):
+        self.count = 0
+        self.version += 1
+
+    def values(self) -> np.ndarray:
+        """
+        Returns
+        -------
+            numpy.ndarray[float64]
+                The kept samples from the oldest to the latest.
+        """
+        if self.count <= self.capacity:
+            return self._data[: self.count]
+
+        i = self.count % self.capacity
+        return np.concatenate((self._data[i:], self._data[:i]))
+
+
+def decimate(values: np.ndarray, starts: np.ndarray):
+    """
+    Reduce samples to the minimum and maximum of each bucket.
+
+    Parameters
+    ----------
+        values : numpy.ndarray
+            The samples.
+        starts : numpy.ndarray[intp]
+            The index of the first sample of each bucket in increasing order.
+
+    Returns
+    -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            The minimum and maximum of each bucket.
+    """
+    return np.minimum.reduceat(values, starts), np.maximum.reduceat(values, starts)
+
+
+class Graph(Object):
+    """
+    This class plots the latest samples of some series inside a panel.
+
+    Each series is drawn as a polyline with a vertical segment from the minimum
+    to the maximum of the samples in each column of pixels, so the cost of
+    drawing is bounded by the width of the panel, not the number of samples.
+    Each series is scaled to fit the panel on it's own.
+
+    Attributes
+    ----------
+        layer : Layer
+            The panel to draw the graph in.
+
+        series : tuple[Series, ...]
+            The plotted series.
+
+        sample : Callable[[], Sequence[float]] | None
+            A function returning a value for each series, which is called on
+            each update. If `None` is given, the series are appended to
+            directly.
+
+        visible : bool
+            Whether the graph is drawn. The series are sampled either way.
+    """
+
+    def __init__(
+        self,
+        name,
+        layer: Layer,
+        series: Sequence[Series],
+        sample: Callable[[], Sequence[float]] | None = None,
+        line_thickness=1,
+        legend_size=16,
+    ):
+        super().__init__(name)
+        self.layer = layer
+        self.series = tuple(series)
+        self.sample = sample
+        self.line_thickness = line_thickness
+        self.legend_size = legend_size
+        self.visible = True
+
+        self._points_key: list = [None] * len(self.series)
+        self._points: list[np.ndarray | None] = [None] * len(self.series)
+
+    def update(self, dt: float):
+        if self.sample is not None:
+            for series, value in zip(self.series, self.sample()):
+                series.append(value)
+
+    def draw(self, renderer: Renderer):
+        if not self.visible:
+            return
+
+        rect = self.layer.content_rect
+        margin = round(6 * renderer._h_scale)
+        legend_x = rect.left + margin
+
+        for series in self.series:
+            text = fonts.gui_regular.render(
+                self.legend_size, series.name, True, series.color
+            )
+            renderer.draw_surface(1, text, (legend_x, rect.top + margin))
+            legend_x += text.get_width() + 2 * margin
+
+        # The plot starts below the legend, even if there are no series.
+        legend_height = fonts.gui_regular.of_size(self.legend_size).get_linesize()
+        plot_top = rect.top + 2 * margin + legend_height
+        plot = pg.Rect(
+            rect.left + margin,
+            plot_top,
+            rect.width - 2 * margin,
+            rect.bottom - margin - plot_top,
+        )
+        if plot.w < 2 or plot.h < 2:
+            return
+
+        for i, series in enumerate(self.series):
+            # The points are only recomputed, when there are new samples, and
+            # reused otherwise, so unchanged series are not redrawn.
+            key = (series.version, tuple(plot))
+            if key != self._points_key[i]:
+                self._points[i] = self._get_points(series, plot)
+                self._points_key[i] = key
+
+            points = self._points[i]
+            if points is not None:
+                renderer.draw_lines(1, series.color, points, round(self.line_thickness))
+
+    def _get_points(self, series: Series, plot: pg.Rect):
+        """
+        Get the points of the polyline of a series in a plot area.
+        """
+        values = series.values()
+        n = len(values)
+        if n == 0:
+            return None
+
+        # The buckets span the whole capacity, so the graph fills up from the
+        # left and then scrolls.
+        buckets = min(plot.w, series.capacity)
+        starts = np.arange(buckets) * series.capacity // buckets
+        starts = starts[starts < n]
+        lo, hi = decimate(values, starts)
+
+        bottom, top = lo.min(), hi.max()
+        if top - bottom < 1e-9:
+            bottom, top = bottom - 1, top + 1
+        scale = (plot.h - 1) / (top - bottom)
+
+        points = np.empty((2 * len(starts), 2), np.int32)
+        x = plot.left + np.arange(len(starts)) * plot.w // buckets
+        points[0::2, 0] = points[1::2, 0] = x
+        points[0::2, 1] = plot.bottom - 1 - (hi - bottom) * scale
+        points[1::2, 1] = plot.bottom - 1 - (lo - bottom) * scale
+        return points
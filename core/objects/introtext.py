@@ -3,6 +3,9 @@ from core import simulation as s
 from core.api import Renderer
 from core.types import Object
 
+# The font sizes used by the intro are loaded in the background at startup.
+assets.fonts.gui_regular.preload(28, 30, 36, 48)
+
 
 class IntroText(Object):
     def __init__(self):
@@ -83,7 +86,7 @@ class IntroText(Object):
         antialiased = True
         color = assets.colors.black
 
-        font = assets.fonts.gui_regular.of_size(size).render(text, antialiased, color)
+        font = assets.fonts.gui_regular.render(size, text, antialiased, color)
 
         if offset >= 0:
             pos = font.get_rect(midbottom=renderer.drect.center)
@@ -92,6 +95,4 @@ class IntroText(Object):
 
         pos = (pos.topleft[0], pos.topleft[1] - offset * renderer._h_scale)
 
-        font.set_alpha(alpha_val)
-
-        renderer.draw_surface(0, font, pos)
+        renderer.draw_surface(0, font, pos, alpha=alpha_val)
@@ -1,9 +1,8 @@
 from typing import Callable
 
-import numpy as np
 import pygame as pg
 
-from core.api import EventManager, Renderer, event_handler
+from core.api import Renderer
 from core.assets import fonts
 from core.types import Object
 
@@ -51,6 +50,9 @@ class Layer(Object):
         self.resize_points: Callable | None = None
         self.handler_id = -1
 
+        self._surface: pg.Surface | None = None
+        self._surface_key = None
+
     def start(self):
         def on_resize(l: Layer, r: Renderer):
             l.start_pos = r.dpos + r.dsize * l.rel_start_pos
@@ -61,8 +63,7 @@ class Layer(Object):
             l.border_rect = pg.Rect(*l.start_pos, l.rect.size[0], l.border_height)
             l.text_x_offset = r._h_scale * l.text_offset_org
 
-        handler = event_handler(type=pg.VIDEORESIZE)(on_resize)
-        self.handler_id = EventManager().add_handler(handler, l=self, r=Renderer())
+        self.handler_id = Renderer().add_layout_handler(on_resize, l=self, r=Renderer())
 
         on_resize(l=self, r=Renderer())
 
@@ -70,44 +71,57 @@ class Layer(Object):
         super().start()
 
     def draw(self, renderer: Renderer):
-        renderer.draw_color(0, self.color, self.rect)
-        renderer.draw_rect(
-            -2,
-            self.border_color,
-            self.border_rect,
-        )
-        fs = fonts.gui_regular.of_size(self.text_size).render(
-            self.title, True, self.text_color
-        )
-        renderer.draw_surface(-1, fs, self.start_pos + (self.text_x_offset, 0))
-        renderer.draw_line(
-            -1,
-            self.line_color,
-            self.rect.topleft,
-            self.rect.topright,
-            self.line_thickness,
-        )
-        renderer.draw_line(
-            -1,
-            self.line_color,
-            self.rect.topleft,
-            self.rect.bottomleft,
-            self.line_thickness,
-        )
-        renderer.draw_line(
-            -1,
-            self.line_color,
-            self.rect.topright,
-            self.rect.bottomright,
-            self.line_thickness,
-        )
-        renderer.draw_line(
-            -1,
-            self.line_color,
-            self.rect.bottomleft,
-            self.rect.bottomright,
+        key = self._get_surface_key(renderer)
+        if key != self._surface_key:
+            self._surface = self._rasterize()
+            self._surface_key = key
+
+        renderer.draw_surface(0, self._surface, self.rect.topleft)
+
+    def _get_surface_key(self, renderer: Renderer):
+        """
+        Get the properties the pre-rendered surface of the panel depends on.
+        """
+        return (
+            self.rect.size,
+            renderer._h_scale,
+            self.title,
+            tuple(self.color),
+            tuple(self.line_color),
             self.line_thickness,
+            tuple(self.border_color),
+            self.text_size,
+            tuple(self.text_color),
         )
 
+    def _rasterize(self) -> pg.Surface:
+        """
+        Render the panel into a offscreen surface.
+        """
+        w, h = self.rect.size
+        surface = pg.Surface((w, h))
+
+        surface.fill(self.color)
+        pg.draw.rect(surface, self.border_color, (0, 0, w, self.border_height))
+
+        fs = fonts.gui_regular.render(self.text_size, self.title, True, self.text_color)
+        surface.blit(fs, (self.text_x_offset, 0))
+
+        # The outline is drawn inside the edges, so it is not clipped.
+        pg.draw.rect(surface, self.line_color, (0, 0, w, h), self.line_thickness)
+
+        return surface
+
+    @property
+    def content_rect(self) -> pg.Rect:
+        """
+        The area of the panel below the border, where content can be drawn.
+        """
+        rect = self.rect.inflate(-2 * self.line_thickness, -2 * self.line_thickness)
+        top = max(rect.top, self.rect.top + int(self.border_height))
+        rect.height -= top - rect.top
+        rect.top = top
+        return rect
+
     def end(self):
-        EventManager().remove_handler(self.handler_id)
+        Renderer().remove_layout_handler(self.handler_id)
@@ -0,0 +1,200 @@
+import pygame as pg
+
+from core.api import EventManager, HandlerPolicy, InputRouter, Renderer
+from core.assets import colors, fonts
+from core.objects.graph import Graph
+from core.objects.layer import Layer
+from core.objects.zipline import Zipline
+from core.physics import Replay
+from core.types import Object
+
+# The font size of the timeline is loaded in the background at startup.
+fonts.gui_regular.preload(16)
+
+
+class ReplayPlayer(Object):
+    """
+    This class plays back a recorded run by placing the rider of a zipline and
+    filling the series of a graph from it.
+
+    The playback can be controlled with the keyboard:
+    - space        pause or resume
+    - left, right  seek a second backwards or forwards
+    - up, down     double or halve the speed
+    - home, end    seek to the start or the end
+
+    Dragging the mouse over the panel scrubs through the run, for which the
+    mouse is passed to the player by the `InputRouter`.
+
+    Attributes
+    ----------
+        replay : Replay
+            The recorded run.
+
+        layer : Layer
+            The panel of the zipline, where the timeline is drawn.
+
+        zipline : Zipline
+            The zipline to place the rider of.
+
+        graph : Graph | None
+            The graph to fill the series of with the position, velocity and
+            acceleration up to the playhead.
+
+        rider : int
+            The index of the rider to play back.
+
+        playhead : float
+            The time in the run in seconds.
+
+        speed : float
+            The playback speed.
+
+        paused : bool
+            Whether the playback is paused.
+    """
+
+    def __init__(
+        self, replay: Replay, layer: Layer, zipline: Zipline, graph: Graph | None
+    ):
+        name = "replay_player"
+        super().__init__(name)
+
+        self.replay = replay
+        self.layer = layer
+        self.zipline = zipline
+        self.graph = graph
+        self.rider = 0
+
+        self.playhead = replay.start
+        self.speed = 1.0
+        self.paused = False
+
+        self._scrubbing = False
+        self._shown_playhead = None
+        self._handler_id = -1
+
+    def start(self):
+        self._handler_id = EventManager().add_new_handler(
+            self._on_key, pg.KEYDOWN, pass_event=True, policy=HandlerPolicy.EVERY
+        )
+        InputRouter().add(self)
+        self.seek(self.playhead)
+
+    def end(self):
+        EventManager().remove_handler(self._handler_id)
+        InputRouter().remove(self)
+        self._scrubbing = False
+
+    def seek(self, time: float):
+        """
+        Move the playhead, clamped to the run.
+        """
+        self.playhead = min(max(time, self.replay.start), self.replay.end)
+        position = self.replay.sample("position", self.playhead)[self.rider]
+        self.zipline.show(float(position))
+
+    def _on_key(self, event):
+        if event.key == pg.K_SPACE:
+            if self.playhead >= self.replay.end:
+                self.seek(self.replay.start)
+            self.paused = not self.paused
+        elif event.key == pg.K_LEFT:
+            self.seek(self.playhead - 1)
+        elif event.key == pg.K_RIGHT:
+            self.seek(self.playhead + 1)
+        elif event.key == pg.K_UP:
+            self.speed = min(self.speed * 2, 64)
+        elif event.key == pg.K_DOWN:
+            self.speed = max(self.speed / 2, 1 / 64)
+        elif event.key == pg.K_HOME:
+            self.seek(self.replay.start)
+        elif event.key == pg.K_END:
+            self.seek(self.replay.end)
+
+    @property
+    def rect(self) -> pg.Rect:
+        """
+        The area, where the mouse scrubs through the run.
+        """
+        return self.layer.content_rect
+
+    def on_mouse_enter(self):
+        pass
+
+    def on_mouse_leave(self):
+        pass
+
+    def on_mouse_down(self, event):
+        if event.button == 1:
+            self._scrubbing = True
+            self._scrub(event.pos[0])
+
+    def on_mouse_up(self, event):
+        if event.button == 1:
+            self._scrubbing = False
+
+    def on_mouse_motion(self, event):
+        if self._scrubbing:
+            self._scrub(event.pos[0])
+
+    def _scrub(self, x):
+        track = self._get_track()
+        fraction = (x - track.left) / max(track.w, 1)
+        self.seek(self.replay.start + fraction * self.replay.duration)
+
+    def update(self, dt: float):
+        if self.paused or self._scrubbing:
+            return
+
+        self.seek(self.playhead + dt * self.speed)
+        if self.playhead >= self.replay.end:
+            self.paused = True
+
+    def draw(self, renderer: Renderer):
+        if self.graph is not None and self.playhead != self._shown_playhead:
+            self._fill_graph()
+            self._shown_playhead = self.playhead
+
+        track = self._get_track()
+        if track.w <= 0:
+            return
+
+        thickness = max(1, round(2 * renderer._h_scale))
+        fraction = (self.playhead - self.replay.start) / max(self.replay.duration, 1e-9)
+        x = track.left + round(fraction * track.w)
+        radius = max(3, round(5 * renderer._h_scale))
+
+        renderer.draw_line(
+            1, colors.dark_gray, track.topleft, track.topright, thickness
+        )
+        renderer.draw_line(1, colors.blue, track.topleft, (x, track.top), thickness)
+        renderer.draw_circle(1, colors.blue, (x, track.top), radius)
+
+        state = "paused" if self.paused else f"x{self.speed:g}"
+        text = f"{self.playhead:.1f} / {self.replay.end:.1f} s  {state}"
+        surface = fonts.gui_regular.render(16, text, True, colors.black)
+        pos = (
+            track.right - surface.get_width(),
+            track.top - radius - surface.get_height(),
+        )
+        renderer.draw_surface(1, surface, pos)
+
+    def _get_track(self) -> pg.Rect:
+        """
+        Get the line of the timeline along the bottom of the panel.
+        """
+        rect = self.layer.content_rect
+        margin = round(0.05 * rect.w)
+        return pg.Rect(rect.left + margin, rect.bottom - margin, rect.w - 2 * margin, 0)
+
+    def _fill_graph(self):
+        """
+        Fill the series of the graph with the rows up to the playhead, which
+        only reads the pages of the run around the playhead.
+        """
+        names = ("position", "velocity", "acceleration")
+        for series, name in zip(self.graph.series, names):
+            rows = self.replay.window(name, self.playhead, series.capacity)
+            series.clear()
+            series.extend(rows[:, self.rider])
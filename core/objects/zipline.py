@@ -0,0 +1,191 @@
+import numpy as np
+import pygame as pg
+
+import core.simulation as s
+from core.api import Renderer
+from core.assets import colors
+from core.objects.layer import Layer
+from core.physics import TelemetryRecorder, ZiplineEngine
+from core.types import Object
+
+
+class Zipline(Object):
+    """
+    This class simulates a rider on a zipline and draws it inside a panel.
+
+    The cable is drawn from the lookup tables of it's geometry, which are shared
+    with the engine, so the cable is solved once for both.
+
+    Attributes
+    ----------
+        layer : Layer
+            The panel to draw the zipline in.
+
+        engine : ZiplineEngine
+            The engine simulating the rider.
+
+        start_height : float
+            The height of the upper anchor above the ground in meters.
+
+        restart_delay : float
+            The number of seconds to wait, before a rider that is done starts
+            over.
+
+        time : float
+            The simulated time since the object was started in seconds.
+
+        recorder : TelemetryRecorder | None
+            The recorder of the rider, if the simulation has a record directory.
+
+        config : dict
+            The parameters of the zipline, which are stored with a recording.
+
+        simulate : bool
+            Whether the rider is simulated. Otherwise it is placed by `show`,
+            e.g. when replaying a recording.
+    """
+
+    def __init__(
+        self,
+        layer: Layer,
+        span=100.0,
+        start_height=20.0,
+        end_height=10.0,
+        sag=3.0,
+        mass=80.0,
+        restart_delay=2.0,
+    ):
+        name = "zipline"
+        super().__init__(name)
+
+        self.layer = layer
+        self.start_height = start_height
+        self.restart_delay = restart_delay
+        self.config = {
+            "span": span,
+            "start_height": start_height,
+            "end_height": end_height,
+            "sag": sag,
+            "mass": mass,
+        }
+        self.simulate = True
+        self.engine = ZiplineEngine(
+            span=span, drop=start_height - end_height, sag=sag, mass=mass
+        )
+        self.cable = self.engine.cables[0]
+
+        self.time = 0.0
+        self.recorder: TelemetryRecorder | None = None
+
+        self._prev_position = 0.0
+        self._idle_time = 0.0
+
+        self._transform_key = None
+        self._scale = 1.0
+        self._origin = np.zeros(2)
+        self._cable_points: np.ndarray | None = None
+
+    def start(self):
+        directory = s.Simulation().record_directory
+        if directory is not None and self.simulate:
+            self.recorder = TelemetryRecorder(
+                self.engine.count, directory=directory, config=self.config
+            )
+
+    def show(self, position: float):
+        """
+        Place the rider without simulating it.
+
+        Parameters
+        ----------
+            position : float
+                The distance of the rider along the cable in meters.
+        """
+        self._prev_position = position
+        self.engine.position[0] = position
+
+    def update(self, dt: float):
+        if not self.simulate:
+            return
+
+        engine = self.engine
+        self._prev_position = engine.position[0]
+        self.time += dt
+
+        if engine.active[0]:
+            engine.step(dt)
+        else:
+            self._idle_time += dt
+            if self._idle_time >= self.restart_delay:
+                self._idle_time = 0.0
+                engine.reset()
+                self._prev_position = 0.0
+
+        if self.recorder is not None:
+            self.recorder.record(engine, self.time)
+
+    def end(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def draw(self, renderer: Renderer):
+        rect = self.layer.content_rect
+        if rect.w <= 0 or rect.h <= 0:
+            return
+
+        key = tuple(rect)
+        if key != self._transform_key:
+            self._layout(rect)
+            self._transform_key = key
+
+        thickness = max(1, round(2 * renderer._h_scale))
+        ground_l = self._to_screen(0.0, -self.start_height)
+        ground_r = self._to_screen(self.cable.span, -self.start_height)
+        anchor_l = self._to_screen(0.0, 0.0)
+        anchor_r = self._to_screen(self.cable.span, -self.cable.drop)
+
+        renderer.draw_line(1, colors.dark_green, ground_l, ground_r, thickness)
+        renderer.draw_line(1, colors.dark_gray, ground_l, anchor_l, thickness)
+        renderer.draw_line(
+            1, colors.dark_gray, (anchor_r[0], ground_r[1]), anchor_r, thickness
+        )
+        renderer.draw_lines(1, colors.black, self._cable_points, thickness)
+
+        # The rider is drawn between the last two ticks for smooth motion.
+        position = self._prev_position + renderer.interpolation * (
+            self.engine.position[0] - self._prev_position
+        )
+        x, y = self.cable.query(position)[:2]
+        radius = max(2, round(6 * renderer._h_scale))
+        rider = self._to_screen(float(x), float(y))
+        renderer.draw_circle(1, colors.red, (rider[0], rider[1] + radius), radius)
+
+    def _layout(self, rect: pg.Rect):
+        """
+        Fit the zipline into an area of the screen.
+        """
+        margin = 0.1 * min(rect.size)
+        width = self.cable.span
+        height = self.start_height
+
+        self._scale = min((rect.w - 2 * margin) / width, (rect.h - 2 * margin) / height)
+        self._origin = np.array(
+            (
+                rect.centerx - self._scale * width / 2,
+                rect.centery - self._scale * height / 2,
+            )
+        )
+
+        # At most a point every few pixels is needed for a smooth curve.
+        step = max(1, int(len(self.cable.x) / (self._scale * self.cable.length / 4)))
+        x = np.append(self.cable.x[::step], self.cable.x[-1])
+        y = np.append(self.cable.y[::step], self.cable.y[-1])
+        self._cable_points = self._to_screen(x, y).T.round().astype(int)
+
+    def _to_screen(self, x, y) -> np.ndarray:
+        """
+        Convert coordinates in meters relative to the upper anchor to the screen.
+        """
+        points = np.array((x, -y), np.float64)
+        return (self._scale * points.T + self._origin).T
@@ -0,0 +1,5 @@
+from core.physics.cable import CableGeometry, cable_geometry
+from core.physics.engine import ZiplineEngine
+from core.physics.replay import Replay
+from core.physics.sweep import PARAMETERS, RESULTS, grid, sweep
+from core.physics.telemetry import CHANNELS, TelemetryRecorder, read_run
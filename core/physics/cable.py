@@ -0,0 +1,250 @@
+from functools import lru_cache
+
+import numpy as np
+
+
+class CableGeometry:
+    """
+    This class describes the shape of a cable by lookup tables.
+
+    The upper anchor is at `(0, 0)` and the lower anchor at `(span, -drop)`. A
+    sagging cable hangs as a catenary, which is solved once, when the geometry
+    is created. The tables are sampled at equal distances along the cable, so
+    queries by distance along the cable are a linear interpolation.
+
+    Attributes
+    ----------
+        span : float
+            The horizontal distance between the anchors in meters.
+
+        drop : float
+            The height of the upper anchor above the lower anchor in meters.
+
+        sag : float
+            The vertical distance between the cable and the straight line
+            between the anchors at mid-span in meters.
+
+        length : float
+            The length of the cable in meters.
+
+        x : numpy.ndarray[float64]
+            The horizontal position of each sample in meters.
+
+        y : numpy.ndarray[float64]
+            The vertical position of each sample in meters.
+
+        sin : numpy.ndarray[float64]
+            The sine of the descent angle of the cable at each sample, which is
+            positive where the cable goes downwards.
+
+        cos : numpy.ndarray[float64]
+            The cosine of the descent angle of the cable at each sample.
+
+        curvature : numpy.ndarray[float64]
+            The curvature of the cable at each sample in 1 / meters.
+    """
+
+    def __init__(self, span, drop, sag=0.0, samples=512):
+        """
+        Solve the shape of the cable and sample it.
+
+        Parameters
+        ----------
+            span : float
+                The horizontal distance between the anchors in meters.
+            drop : float
+                The height of the upper anchor above the lower anchor in meters.
+            sag : float, default 0.0
+                The vertical distance between the cable and the straight line
+                between the anchors at mid-span in meters.
+            samples : int, default 512
+                The number of samples along the cable.
+
+        Raises
+        ------
+            ValueError
+                If the span is not positive, the sag is negative or the sag is
+                too large to be solved.
+        """
+        if span <= 0:
+            raise ValueError("The span must be positive.")
+        if sag < 0:
+            raise ValueError("The sag must not be negative.")
+
+        self.span = span
+        self.drop = drop
+        self.sag = sag
+        self.samples = samples
+
+        if sag == 0:
+            self.length = float(np.hypot(span, drop))
+            s = np.linspace(0.0, self.length, samples)
+            self.x = s * span / self.length
+            self.y = -s * drop / self.length
+            self.sin = np.full(samples, drop / self.length)
+            self.cos = np.full(samples, span / self.length)
+            self.curvature = np.zeros(samples)
+        else:
+            a, x0 = solve_catenary(span, drop, sag)
+            # The arc length from the upper anchor is a * (sinh(u) - sinh(u0)),
+            # with u = (x - x0) / a, which can be inverted in closed form.
+            u0 = -x0 / a
+            self.length = float(a * (np.sinh((span - x0) / a) - np.sinh(u0)))
+            s = np.linspace(0.0, self.length, samples)
+            u = np.arcsinh(s / a + np.sinh(u0))
+            self.x = x0 + a * u
+            self.y = a * (np.cosh(u) - np.cosh(u0))
+            self.sin = -np.tanh(u)
+            self.cos = 1 / np.cosh(u)
+            self.curvature = 1 / (a * np.cosh(u) ** 2)
+
+        self._ds = self.length / (samples - 1)
+
+    def query(self, s):
+        """
+        Interpolate the tables at distances along the cable.
+
+        Parameters
+        ----------
+            s : ArrayLike
+                The distances along the cable from the upper anchor in meters.
+                Distances outside of the cable are clamped to it's ends.
+
+        Returns
+        -------
+            tuple[numpy.ndarray, ...]
+                The interpolated `x`, `y`, `sin`, `cos` and `curvature`.
+        """
+        i, f = self._locate(s)
+        return tuple(
+            table[i] * (1 - f) + table[i + 1] * f
+            for table in (self.x, self.y, self.sin, self.cos, self.curvature)
+        )
+
+    def _locate(self, s):
+        """
+        Get the index of the sample before each distance and the fraction of the
+        way to the next sample.
+        """
+        t = np.clip(np.asarray(s, np.float64) / self._ds, 0, self.samples - 1)
+        i = np.minimum(t.astype(np.intp), self.samples - 2)
+        return i, t - i
+
+
+class CableSet:
+    """
+    This class stacks the lookup tables of several cables, so the cables of many
+    riders are queried at once.
+
+    Attributes
+    ----------
+        cables : list[CableGeometry]
+            The stacked cables, which must have the same number of samples.
+    """
+
+    def __init__(self, cables, names=("sin", "cos", "curvature")):
+        """
+        Stack the lookup tables of cables.
+
+        Parameters
+        ----------
+            cables : Iterable[CableGeometry]
+                The cables to stack.
+            names : Iterable[str], default ("sin", "cos", "curvature")
+                The names of the tables to stack.
+        """
+        self.cables = list(cables)
+        self.samples = self.cables[0].samples
+        self._names = tuple(names)
+        self._tables = [
+            np.concatenate([getattr(cable, name) for cable in self.cables])
+            for name in self._names
+        ]
+        self._ds = np.array([cable._ds for cable in self.cables])
+
+    def query(self, index, s):
+        """
+        Interpolate the stacked tables at distances along the cables.
+
+        Parameters
+        ----------
+            index : numpy.ndarray[intp]
+                The index of the cable of each distance.
+            s : numpy.ndarray[float64]
+                The distances along the cables from the upper anchor in meters.
+
+        Returns
+        -------
+            tuple[numpy.ndarray, ...]
+                The interpolated tables in the order of their names.
+        """
+        n = self.samples
+        t = np.clip(s / self._ds[index], 0, n - 1)
+        i = np.minimum(t.astype(np.intp), n - 2)
+        f = t - i
+        i += index * n
+        return tuple(table[i] * (1 - f) + table[i + 1] * f for table in self._tables)
+
+
+def solve_catenary(span, drop, sag, tolerance=1e-9):
+    """
+    Solve the catenary `y = a * cosh((x - x0) / a) + c` through `(0, 0)` and
+    `(span, -drop)`, that sags `sag` below the straight line at mid-span.
+
+    The sag decreases monotonically with `a`, so `a` is found by bisection.
+
+    Parameters
+    ----------
+        span : float
+            The horizontal distance between the anchors.
+        drop : float
+            The height of the first anchor above the second anchor.
+        sag : float
+            The positive sag at mid-span.
+        tolerance : float, default 1e-9
+            The relative tolerance of `a`.
+
+    Returns
+    -------
+        tuple[float, float]
+            The parameter `a` and the horizontal position `x0` of the vertex.
+
+    Raises
+    ------
+        ValueError
+            If the sag is too large to be solved.
+    """
+
+    def vertex(a):
+        return span / 2 + a * np.arcsinh(drop / (2 * a * np.sinh(span / (2 * a))))
+
+    def sag_of(a):
+        x0 = vertex(a)
+        y_mid = a * (np.cosh((span / 2 - x0) / a) - np.cosh(x0 / a))
+        return -drop / 2 - y_mid
+
+    # The bounds keep cosh from overflowing.
+    lo, hi = span / 1000, span * 1e6
+    if sag_of(lo) < sag:
+        raise ValueError("The sag is too large.")
+
+    while hi / lo > 1 + tolerance:
+        mid = np.sqrt(lo * hi)
+        if sag_of(mid) > sag:
+            lo = mid
+        else:
+            hi = mid
+
+    a = float(np.sqrt(lo * hi))
+    return a, float(vertex(a))
+
+
+@lru_cache(maxsize=128)
+def cable_geometry(span, drop, sag=0.0, samples=512) -> CableGeometry:
+    """
+    Get the geometry of a cable, reusing the geometry of recently used
+    cables of the same configuration.
+
+    See `CableGeometry` for the parameters.
+    """
+    return CableGeometry(float(span), float(drop), float(sag), samples)
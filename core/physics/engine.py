@@ -0,0 +1,271 @@
+import numpy as np
+
+from core.physics.cable import CableSet, cable_geometry
+
+
+class ZiplineEngine:
+    """
+    This class integrates the motion of riders along zipline cables.
+
+    The state and the parameters of the riders are stored as NumPy arrays with
+    an element for each rider, so a single call to `step` advances all riders
+    at once. Each rider can have it's own cable and parameters, so the riders
+    can just as well be variants of a configuration to evaluate.
+
+    The cables are straight, or sag as a catenary. The geometry of each distinct
+    cable is solved once and then looked up by the position along the cable, so
+    a step costs the same no matter the shape of the cables.
+
+    A rider starts at rest at the upper anchor and moves along the cable under
+    gravity, while rolling resistance, aerodynamic drag and, past the brake
+    position, a braking force act against the motion. A rider is done when it
+    arrives at the lower anchor, when it comes to rest and the resistance is
+    larger than the force moving it, or when it comes to rest at the upper
+    anchor, e.g. on a cable rising towards the other anchor.
+
+    This module does not depend on pygame, so it can be used without a window.
+
+    Attributes
+    ----------
+        count : int
+            The number of riders.
+
+        time : float
+            The simulated time in seconds.
+
+        position : numpy.ndarray[float64]
+            The distance of each rider along the cable from the upper anchor in
+            meters.
+
+        velocity : numpy.ndarray[float64]
+            The velocity of each rider along the cable in meters per second.
+
+        acceleration : numpy.ndarray[float64]
+            The acceleration of each rider along the cable in the last step in
+            meters per second squared.
+
+        normal_force : numpy.ndarray[float64]
+            The force between each rider and the cable perpendicular to it in
+            the last step in newtons.
+
+        braking_force : numpy.ndarray[float64]
+            The force of the brake on each rider in the last step in newtons.
+
+        active : numpy.ndarray[bool]
+            Whether each rider is still moving.
+
+        arrival_time : numpy.ndarray[float64]
+            The time each rider arrived at the lower anchor, or `nan`.
+
+        impact_speed : numpy.ndarray[float64]
+            The speed each rider arrived at the lower anchor with, or `nan`.
+
+        peak_speed : numpy.ndarray[float64]
+            The highest speed of each rider.
+
+        length : numpy.ndarray[float64]
+            The length of the cable of each rider in meters.
+
+        cables : list[CableGeometry]
+            The geometry of each distinct cable.
+
+        cable_index : numpy.ndarray[intp]
+            The index of the cable of each rider in `cables`.
+    """
+
+    def __init__(
+        self,
+        count=1,
+        *,
+        span=100.0,
+        drop=10.0,
+        sag=0.0,
+        mass=80.0,
+        drag_coefficient=1.0,
+        frontal_area=0.5,
+        rolling_resistance=0.005,
+        brake_position=np.inf,
+        brake_force=0.0,
+        air_density=1.225,
+        gravity=9.81,
+    ):
+        """
+        Initialize the engine.
+
+        Each parameter is either a scalar shared by all riders, or an array with
+        an element for each rider.
+
+        Parameters
+        ----------
+            count : int, default 1
+                The number of riders.
+            span : ArrayLike, default 100.0
+                The horizontal distance between the anchors in meters.
+            drop : ArrayLike, default 10.0
+                The height of the upper anchor above the lower anchor in meters.
+            sag : ArrayLike, default 0.0
+                The vertical distance between the cable and the straight line
+                between the anchors at mid-span in meters.
+            mass : ArrayLike, default 80.0
+                The mass of the rider and trolley in kilograms.
+            drag_coefficient : ArrayLike, default 1.0
+                The aerodynamic drag coefficient of the rider.
+            frontal_area : ArrayLike, default 0.5
+                The frontal area of the rider in square meters.
+            rolling_resistance : ArrayLike, default 0.005
+                The rolling resistance coefficient of the trolley.
+            brake_position : ArrayLike, default inf
+                The distance along the cable, where the brake starts acting, in
+                meters.
+            brake_force : ArrayLike, default 0.0
+                The force of the brake in newtons.
+            air_density : ArrayLike, default 1.225
+                The density of the air in kilograms per cubic meter.
+            gravity : ArrayLike, default 9.81
+                The gravitational acceleration in meters per second squared.
+        """
+        self.count = count
+
+        def as_array(value):
+            return np.broadcast_to(np.asarray(value, np.float64), (count,)).copy()
+
+        self.span = as_array(span)
+        self.drop = as_array(drop)
+        self.sag = as_array(sag)
+        self.mass = as_array(mass)
+        self.rolling_resistance = as_array(rolling_resistance)
+        self.brake_position = as_array(brake_position)
+        self.brake_force = as_array(brake_force)
+        self.gravity = as_array(gravity)
+
+        # Constant factors of the forces, so each step is only a few operations.
+        rho_cd_a = as_array(air_density) * as_array(drag_coefficient)
+        rho_cd_a *= as_array(frontal_area)
+        self._drag_factor = 0.5 * rho_cd_a / self.mass
+        self._brake_deceleration = self.brake_force / self.mass
+
+        configs = np.stack((self.span, self.drop, self.sag), axis=1)
+        unique, self.cable_index = np.unique(configs, axis=0, return_inverse=True)
+        self.cable_index = self.cable_index.reshape(count)
+        self.cables = [cable_geometry(*config) for config in unique.tolist()]
+
+        self.length = np.array([cable.length for cable in self.cables])
+        self.length = self.length[self.cable_index]
+        self._sin = self.drop / self.length
+        self._cos = self.span / self.length
+
+        # The slope of a straight cable is constant, so it is only looked up, if
+        # any cable sags.
+        self._cable_set = CableSet(self.cables) if (self.sag != 0).any() else None
+
+        self.reset()
+
+    def reset(self):
+        """
+        Place all riders at rest at the upper anchor.
+        """
+        n = self.count
+        self.time = 0.0
+        self.position = np.zeros(n)
+        self.velocity = np.zeros(n)
+        self.acceleration = np.zeros(n)
+        self.normal_force = np.zeros(n)
+        self.braking_force = np.zeros(n)
+        self.active = np.ones(n, bool)
+        self.arrival_time = np.full(n, np.nan)
+        self.impact_speed = np.full(n, np.nan)
+        self.peak_speed = np.zeros(n)
+
+    def step(self, dt: float):
+        """
+        Advance all riders by a time step using semi-implicit Euler integration.
+
+        Parameters
+        ----------
+            dt : float
+                The time step in seconds.
+        """
+        v = self.velocity
+        x = self.position
+        active = self.active
+
+        if self._cable_set is None:
+            sin, normal = self._sin, self.gravity * self._cos
+        else:
+            sin, cos, curvature = self._cable_set.query(self.cable_index, x)
+            # The cable also provides the centripetal force along it's curve.
+            normal = self.gravity * cos + curvature * v * v
+
+        # The accelerations pulling the rider along, and resisting it's motion.
+        driving = self.gravity * sin - self._drag_factor * v * np.abs(v)
+        braking = np.where(x >= self.brake_position, self._brake_deceleration, 0.0)
+        resisting = self.rolling_resistance * normal + braking
+
+        # At rest, the resistance only holds the rider, up to it's magnitude.
+        at_rest = v == 0
+        a = np.where(
+            at_rest,
+            np.sign(driving) * np.maximum(np.abs(driving) - resisting, 0.0),
+            driving - np.sign(v) * resisting,
+        )
+        a[~active] = 0.0
+
+        v_new = v + a * dt
+        # The resistance stops a rider, but never reverses it.
+        v_new[v * v_new < 0] = 0.0
+        x_new = x + v_new * dt
+
+        arrived = active & (x_new >= self.length)
+        if arrived.any():
+            # Interpolate the time of arrival within the step.
+            fraction = (self.length - x) / np.where(x_new > x, x_new - x, 1.0)
+            self.arrival_time[arrived] = self.time + dt * fraction[arrived]
+            self.impact_speed[arrived] = np.abs(v_new[arrived])
+            x_new[arrived] = self.length[arrived]
+
+        # A rider rolling back is held at the upper anchor.
+        rolled_back = x_new < 0
+        x_new[rolled_back] = 0.0
+        v_new[rolled_back] = 0.0
+
+        # A rider held at the upper anchor is done, even if it's pulled back.
+        stalled = active & (v_new == 0) & at_rest & ((a == 0) | rolled_back)
+
+        self.acceleration = a
+        self.normal_force = self.mass * normal
+        self.braking_force = self.mass * braking
+        self.velocity = np.where(active, v_new, v)
+        self.position = np.where(active, x_new, x)
+        self.peak_speed = np.maximum(self.peak_speed, np.abs(self.velocity))
+        self.active = active & ~arrived & ~stalled
+        self.time += dt
+
+    def coordinates(self):
+        """
+        Get the coordinates of the riders relative to the upper anchor.
+
+        Returns
+        -------
+            tuple[numpy.ndarray, numpy.ndarray]
+                The horizontal and vertical position of each rider in meters.
+        """
+        x = np.empty(self.count)
+        y = np.empty(self.count)
+        for i, cable in enumerate(self.cables):
+            riders = self.cable_index == i
+            x[riders], y[riders] = cable.query(self.position[riders])[:2]
+        return x, y
+
+    def run(self, dt: float, max_time: float):
+        """
+        Step the riders until none are active, or the time limit is reached.
+
+        Parameters
+        ----------
+            dt : float
+                The time step in seconds.
+            max_time : float
+                The maximum simulated time in seconds.
+        """
+        while self.active.any() and self.time < max_time:
+            self.step(dt)
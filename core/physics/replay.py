@@ -0,0 +1,161 @@
+import numpy as np
+
+from core.physics.telemetry import read_run
+
+
+class Replay:
+    """
+    This class provides random access to a recorded run by time.
+
+    The columns of the run are memory-mapped, so only the pages around the
+    accessed rows are read from the disk, and runs larger than the memory can
+    be replayed. Seeking to a time is constant time: the row is computed from
+    the recording interval, or if the rows are not evenly spaced, looked up in
+    an index of evenly spaced times.
+
+    Attributes
+    ----------
+        directory : str
+            The run directory.
+
+        meta : dict
+            The content of the run's `meta.json`.
+
+        columns : dict[str, numpy.ndarray]
+            The memory-mapped columns by their name.
+
+        rows : int
+            The number of rows.
+
+        start : float
+            The time of the first row in seconds.
+
+        end : float
+            The time of the last row in seconds.
+    """
+
+    def __init__(self, directory, index_size=4096):
+        """
+        Open a recorded run.
+
+        Parameters
+        ----------
+            directory : str
+                The run directory written by `TelemetryRecorder`.
+            index_size : int, default 4096
+                The number of evenly spaced times in the index, which is only
+                built if the rows are not evenly spaced.
+
+        Raises
+        ------
+            ValueError
+                If the run has no rows.
+        """
+        self.directory = directory
+        self.meta, self.columns = read_run(directory)
+        self.rows = self.meta["rows"]
+        if self.rows == 0:
+            raise ValueError("The run has no rows.")
+
+        time = self.columns["time"]
+        self.start = float(time[0])
+        self.end = float(time[-1])
+
+        self._interval = self.meta["interval"]
+        self._index = None
+        if self._interval is None and self.rows > 1:
+            # The first row at or after each of the evenly spaced times.
+            self._step = (self.end - self.start) / index_size
+            times = self.start + self._step * np.arange(index_size + 1)
+            self._index = np.searchsorted(time, times)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    @property
+    def config(self) -> dict:
+        """
+        The additional information about the run, see `TelemetryRecorder`.
+        """
+        return self.meta.get("config", {})
+
+    def seek(self, time: float) -> tuple[int, float]:
+        """
+        Find the rows around a time.
+
+        Parameters
+        ----------
+            time : float
+                The time in seconds, which is clamped to the run.
+
+        Returns
+        -------
+            tuple[int, float]
+                The index of the last row at or before the time, and the
+                fraction of the way to the next row.
+        """
+        last = self.rows - 1
+        if last == 0 or time <= self.start:
+            return 0, 0.0
+        if time >= self.end:
+            return last, 0.0
+
+        if self._index is None:
+            u = (time - self.start) / self._interval
+            i = min(int(u), last - 1)
+            return i, u - i
+
+        # The row is searched between the rows of the neighbouring times of
+        # the index, which are only a few rows.
+        b = min(int((time - self.start) / self._step), len(self._index) - 2)
+        lo = max(int(self._index[b]) - 1, 0)
+        hi = int(self._index[b + 1]) + 1
+        times = self.columns["time"]
+        i = lo + int(np.searchsorted(times[lo:hi], time, "right")) - 1
+        i = min(max(i, 0), last - 1)
+        t0, t1 = times[i], times[i + 1]
+        return i, float((time - t0) / (t1 - t0)) if t1 > t0 else 0.0
+
+    def sample(self, name, time: float) -> np.ndarray:
+        """
+        Interpolate a channel at a time.
+
+        Parameters
+        ----------
+            name : str
+                The name of the channel.
+            time : float
+                The time in seconds, which is clamped to the run.
+
+        Returns
+        -------
+            numpy.ndarray
+                The value of each rider.
+        """
+        i, f = self.seek(time)
+        column = self.columns[name]
+        if f == 0.0:
+            return np.asarray(column[i], np.float64)
+        return column[i] * (1 - f) + column[i + 1] * f
+
+    def window(self, name, time: float, rows: int) -> np.ndarray:
+        """
+        Get the rows of a channel up to a time.
+
+        Parameters
+        ----------
+            name : str
+                The name of the channel.
+            time : float
+                The time of the last row in seconds.
+            rows : int
+                The maximum number of rows.
+
+        Returns
+        -------
+            numpy.ndarray
+                A view of the rows of the memory-mapped column.
+        """
+        i, _ = self.seek(time)
+        return self.columns[name][max(0, i + 1 - rows) : i + 1]
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from core.physics.engine import ZiplineEngine
+
+if TYPE_CHECKING:
+    # pandas takes a while to import, so it is only imported once a sweep is
+    # actually run, and not whenever the simulation starts.
+    import pandas as pd
+
+# The parameters of a configuration and their default values.
+PARAMETERS = {
+    "span": 100.0,
+    "start_height": 20.0,
+    "end_height": 10.0,
+    "sag": 0.0,
+    "mass": 80.0,
+    "drag_coefficient": 1.0,
+    "frontal_area": 0.5,
+    "rolling_resistance": 0.005,
+    "brake_position": np.inf,
+    "brake_force": 0.0,
+}
+
+# The results of a configuration.
+RESULTS = ("arrival_time", "peak_speed", "impact_speed")
+
+
+def grid(**axes) -> pd.DataFrame:
+    """
+    Create the configurations of every combination of the given values.
+
+    Parameters
+    ----------
+        The keyword-arguments are names of `PARAMETERS` mapped to an iterable of
+        values to combine.
+
+    Returns
+    -------
+        pandas.DataFrame
+            The configurations with a column for each given parameter.
+
+    Example
+    -------
+        >>> grid(span=[100, 200], mass=[60, 80, 100])  # 6 configurations
+    """
+    import pandas as pd
+
+    names = list(axes)
+    rows = itertools.product(*(axes[name] for name in names))
+    return pd.DataFrame(rows, columns=names)
+
+
+def sweep(configs, dt=1e-3, max_time=600.0, workers=None, chunk_size=None):
+    """
+    Simulate a rider for each configuration on multiple processes.
+
+    The configurations are split into chunks, which are simulated in a single
+    vectorized engine each, and spread over a pool of processes. The workers
+    only import `core.physics`, so they do not load pygame.
+
+    On Windows, this function must be called from a `if __name__ == "__main__"`
+    block, as the workers import the main module.
+
+    Parameters
+    ----------
+        configs : pandas.DataFrame | dict[str, ArrayLike] | list[dict]
+            The configurations with a column for some of the `PARAMETERS`. Any
+            missing parameter is set to it's default value.
+        dt : float, default 1e-3
+            The time step in seconds.
+        max_time : float, default 600.0
+            The maximum simulated time of a configuration in seconds.
+        workers : int | None, default None
+            The number of processes. The number of CPUs is used if `None` is
+            given. With a single worker, everything is run in this process.
+        chunk_size : int | None, default None
+            The number of configurations in each chunk. If `None` is given, the
+            configurations are split into 4 chunks for each worker.
+
+    Returns
+    -------
+        pandas.DataFrame
+            The configurations with all parameters and a column for each of the
+            `RESULTS`. The arrival time and impact speed are `nan` for riders,
+            that did not arrive.
+
+    Raises
+    ------
+        ValueError
+            If a column is not one of the `PARAMETERS`.
+    """
+    import pandas as pd
+
+    frame = pd.DataFrame(configs).reset_index(drop=True)
+
+    unknown = set(frame.columns) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+
+    for name, default in PARAMETERS.items():
+        if name not in frame:
+            frame[name] = default
+
+    n = len(frame)
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, math.ceil(n / (4 * workers)))
+
+    columns = {name: frame[name].to_numpy(np.float64) for name in PARAMETERS}
+
+    # A chunk is simulated until it's slowest rider is done, so configurations
+    # of similar duration are put into the same chunk.
+    order = np.argsort(_estimate_duration(columns, max_time), kind="stable")
+    columns = {name: column[order] for name, column in columns.items()}
+
+    chunks = [
+        {name: column[i : i + chunk_size] for name, column in columns.items()}
+        for i in range(0, n, chunk_size)
+    ]
+    args = (chunks, itertools.repeat(dt), itertools.repeat(max_time))
+
+    if workers == 1:
+        results = list(map(_run_chunk, *args))
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            results = list(executor.map(_run_chunk, *args))
+
+    for name in RESULTS:
+        values = np.empty(n)
+        if n:
+            values[order] = np.concatenate([r[name] for r in results])
+        frame[name] = values
+
+    return frame
+
+
+def _estimate_duration(columns, max_time):
+    """
+    Estimate the duration of each configuration, ignoring any resistance.
+
+    A cable, which does not descend, has no estimate, so it's configurations
+    are assumed to take the maximum time.
+    """
+    span = columns["span"]
+    drop = columns["start_height"] - columns["end_height"]
+    length = np.hypot(span, drop)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        duration = np.sqrt(2 * length**2 / (9.81 * drop))
+    return np.fmin(np.nan_to_num(duration, nan=max_time), max_time)
+
+
+def _run_chunk(columns, dt, max_time):
+    """
+    Simulate a chunk of configurations in a single engine.
+    """
+    engine = ZiplineEngine(
+        len(columns["span"]),
+        span=columns["span"],
+        drop=columns["start_height"] - columns["end_height"],
+        sag=columns["sag"],
+        mass=columns["mass"],
+        drag_coefficient=columns["drag_coefficient"],
+        frontal_area=columns["frontal_area"],
+        rolling_resistance=columns["rolling_resistance"],
+        brake_position=columns["brake_position"],
+        brake_force=columns["brake_force"],
+    )
+    engine.run(dt, max_time)
+    return {name: getattr(engine, name) for name in RESULTS}
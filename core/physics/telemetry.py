@@ -0,0 +1,424 @@
+import json
+import math
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+# The channels recorded by default, which are attributes of `ZiplineEngine`.
+CHANNELS = ("position", "velocity", "acceleration", "normal_force", "braking_force")
+
+
+class TelemetryRecorder:
+    """
+    This class records the state of the riders of an engine into preallocated,
+    typed columns.
+
+    Each channel is stored in chunks of `chunk_size` rows with a column for each
+    rider, along with the simulated time of each row. Chunks are allocated up
+    front and filled row by row, so recording a tick does not allocate. Full
+    chunks are kept in memory up to the memory budget, after which the oldest
+    chunks are appended to the run directory by a background thread and their
+    memory is reused for new chunks.
+
+    The run directory contains a raw file of each channel and of the time, and
+    after the recorder is closed, a `meta.json` describing them. It can be read
+    with `read_run`.
+
+    Attributes
+    ----------
+        riders : int
+            The number of riders recorded.
+
+        channels : tuple[str, ...]
+            The names of the recorded attributes of the engine.
+
+        decimation : int
+            A row is recorded every `decimation` ticks.
+
+        chunk_size : int
+            The number of rows in a chunk.
+
+        max_bytes : int
+            The memory budget of the chunks in bytes.
+
+        directory : str
+            The run directory.
+
+        rows : int
+            The number of recorded rows.
+
+        config : dict
+            Additional information about the run stored in the `meta.json`.
+    """
+
+    def __init__(
+        self,
+        riders,
+        channels=CHANNELS,
+        decimation=1,
+        chunk_size=1024,
+        max_bytes=64 * 1024 * 1024,
+        directory=None,
+        dtype=np.float32,
+        config=None,
+    ):
+        """
+        Initialize the recorder.
+
+        Parameters
+        ----------
+            riders : int
+                The number of riders recorded.
+            channels : Iterable[str], default CHANNELS
+                The names of the attributes of the engine to record.
+            decimation : int, default 1
+                A row is recorded every `decimation` ticks.
+            chunk_size : int, default 1024
+                The number of rows in a chunk.
+            max_bytes : int, default 64 MiB
+                The memory budget of the chunks in bytes. At least two chunks
+                are kept in memory, regardless of the budget.
+            directory : str | None, default None
+                The run directory, which is created if needed. A temporary
+                directory is created if `None` is given.
+            dtype : numpy.typing.DTypeLike, default numpy.float32
+                The type of the channels. The time is always stored as float64.
+            config : dict | None, default None
+                Additional information about the run, e.g. the parameters of
+                the simulation, which is stored in the `meta.json`.
+        """
+        self.riders = riders
+        self.channels = tuple(channels)
+        self.decimation = decimation
+        self.chunk_size = chunk_size
+        self.max_bytes = max_bytes
+        self.dtype = np.dtype(dtype)
+        self.config = dict(config or {})
+
+        self.directory = directory or tempfile.mkdtemp(prefix="zls-run-")
+        os.makedirs(self.directory, exist_ok=True)
+        for name in ("time", *self.channels):
+            open(self._path(name), "wb").close()
+
+        self.rows = 0
+        self._ticks = 0
+        self._closed = False
+
+        # The time of the first row and between rows, while it is constant, so
+        # the time does not have to be read back to describe it.
+        self._start = 0.0
+        self._last_time = 0.0
+        self._interval: float | None = None
+        self._constant = True
+
+        chunk_nbytes = chunk_size * (
+            8 + len(self.channels) * riders * self.dtype.itemsize
+        )
+        self._max_chunks = max(2, max_bytes // chunk_nbytes)
+        self._allocated = 0
+        self._pool: deque[dict] = deque()
+
+        # The full chunks in memory, which are not written yet.
+        self._full: deque[tuple[dict, int]] = deque()
+        # The pending writes of chunks, which are reused once written.
+        self._writes: deque[Future] = deque()
+        # The number of rows of the current chunk, that are already written.
+        self._written = 0
+
+        # A single worker keeps the writes in order.
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="telemetry")
+        self._chunk = self._new_chunk()
+        self._row = 0
+
+    def _path(self, name):
+        return os.path.join(self.directory, f"{name}.bin")
+
+    def _new_chunk(self) -> dict:
+        """
+        Get an empty chunk, reusing the memory of a written chunk if possible.
+        """
+        while not self._pool and self._allocated >= self._max_chunks:
+            # Wait for the oldest write, which returns it's chunk to the pool.
+            self._writes.popleft().result()
+
+        if self._pool:
+            return self._pool.popleft()
+
+        self._allocated += 1
+        chunk = {"time": np.empty(self.chunk_size)}
+        for name in self.channels:
+            chunk[name] = np.empty((self.chunk_size, self.riders), self.dtype)
+        return chunk
+
+    def _write(self, chunk, start, stop, release):
+        """
+        Append rows of a chunk to the files of the run directory.
+        """
+        for name, column in chunk.items():
+            with open(self._path(name), "ab") as f:
+                column[start:stop].tofile(f)
+        if release:
+            self._pool.append(chunk)
+
+    def _submit_write(self, chunk, start, stop, release):
+        while self._writes and self._writes[0].done():
+            self._writes.popleft()
+
+        future = self._executor.submit(self._write, chunk, start, stop, release)
+        self._writes.append(future)
+        return future
+
+    def record(self, engine, time=None):
+        """
+        Record the current state of the engine, unless the tick is skipped by
+        the decimation.
+
+        Parameters
+        ----------
+            engine : ZiplineEngine
+                The engine to record, or any object with the time and channels
+                as attributes.
+            time : float | None, default None
+                The time of the row. The engine's time is used if `None` is
+                given, e.g. when the engine is reset during the recording.
+        """
+        tick = self._ticks
+        self._ticks = tick + 1
+        if tick % self.decimation:
+            return
+
+        if time is None:
+            time = engine.time
+        if self.rows == 0:
+            self._start = time
+        elif self.rows == 1:
+            self._interval = time - self._last_time
+        elif self._constant:
+            self._constant = math.isclose(
+                time - self._last_time, self._interval, rel_tol=1e-5, abs_tol=1e-8
+            )
+        self._last_time = time
+
+        chunk = self._chunk
+        row = self._row
+        chunk["time"][row] = time
+        for name in self.channels:
+            chunk[name][row] = getattr(engine, name)
+
+        self.rows += 1
+        self._row = row + 1
+        if self._row == self.chunk_size:
+            self._seal()
+
+    def _seal(self):
+        """
+        Keep the current chunk as full and start a new one.
+        """
+        self._full.append((self._chunk, self._written))
+        self._written = 0
+
+        # Write the oldest chunks, so a new chunk fits into the budget.
+        while len(self._full) >= self._max_chunks - 1:
+            chunk, written = self._full.popleft()
+            self._submit_write(chunk, written, self.chunk_size, True)
+
+        self._chunk = self._new_chunk()
+        self._row = 0
+
+    def flush(self) -> Future:
+        """
+        Write all recorded rows to the run directory in the background.
+
+        Returns
+        -------
+            concurrent.futures.Future
+                The future of the last write, which is done once every
+                recorded row is written.
+
+        Raises
+        ------
+            RuntimeError
+                If the recorder is closed.
+        """
+        if self._closed:
+            raise RuntimeError("the recorder is closed")
+
+        while self._full:
+            chunk, written = self._full.popleft()
+            self._submit_write(chunk, written, self.chunk_size, True)
+
+        future = self._submit_write(self._chunk, self._written, self._row, False)
+        self._written = self._row
+        return future
+
+    def close(self) -> str:
+        """
+        Write all recorded rows and the `meta.json` to the run directory, and
+        stop the background thread. Pending saves are finished first, but no
+        rows can be written or saved afterwards.
+
+        Returns
+        -------
+            str
+                The run directory.
+
+        Raises
+        ------
+            RuntimeError
+                If the recorder is already closed.
+        """
+        self.flush()
+        self._closed = True
+        self._executor.shutdown(wait=True)
+
+        interval = None
+        if self._interval is not None and self._constant:
+            interval = float(self._interval)
+
+        meta = {
+            "channels": list(self.channels),
+            "riders": self.riders,
+            "rows": self.rows,
+            "dtype": self.dtype.str,
+            "decimation": self.decimation,
+            "start": float(self._start),
+            "interval": interval,
+            "config": self.config,
+        }
+        with open(os.path.join(self.directory, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=4)
+
+        return self.directory
+
+    def _read_columns(self, rows):
+        """
+        Map the first rows of the written files into memory.
+        """
+        columns = {"time": _map(self._path("time"), np.float64, (rows,))}
+        for name in self.channels:
+            columns[name] = _map(self._path(name), self.dtype, (rows, self.riders))
+        return columns
+
+    def save_npz(self, path, compressed=False) -> Future:
+        """
+        Save the recorded rows to a `.npz` file in the background. This must be
+        called before the recorder is closed.
+
+        Parameters
+        ----------
+            path : str
+                The path of the file.
+            compressed : bool, default False
+                Whether to compress the file, which is smaller but slower.
+
+        Returns
+        -------
+            concurrent.futures.Future
+                The future of the saving.
+
+        Raises
+        ------
+            RuntimeError
+                If the recorder is closed.
+        """
+        self.flush()
+        rows = self.rows
+        save = np.savez_compressed if compressed else np.savez
+
+        def job():
+            save(path, **self._read_columns(rows))
+
+        return self._executor.submit(job)
+
+    def save_parquet(self, path, rows_per_group=65536) -> Future:
+        """
+        Save the recorded rows to a Parquet file in the background. This needs
+        the optional dependency pyarrow, and must be called before the recorder
+        is closed.
+
+        The table has a row for each recorded rider and time, with the columns
+        `time`, `rider` and the channels.
+
+        Parameters
+        ----------
+            path : str
+                The path of the file.
+            rows_per_group : int, default 65536
+                The approximate number of table rows written at once.
+
+        Returns
+        -------
+            concurrent.futures.Future
+                The future of the saving.
+
+        Raises
+        ------
+            ImportError
+                If pyarrow is not installed.
+            RuntimeError
+                If the recorder is closed.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.flush()
+        rows = self.rows
+        step = max(1, rows_per_group // self.riders)
+        riders = np.arange(self.riders, dtype=np.int32)
+
+        def job():
+            columns = self._read_columns(rows)
+            schema = pa.schema(
+                [("time", pa.float64()), ("rider", pa.int32())]
+                + [(name, pa.from_numpy_dtype(self.dtype)) for name in self.channels]
+            )
+            with pq.ParquetWriter(path, schema) as writer:
+                for i in range(0, rows, step):
+                    time = columns["time"][i : i + step]
+                    arrays = [
+                        np.repeat(time, self.riders),
+                        np.tile(riders, len(time)),
+                    ]
+                    arrays += [
+                        np.ravel(columns[name][i : i + step]) for name in self.channels
+                    ]
+                    writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+        return self._executor.submit(job)
+
+
+def _map(path, dtype, shape):
+    if shape[0] == 0:
+        return np.empty(shape, dtype)
+    return np.memmap(path, dtype, "r", shape=shape)
+
+
+def read_run(directory):
+    """
+    Read a run directory written by `TelemetryRecorder` without loading it into
+    memory.
+
+    Parameters
+    ----------
+        directory : str
+            The run directory.
+
+    Returns
+    -------
+        tuple[dict, dict[str, numpy.ndarray]]
+            The content of the `meta.json`, and the memory-mapped columns of the
+            time and the channels by their name.
+    """
+    with open(os.path.join(directory, "meta.json")) as f:
+        meta = json.load(f)
+
+    rows = meta["rows"]
+    columns = {"time": _map(os.path.join(directory, "time.bin"), np.float64, (rows,))}
+    for name in meta["channels"]:
+        path = os.path.join(directory, f"{name}.bin")
+        columns[name] = _map(path, np.dtype(meta["dtype"]), (rows, meta["riders"]))
+
+    return meta, columns
@@ -1,3 +1,5 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import pygame as pg
 
 from core import assets, states
@@ -5,39 +7,124 @@ from core.api import Win32Methods, WindowExtended
 
 
 class Simulation(WindowExtended):
-    def __init__(self):
+    def __init__(
+        self,
+        headless=False,
+        render=True,
+        record_directory=None,
+        replay_directory=None,
+        state=None,
+    ):
         title = "Zipline Simulation"
         icon = assets.images.zls_icon.as_surface(convert=False)
         size = (800, 600)
         flags = pg.RESIZABLE
         max_fps = 60
+        tick_rate = 240
+
+        super().__init__(title, icon, size, flags, max_fps, headless)
+        self.render = render
+        self.tick_rate = tick_rate
 
-        super().__init__(title, icon, size, flags, max_fps)
+        # The directory to record the telemetry of the simulation to, if any.
+        self.record_directory = record_directory
+        # The directory of a recorded run to replay instead of simulating, if any.
+        self.replay_directory = replay_directory
 
         assets.images.reconvert_on_resize()
 
-        if Win32Methods.supported:
+        # Fonts are loaded at the scales of the restored and maximized window.
+        scales = [self.renderer._h_scale]
+
+        if Win32Methods.supported and not headless:
             Win32Methods.maximize()
+            desktop_h = pg.display.get_desktop_sizes()[0][1]
+            scales.append(desktop_h / self.renderer._org_h)
+
+        assets.fonts.warm_up(scales)
 
         self._states = states.get_states_dict()
         self._prev_state_name = None
-        self.next_state_name = "intro"
 
-    def run(self):
-        super().run()
+        # The states are prepared one after another in the background.
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="prepare")
+        self._preparing: dict[str, Future] = {}
+        if state is not None:
+            self.next_state_name = state
+        elif replay_directory is not None:
+            self.next_state_name = "replay"
+        else:
+            self.next_state_name = "intro"
+
+    def run(self, max_frames=None):
+        super().run(max_frames)
+
+    def end(self):
+        """
+        End the current state, e.g. to finish a recording before exiting, and
+        stop preparing states in the background.
+        """
+        if self._prev_state_name is not None:
+            self._states[self._prev_state_name].end()
+            self._prev_state_name = None
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._preparing.clear()
 
     def loop_method(self):
         prev_name = self._prev_state_name
         next_name = self.next_state_name
 
         if next_name != prev_name:
+            # Only blocks, if the preparation has not finished yet.
+            future = self._preparing.pop(next_name, None)
+            if future is not None:
+                future.result()
+            else:
+                self._states[next_name].prepare()
+
             if prev_name is not None:
                 self._states[prev_name].end()
             self._states[next_name].start()
             self._prev_state_name = next_name
 
-        self._states[next_name].update(self.dt)
-        self._states[next_name].draw(self.renderer)
+        state = self._states[next_name]
+        if self.profiler.enabled:
+            self.profiler.call("update", "phase", self._update_state, state)
+            if self.drawing:
+                self.profiler.call("draw", "phase", state.draw, self.renderer)
+        else:
+            self._update_state(state)
+            if self.drawing:
+                state.draw(self.renderer)
+
+    def _update_state(self, state):
+        for dt in self.ticks():
+            state.update(dt)
+
+    def prepare(self, name) -> Future:
+        """
+        Prepare a state in the background, so switching to it is quick.
+
+        Parameters
+        ----------
+            name : str
+                The name of the state.
+
+        Returns
+        -------
+            concurrent.futures.Future
+                The future of the preparation. If it failed, the exception is
+                raised when switching to the state.
+        """
+        future = self._preparing.get(name)
+        if future is None:
+            future = self._executor.submit(self._states[name].prepare)
+            self._preparing[name] = future
+        return future
+
+    def get_state(self, name):
+        return self._states[name]
 
     @property
     def current_state(self):
@@ -0,0 +1,153 @@
+"""
+Measure the startup of the simulation.
+
+The startup is measured in a fresh interpreter, which runs `zls.pyw` for a
+single headless frame with `-X importtime`, so the import of each module is
+reported by the interpreter itself. The time to the first frame is measured
+from starting the interpreter until `zls.pyw` reports the first frame is done.
+"""
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from collections import namedtuple
+
+# The target of the time to the first frame in seconds.
+FIRST_FRAME_BUDGET = 0.5
+
+# The modules, which are only imported once they are used.
+LAZY_MODULES = ("pandas", "matplotlib", "pyarrow", "win32gui", "win32con")
+
+ImportTime = namedtuple("ImportTime", ["module", "self", "cumulative", "depth"])
+
+# The line, which `zls.pyw` prints once the first frame is done.
+FIRST_FRAME_LINE = "first frame"
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+_MAIN = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "zls.pyw"
+)
+
+
+def parse_importtime(text) -> list[ImportTime]:
+    """
+    Parse the output of `python -X importtime`.
+
+    Parameters
+    ----------
+        text : str
+            The output, which the interpreter writes to stderr. Other lines
+            are ignored.
+
+    Returns
+    -------
+        list[ImportTime]
+            The `module`, the time of the import without and with the imports
+            of it's own imports in seconds, and the `depth` of the import, in
+            the order the imports finished.
+    """
+    times = []
+    for match in _LINE.finditer(text):
+        own, cumulative, indent, module = match.groups()
+        times.append(
+            ImportTime(module, int(own) / 1e6, int(cumulative) / 1e6, len(indent) // 2)
+        )
+    return times
+
+
+def measure(*args) -> dict:
+    """
+    Start the simulation for a single headless frame in a new interpreter.
+
+    Additional positional arguments are passed to `zls.pyw`.
+
+    Returns
+    -------
+        dict
+            The time to the first frame as `first_frame`, the time of the
+            whole process as `process`, the time of all imports as `imports`,
+            all in seconds, and the `ImportTime` of each module as `modules`.
+
+    Raises
+    ------
+        subprocess.CalledProcessError
+            If the simulation failed.
+        RuntimeError
+            If the simulation exited without reporting the first frame.
+    """
+    command = [sys.executable, "-X", "importtime", _MAIN, "--headless"]
+    command += ["--frames", "1", "--first-frame", *args]
+
+    # The report of the imports is too large for the pipe, while the output is
+    # read line by line to time the first frame.
+    first_frame = None
+    with tempfile.TemporaryFile("w+") as stderr:
+        start = time.perf_counter()
+        with subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=stderr, text=True
+        ) as process:
+            for line in process.stdout:
+                if line.startswith(FIRST_FRAME_LINE):
+                    first_frame = time.perf_counter() - start
+        total = time.perf_counter() - start
+
+        stderr.seek(0)
+        output = stderr.read()
+
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command, None, output)
+
+    if first_frame is None:
+        raise RuntimeError(f"the simulation exited without a first frame: {command}")
+
+    modules = parse_importtime(output)
+    imports = sum(m.cumulative for m in modules if m.depth == 0)
+    return {
+        "first_frame": first_frame,
+        "process": total,
+        "imports": imports,
+        "modules": modules,
+    }
+
+
+def format_report(result: dict, top=20) -> str:
+    """
+    Format the result of `measure` as a text report.
+
+    Parameters
+    ----------
+        result : dict
+            The result of `measure`.
+        top : int, default 20
+            The number of the slowest imports to list.
+
+    Returns
+    -------
+        str
+            The report.
+    """
+    modules = result["modules"]
+    first_frame = result["first_frame"]
+    status = "ok" if first_frame <= FIRST_FRAME_BUDGET else "OVER BUDGET"
+    lines = [
+        f"first frame  {first_frame * 1000:8.1f} ms  "
+        f"(budget {FIRST_FRAME_BUDGET * 1000:.0f} ms, {status})",
+        f"process      {result['process'] * 1000:8.1f} ms",
+        f"imports      {result['imports'] * 1000:8.1f} ms",
+        "",
+        "slowest imports (cumulative, self):",
+    ]
+    for m in sorted(modules, key=lambda m: m.cumulative, reverse=True)[:top]:
+        lines.append(
+            f"  {m.cumulative * 1000:8.1f} ms {m.self * 1000:8.1f} ms  "
+            f"{'  ' * m.depth}{m.module}"
+        )
+
+    imported = {m.module.split(".")[0] for m in modules}
+    eager = [name for name in LAZY_MODULES if name in imported]
+    lines.append("")
+    lines.append(f"lazy modules imported at startup: {', '.join(eager) or 'none'}")
+    return "\n".join(lines)
@@ -1,4 +1,5 @@
 from core import assets
+from core import simulation as s
 from core.api import Renderer
 from core.objects import IntroText
 from core.types import State
@@ -13,3 +14,6 @@ class IntroState(State):
     def start(self):
         self.set_objects([IntroText()])
         super().start()
+
+        # The intro is followed by the visual state, which is prepared meanwhile.
+        s.Simulation().prepare("visual")
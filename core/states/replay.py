@@ -0,0 +1,36 @@
+import core.simulation as s
+from core.objects import ReplayPlayer
+from core.physics import Replay
+from core.states.visual import VisualState
+
+
+class ReplayState(VisualState):
+    """
+    This state replays a recorded run in the panels of `VisualState`, instead of
+    simulating it.
+    """
+
+    def __init__(self):
+        name = "replay"
+        super().__init__(name)
+        self.replay: Replay | None = None
+
+    def create_objects(self) -> list:
+        self.replay = Replay(s.Simulation().replay_directory)
+        self.zipline_config = self.replay.config
+
+        objects = super().create_objects()
+        by_name = {object.name: object for object in objects}
+        zipline = by_name["zipline"]
+        graph = by_name["graph_plot"]
+
+        zipline.simulate = False
+        graph.sample = None
+
+        # The playback is controlled by the player instead.
+        objects.remove(by_name["animate_button"])
+
+        # The player fills the graph's series, so it is updated and drawn first.
+        player = ReplayPlayer(self.replay, by_name["visual"], zipline, graph)
+        objects.insert(objects.index(graph), player)
+        return objects
@@ -1,7 +1,357 @@
-from core.types import State
+import json
+import platform
+
+import numpy as np
+import pygame as pg
+
+import core.simulation as s
+from core.api import HandlerPolicy, Profiler, Renderer
+from core.api.profiler import summarize
+from core.assets import colors, fonts
+from core.objects import Layer
+from core.types import ComponentStore, Object, State
+
+fonts.gui_regular.preload(16)
+
+# The phases of a frame, which are timed separately.
+PHASES = ("events", "update", "draw", "render")
+
+
+class _BenchText(Object):
+    """
+    A text, which changes every few frames.
+    """
+
+    def __init__(self, index, pos, period=10):
+        super().__init__(f"bench_text_{index}")
+        self.index = index
+        self.pos = pos
+        self.period = period
+        self.frame = 0
+
+    def draw(self, renderer: Renderer):
+        self.frame += 1
+        value = self.frame // self.period % 100
+        text = fonts.gui_regular.render(
+            16, f"{self.index}: {value}", True, colors.black
+        )
+        x, y = renderer.dpos + renderer.dsize * self.pos
+        renderer.draw_surface(2, text, (x, y))
+
+
+class _BenchPrimitives(Object):
+    """
+    Rectangles, lines and circles moving around the screen.
+    """
+
+    def __init__(self, count, seed=0):
+        super().__init__("bench_primitives")
+        rng = np.random.default_rng(seed)
+        self.count = count
+        self.pos = rng.random((count, 2))
+        self.vel = rng.uniform(-0.2, 0.2, (count, 2))
+        self.colors = [
+            (colors.red, colors.blue, colors.dark_green, colors.purple)[i % 4]
+            for i in range(count)
+        ]
+
+    def update(self, dt: float):
+        self.pos += self.vel * dt
+        # Bounce off the edges of the drawable area.
+        outside = (self.pos < 0) | (self.pos > 1)
+        self.vel[outside] *= -1
+        np.clip(self.pos, 0, 1, out=self.pos)
+
+    def draw(self, renderer: Renderer):
+        size = max(2, round(8 * renderer._h_scale))
+        points = (renderer.dpos + renderer.dsize * self.pos).astype(int).tolist()
+
+        for i, (x, y) in enumerate(points):
+            color = self.colors[i]
+            kind = i % 3
+            if kind == 0:
+                renderer.draw_rect(1, color, (x, y, size, size))
+            elif kind == 1:
+                renderer.draw_line(1, color, (x, y), (x + size, y + size))
+            else:
+                renderer.draw_circle(1, color, (x, y), size // 2)
+
+
+def _create_entities(count, seed=0) -> ComponentStore:
+    """
+    Create rectangles and circles moving around the screen, like
+    `_BenchPrimitives`, as entities updated and drawn in batches.
+    """
+    store = ComponentStore(
+        {
+            "position": (np.float64, (2,)),
+            "velocity": (np.float64, (2,)),
+            "color": (np.uint32, ()),
+            "kind": (np.uint8, ()),
+        },
+        capacity=count,
+    )
+    rng = np.random.default_rng(seed)
+    palette = np.array(
+        [int(c) for c in (colors.red, colors.blue, colors.dark_green, colors.purple)],
+        np.uint32,
+    )
+    index = np.arange(count)
+    store.add(
+        count,
+        position=rng.random((count, 2)),
+        velocity=rng.uniform(-0.2, 0.2, (count, 2)),
+        color=palette[index % 4],
+        kind=index % 2,
+    )
+    store.add_system(_move_entities)
+    store.add_draw_system(_draw_entities)
+    return store
+
+
+def _move_entities(store: ComponentStore, dt: float):
+    position = store["position"]
+    velocity = store["velocity"]
+    position += velocity * dt
+    # Bounce off the edges of the drawable area.
+    outside = (position < 0) | (position > 1)
+    velocity[outside] *= -1
+    np.clip(position, 0, 1, out=position)
+
+
+def _draw_entities(store: ComponentStore, renderer: Renderer):
+    size = max(2, round(8 * renderer._h_scale))
+    points = (renderer.dpos + renderer.dsize * store["position"]).astype(np.int32)
+    kind = store["kind"]
+    color = store["color"]
+
+    rects = kind == 0
+    boxes = np.empty((np.count_nonzero(rects), 4), np.int32)
+    boxes[:, :2] = points[rects]
+    boxes[:, 2:] = size
+    renderer.draw_rects(1, color[rects], boxes)
+
+    circles = ~rects
+    renderer.draw_circles(1, color[circles], points[circles], size // 2)
 
 
 class RuntimeTestState(State):
+    """
+    This state is a benchmark of the engine.
+
+    It ramps up the number of panels, texts, draw primitives and event handlers
+    in stages. The last stage draws the primitives as entities of a
+    `ComponentStore` instead, which are updated and drawn in batches. In each
+    stage, the time of each frame is measured by the `Profiler`, broken down
+    into the event dispatch, the updates of the state, the drawing of the state
+    and the presenting by the renderer. The percentiles of each stage are
+    written to a JSON report once all stages are done, after which the main
+    loop is exited.
+
+    The scene is deterministic, so reports of the same machine are comparable.
+
+    Attributes
+    ----------
+        stages : list[dict[str, int]]
+            The number of `panels`, `texts`, `primitives`, `entities` and
+            `handlers` of each stage.
+
+        warmup_frames : int
+            The number of frames at the start of a stage, which are not measured.
+
+        frames_per_stage : int
+            The number of measured frames of a stage.
+
+        events_per_frame : int
+            The number of events posted in each frame, which are dispatched to
+            the handlers.
+
+        report_path : str
+            The path of the JSON report.
+
+        report : dict | None
+            The report, once all stages are done.
+    """
+
     def __init__(self):
         name = "runtime_test"
         super().__init__(name)
+
+        keys = ("panels", "texts", "primitives", "entities", "handlers")
+        self.stages = [
+            dict(zip(keys, counts))
+            for counts in (
+                (4, 16, 64, 0, 16),
+                (16, 64, 256, 0, 64),
+                (36, 256, 1024, 0, 256),
+                (64, 1024, 4096, 0, 1024),
+                (64, 1024, 0, 4096, 1024),
+            )
+        ]
+        self.warmup_frames = 30
+        self.frames_per_stage = 240
+        self.events_per_frame = 8
+        self.report_path = "runtime_test.json"
+        self.report: dict | None = None
+
+        self._stage = 0
+        self._frame = 0
+        self._timings: dict[str, list[float]] = {}
+        self._results: list[dict] = []
+        self._handler_ids: list[int] = []
+        self._handler_calls = 0
+        self._was_profiling: bool | None = None
+        self._trace_frames = 0
+
+    def start(self):
+        self.report = None
+        self._results.clear()
+
+        profiler = Profiler()
+        self._was_profiling = profiler.enabled
+        if not profiler.enabled:
+            # Only the sums of the frames are needed, and keeping the spans of
+            # thousands of objects for a trace would add to the frame times.
+            self._trace_frames = profiler.trace_frames
+            profiler.trace_frames = 0
+            profiler.reset()
+            profiler.enabled = True
+        profiler.add_frame_handler(self._on_frame)
+
+        self._start_stage(0)
+
+    def _start_stage(self, index):
+        self._end_objects()
+
+        stage = self.stages[index]
+        self._stage = index
+        self._frame = 0
+        self._timings = {phase: [] for phase in (*PHASES, "total")}
+        self._handler_calls = 0
+
+        objects = []
+
+        columns = int(np.ceil(np.sqrt(stage["panels"])))
+        for i in range(stage["panels"]):
+            row, column = divmod(i, columns)
+            start = (column / columns, row / columns)
+            end = ((column + 1) / columns, (row + 1) / columns)
+            objects.append(
+                Layer(
+                    f"bench_panel_{i}",
+                    start,
+                    end,
+                    f"Panel {i}",
+                    colors.light_gray,
+                    colors.black,
+                    1,
+                    20,
+                    colors.dark_gray,
+                    16,
+                    4,
+                    colors.white,
+                )
+            )
+
+        rng = np.random.default_rng(index)
+        for i in range(stage["texts"]):
+            objects.append(_BenchText(i, rng.random(2) * 0.9))
+
+        if stage["primitives"]:
+            objects.append(_BenchPrimitives(stage["primitives"], seed=index))
+        if stage["entities"]:
+            self.components = _create_entities(stage["entities"], seed=index)
+        self.set_objects(objects)
+        for object in self.get_objects():
+            object.start()
+
+        # The handlers of the previous stage are removed in the next dispatch,
+        # so only the calls after the warm-up are counted.
+        def on_event():
+            if self._frame >= self.warmup_frames:
+                self._handler_calls += 1
+
+        em = s.Simulation().eventmanager
+        self._handler_ids = [
+            em.add_new_handler(on_event, pg.USEREVENT, policy=HandlerPolicy.EVERY)
+            for _ in range(stage["handlers"])
+        ]
+
+    def _end_objects(self):
+        for object in self.get_objects():
+            object.end()
+        self.objects.clear()
+        self.components = None
+
+        em = s.Simulation().eventmanager
+        for handler_id in self._handler_ids:
+            em.remove_handler(handler_id)
+        self._handler_ids.clear()
+
+    def _on_frame(self, totals: dict[str, float]):
+        """
+        Store the timings of a frame, and advance the stages.
+        """
+        if self._frame >= self.warmup_frames:
+            for phase in PHASES:
+                self._timings[phase].append(totals.get(phase, 0.0))
+            self._timings["total"].append(sum(totals.get(p, 0.0) for p in PHASES))
+
+        # The events are dispatched to the handlers in the next frame.
+        for i in range(self.events_per_frame):
+            pg.event.post(pg.event.Event(pg.USEREVENT, index=i))
+
+        self._frame += 1
+        if self._frame < self.warmup_frames + self.frames_per_stage:
+            return
+
+        self._results.append(
+            {
+                **self.stages[self._stage],
+                "frames": self.frames_per_stage,
+                "handler_calls": self._handler_calls,
+                "phases": {
+                    phase: summarize(values) for phase, values in self._timings.items()
+                },
+            }
+        )
+
+        if self._stage + 1 < len(self.stages):
+            self._start_stage(self._stage + 1)
+        else:
+            self._finish()
+
+    def _finish(self):
+        sim = s.Simulation()
+        self.report = {
+            "python": platform.python_version(),
+            "pygame": pg.version.ver,
+            "sdl": ".".join(map(str, pg.get_sdl_version())),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "video_driver": pg.display.get_driver(),
+            "headless": sim.headless,
+            "render": sim.render,
+            "screen_size": [int(v) for v in sim.renderer.screen_size],
+            "events_per_frame": self.events_per_frame,
+            "stages": list(self._results),
+        }
+        with open(self.report_path, "w") as f:
+            json.dump(self.report, f, indent=4)
+
+        self._restore()
+        sim.running = False
+
+    def _restore(self):
+        if self._was_profiling is not None:
+            profiler = Profiler()
+            profiler.remove_frame_handler(self._on_frame)
+            if not self._was_profiling:
+                profiler.enabled = False
+                profiler.trace_frames = self._trace_frames
+                profiler.reset()
+            self._was_profiling = None
+
+    def end(self):
+        self._restore()
+        self._end_objects()
@@ -1,14 +1,47 @@
-from core.assets import colors
-from core.objects import AnimateButton, Layer
+from core.assets import colors, fonts
+from core.objects import (
+    AnimateButton,
+    Graph,
+    Layer,
+    Series,
+    SeriesFigure,
+    Zipline,
+)
 from core.types import State
 
+# The font sizes used by the panels are loaded in the background at startup.
+fonts.gui_regular.preload(20)
+
 
 class VisualState(State):
-    def __init__(self):
-        name = "visual"
+    # Whether the graphs are plotted with matplotlib instead of natively.
+    matplotlib_graphs = False
+
+    def __init__(self, name="visual"):
         super().__init__(name)
 
+        # The parameters of the zipline, see `Zipline`.
+        self.zipline_config = {}
+
+        self._prepared: list | None = None
+
+    def prepare(self):
+        objects = self.create_objects()
+        for object in objects:
+            object.prepare()
+        self._prepared = objects
+
     def start(self):
+        if self._prepared is None:
+            self.prepare()
+        self.set_objects(self._prepared)
+        self._prepared = None
+        super().start()
+
+    def create_objects(self) -> list:
+        """
+        Create the panels and their content.
+        """
         global_border_args = {
             "line_color": colors.black.correct_gamma(1.1),
             "line_thickness": 2,
@@ -37,5 +70,25 @@ class VisualState(State):
             colors.dark_gray,
             **global_border_args
         )
-        self.set_objects((layer1, layer2, layer3))
-        super().start()
+        zipline = Zipline(layer1, **self.zipline_config)
+        animate_button = AnimateButton(layer3, zipline)
+
+        engine = zipline.engine
+        series = (
+            Series("Position", colors.yellow),
+            Series("Speed", colors.cyan),
+            Series("Acceleration", colors.orange),
+        )
+        graph = Graph(
+            "graph_plot",
+            layer2,
+            series,
+            lambda: (engine.position[0], engine.velocity[0], engine.acceleration[0]),
+        )
+        objects = [layer1, layer2, layer3, zipline, graph, animate_button]
+
+        if self.matplotlib_graphs:
+            graph.visible = False
+            objects.append(SeriesFigure("graph_figure", layer2, series))
+
+        return objects
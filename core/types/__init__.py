@@ -1,2 +1,3 @@
+from core.types.componentstore import ComponentStore
 from core.types.object import Object
 from core.types.state import State
@@ -0,0 +1,241 @@
+from typing import Callable
+
+import numpy as np
+
+from core.api import Profiler, Renderer
+
+_profiler = Profiler()
+
+
+class ComponentStore:
+    """
+    This class stores many simple entities of a state as rows of arrays, one
+    array per component, e.g. a position, a velocity or a color.
+
+    Instead of an object per entity, whose methods are called one by one, the
+    entities are updated by systems, which are functions updating whole
+    columns at once, and drawn by draw systems, which queue all entities of a
+    kind at once with the batched draw methods of the `Renderer`.
+
+    Each entity has an id, which stays the same while it exists. The rows are
+    kept dense, so the row of an entity changes when entities before it are
+    removed, see `rows`.
+
+    Attributes
+    ----------
+        count : int
+            The number of entities.
+
+        capacity : int
+            The number of entities the arrays can hold, before they grow.
+    """
+
+    def __init__(self, components: dict[str, tuple], capacity=256):
+        """
+        Initialize this class.
+
+        Parameters
+        ----------
+            components : dict[str, tuple[numpy.dtype, tuple[int, ...]]]
+                The type and the row shape of each component by it's name,
+                e.g. `{"position": (numpy.float64, (2,))}`.
+            capacity : int, default 256
+                The initial number of entities the arrays can hold.
+        """
+        self.count = 0
+        self.capacity = 0
+
+        self._components = dict(components)
+        self._columns: dict[str, np.ndarray] = {}
+        self._ids = np.zeros(0, np.int64)  # the id of each row
+        self._rows = np.zeros(0, np.int64)  # the row of each id, or -1
+        self._free = np.zeros(0, np.int64)  # the ids of removed entities
+        self._next_id = 0
+        self._systems: list[Callable[[ComponentStore, float], None]] = []
+        self._draw_systems: list[Callable[[ComponentStore, Renderer], None]] = []
+        self._resize(capacity)
+
+    def _resize(self, capacity):
+        """
+        Reallocate the arrays with a new capacity, keeping the entities.
+        """
+        n = self.count
+        for name, (dtype, shape) in self._components.items():
+            array = np.zeros((capacity, *shape), dtype)
+            if n:
+                array[:n] = self._columns[name][:n]
+            self._columns[name] = array
+
+        ids = np.zeros(capacity, np.int64)
+        ids[:n] = self._ids[:n]
+        self._ids = ids
+
+        rows = np.full(capacity, -1, np.int64)
+        rows[: len(self._rows)] = self._rows
+        self._rows = rows
+
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, name) -> np.ndarray:
+        """
+        Get the column of a component, which is a view of the rows of the
+        current entities. It is invalidated, when entities are added or
+        removed.
+        """
+        return self._columns[name][: self.count]
+
+    def __setitem__(self, name, value):
+        """
+        Set the component of all current entities.
+        """
+        self._columns[name][: self.count] = value
+
+    @property
+    def ids(self) -> np.ndarray:
+        """
+        The id of the entity of each row.
+        """
+        return self._ids[: self.count]
+
+    def add(self, count=1, **values) -> np.ndarray:
+        """
+        Add entities.
+
+        Parameters
+        ----------
+            count : int, default 1
+                The number of entities to add.
+
+        Additional keyword-arguments set the components of the new entities by
+        their name. They are broadcast to the entities, so a single value sets
+        the component of all of them. Components not given are zero.
+
+        Returns
+        -------
+            numpy.ndarray[int64]
+                The ids of the new entities.
+        """
+        unknown = values.keys() - self._columns.keys()
+        if unknown:
+            raise KeyError(f"unknown components: {', '.join(sorted(unknown))}")
+
+        i = self.count
+        j = i + count
+        if j > self.capacity:
+            self._resize(max(j, 2 * self.capacity))
+
+        for name, column in self._columns.items():
+            column[i:j] = values.get(name, 0)
+
+        # The ids of removed entities are reused first.
+        reused = min(count, len(self._free))
+        ids = np.concatenate(
+            (
+                self._free[len(self._free) - reused :],
+                np.arange(self._next_id, self._next_id + count - reused),
+            )
+        )
+        self._free = self._free[: len(self._free) - reused]
+        self._next_id += count - reused
+
+        self._ids[i:j] = ids
+        self._rows[ids] = np.arange(i, j)
+        self.count = j
+        return ids
+
+    def remove(self, ids):
+        """
+        Remove entities. The remaining entities keep their order.
+
+        Parameters
+        ----------
+            ids : int | ArrayLike
+                The ids of the entities to remove.
+        """
+        ids = np.unique(np.asarray(ids, np.int64))
+        rows = self.rows(ids)
+
+        keep = np.ones(self.count, bool)
+        keep[rows] = False
+        order = np.flatnonzero(keep)
+        n = len(order)
+
+        for column in self._columns.values():
+            column[:n] = column[order]
+        self._ids[:n] = self._ids[order]
+        self._rows[self._ids[:n]] = np.arange(n)
+        self._rows[ids] = -1
+
+        self._free = np.concatenate((self._free, ids))
+        self.count = n
+
+    def rows(self, ids) -> np.ndarray:
+        """
+        Get the rows of entities, to index the columns with.
+
+        Parameters
+        ----------
+            ids : int | ArrayLike
+                The ids of the entities.
+
+        Returns
+        -------
+            numpy.ndarray[int64]
+                The row of each entity.
+
+        Raises
+        ------
+            KeyError
+                If there is no entity with one of the ids.
+        """
+        ids = np.asarray(ids, np.int64)
+        if np.any((ids < 0) | (ids >= len(self._rows))):
+            raise KeyError(f"no entities with the ids {ids}")
+
+        rows = self._rows[ids]
+        if np.any(rows < 0):
+            raise KeyError(f"no entities with the ids {ids}")
+        return rows
+
+    def clear(self):
+        """
+        Remove all entities.
+        """
+        self.count = 0
+        self._rows[:] = -1
+        self._free = np.zeros(0, np.int64)
+        self._next_id = 0
+
+    def add_system(self, system: Callable[["ComponentStore", float], None]):
+        """
+        Add a function to update the entities, which is passed the store and
+        the time step `dt` in seconds. The systems are run in the order they
+        were added.
+        """
+        self._systems.append(system)
+
+    def add_draw_system(self, system: Callable[["ComponentStore", Renderer], None]):
+        """
+        Add a function to draw the entities, which is passed the store and the
+        renderer. The draw systems are run in the order they were added.
+        """
+        self._draw_systems.append(system)
+
+    def update(self, dt: float):
+        if _profiler.enabled:
+            for system in self._systems:
+                _profiler.call(system.__name__, "system", system, self, dt)
+        else:
+            for system in self._systems:
+                system(self, dt)
+
+    def draw(self, renderer: Renderer):
+        if _profiler.enabled:
+            for system in self._draw_systems:
+                _profiler.call(system.__name__, "system", system, self, renderer)
+        else:
+            for system in self._draw_systems:
+                system(self, renderer)
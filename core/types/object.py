@@ -5,6 +5,10 @@ class Object:
     def __init__(self, name):
         self.name = name
 
+    def prepare(self):
+        # Called on a background thread before `start`, see `State.prepare`.
+        pass
+
     def start(self):
         pass
 
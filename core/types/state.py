@@ -1,6 +1,9 @@
 from typing import Sequence
 
-from core.api import Renderer
+from core.api import Profiler, Renderer
+from core.types.componentstore import ComponentStore
+
+_profiler = Profiler()
 
 
 class State:
@@ -8,23 +11,53 @@ class State:
         self.name = name
         self.objects = {}
 
+        # The optional store of simple entities, which are updated and drawn
+        # after the objects, see `ComponentStore`.
+        self.components: ComponentStore | None = None
+
+    def prepare(self):
+        """
+        Do the heavy setup of the state ahead of `start`, e.g. create it's
+        objects and load their resources, which `start` then only has to use.
+
+        The simulation runs this on a background thread, while the previous
+        state is still running, see `Simulation.prepare`. Therefore it must not
+        use the display, the renderer or the event manager.
+        """
+        pass
+
     def start(self):
         # Add objects here.
         for object in self.get_objects():
             object.start()
 
     def update(self, dt: float):
-        for object in self.get_objects():
-            object.update(dt)
+        if _profiler.enabled:
+            for object in self.get_objects():
+                _profiler.call(f"{object.name}.update", "object", object.update, dt)
+        else:
+            for object in self.get_objects():
+                object.update(dt)
+
+        if self.components is not None:
+            self.components.update(dt)
 
     def draw(self, renderer: Renderer):
-        for object in self.get_objects():
-            object.draw(renderer)
+        if _profiler.enabled:
+            for object in self.get_objects():
+                _profiler.call(f"{object.name}.draw", "object", object.draw, renderer)
+        else:
+            for object in self.get_objects():
+                object.draw(renderer)
+
+        if self.components is not None:
+            self.components.draw(renderer)
 
     def end(self):
         for object in self.get_objects():
             object.end()
         self.objects.clear()
+        self.components = None
 
     def get_objects(self):
         return self.objects.values()
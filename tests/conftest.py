@@ -0,0 +1,259 @@
+"""
+The fixtures of the benchmarks of the hot paths.
+
+The benchmarks run headless with SDL's dummy video driver. Each benchmark
+times a function over several rounds, and the median of the rounds is compared
+to a baseline, if one is given:
+
+    python -m pytest tests --bench-save baseline.json
+    python -m pytest tests --bench-compare baseline.json
+
+The benchmark of the startup starts the simulation in new interpreters, and
+only runs with `--bench-startup`.
+
+A benchmark fails, if it's median is slower than the baseline by more than the
+threshold (default 25%). Baselines are only comparable on the same machine.
+"""
+
+import json
+import os
+import platform
+import statistics
+import time
+
+# Paths given as options are relative to the directory pytest is run from.
+_CWD = os.getcwd()
+
+# The assets are loaded relative to the root of the repository, like in zls.pyw.
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The display must be faked before pygame is initialized.
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame as pg
+import pytest
+
+# Some modules load assets in the background when they are imported.
+pg.init()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("bench")
+    group.addoption(
+        "--bench-save",
+        metavar="PATH",
+        default=None,
+        help="save the results of the benchmarks as a JSON baseline",
+    )
+    group.addoption(
+        "--bench-compare",
+        metavar="PATH",
+        default=None,
+        help="fail benchmarks that regressed compared to a JSON baseline",
+    )
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=0.25,
+        help="the allowed slowdown compared to the baseline (default: 0.25)",
+    )
+    group.addoption(
+        "--bench-min-time",
+        type=float,
+        default=0.2,
+        help="the minimum time to run each benchmark in seconds (default: 0.2)",
+    )
+    group.addoption(
+        "--bench-startup",
+        action="store_true",
+        help="run the benchmarks marked `startup`, which start the simulation "
+        "in new interpreters and depend on the load of the machine",
+    )
+
+
+class Benchmark:
+    """
+    This class times a function over several rounds.
+
+    Attributes
+    ----------
+        name : str
+            The id of the benchmark.
+
+        stats : dict[str, float] | None
+            The `min`, `median`, `mean` and `max` of the rounds in seconds, and
+            the number of `rounds`, once the benchmark has run.
+    """
+
+    def __init__(self, name, min_time, baseline, threshold):
+        self.name = name
+        self.stats: dict[str, float] | None = None
+
+        self._min_time = min_time
+        self._baseline = baseline
+        self._threshold = threshold
+
+    def __call__(
+        self, function, *args, setup=None, warmup=3, min_rounds=5, max_rounds=10000
+    ):
+        """
+        Time a function and compare it to the baseline.
+
+        Parameters
+        ----------
+            function : Callable
+                The function to time.
+            setup : Callable | None, default None
+                A function called before each round, which is not timed.
+            warmup : int, default 3
+                The number of rounds, which are not timed.
+            min_rounds : int, default 5
+                The minimum number of timed rounds.
+            max_rounds : int, default 10000
+                The maximum number of timed rounds.
+
+        Additional positional arguments are passed to the function.
+
+        Returns
+        -------
+            Any
+                The return value of the last call of the function.
+        """
+        for _ in range(warmup):
+            if setup is not None:
+                setup()
+            function(*args)
+
+        times = []
+        end = time.perf_counter() + self._min_time
+        while len(times) < max_rounds and (
+            len(times) < min_rounds or time.perf_counter() < end
+        ):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            result = function(*args)
+            times.append(time.perf_counter() - start)
+
+        self.stats = {
+            "min": min(times),
+            "median": statistics.median(times),
+            "mean": statistics.fmean(times),
+            "max": max(times),
+            "rounds": len(times),
+        }
+
+        if self._baseline is not None and self.name in self._baseline:
+            baseline = self._baseline[self.name]["median"]
+            median = self.stats["median"]
+            if median > baseline * (1 + self._threshold):
+                pytest.fail(
+                    f"{self.name} regressed: median {median * 1e6:.1f} us, "
+                    f"baseline {baseline * 1e6:.1f} us "
+                    f"(+{median / baseline - 1:.0%} > +{self._threshold:.0%})"
+                )
+
+        return result
+
+
+def _machine():
+    return {
+        "python": platform.python_version(),
+        "pygame": pg.version.ver,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "startup: a benchmark of the startup, run with --bench-startup"
+    )
+    config._bench_results = {}
+    config._bench_baseline = None
+
+    path = config.getoption("--bench-compare")
+    if path is not None:
+        with open(os.path.join(_CWD, path)) as f:
+            baseline = json.load(f)
+        config._bench_baseline = baseline["benchmarks"]
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--bench-startup"):
+        return
+
+    skip = pytest.mark.skip(reason="needs --bench-startup")
+    for item in items:
+        if item.get_closest_marker("startup") is not None:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def bench(request):
+    config = request.config
+    # The name does not depend on the directory pytest is run from.
+    name = f"{request.module.__name__}::{request.node.name}"
+    bench = Benchmark(
+        name,
+        config.getoption("--bench-min-time"),
+        config._bench_baseline,
+        config.getoption("--bench-threshold"),
+    )
+    yield bench
+    if bench.stats is not None:
+        config._bench_results[bench.name] = bench.stats
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    path = config.getoption("--bench-save")
+    if path is None or not config._bench_results:
+        return
+
+    with open(os.path.join(_CWD, path), "w") as f:
+        json.dump(
+            {"machine": _machine(), "benchmarks": config._bench_results}, f, indent=4
+        )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not config._bench_results:
+        return
+
+    baseline = config._bench_baseline or {}
+    terminalreporter.section("benchmarks")
+    for name, stats in sorted(config._bench_results.items()):
+        line = f"{stats['median'] * 1e6:12.1f} us  {stats['rounds']:6d} rounds  {name}"
+        if name in baseline:
+            change = stats["median"] / baseline[name]["median"] - 1
+            line += f"  ({change:+.0%})"
+        terminalreporter.write_line(line)
+
+
+@pytest.fixture(scope="session")
+def simulation():
+    """
+    The headless simulation, which creates the singletons of the window, the
+    event manager and the renderer.
+    """
+    from core.simulation import Simulation
+
+    simulation = Simulation(headless=True)
+    yield simulation
+    simulation.end()
+    pg.quit()
+
+
+@pytest.fixture
+def renderer(simulation):
+    renderer = simulation.renderer
+    renderer._queue.clear()
+    yield renderer
+    renderer._queue.clear()
+
+
+@pytest.fixture
+def eventmanager(simulation):
+    return simulation.eventmanager
@@ -0,0 +1,38 @@
+import pytest
+
+from core.assets import colors, fonts, images
+
+
+def test_cached_text(bench, simulation):
+    fonts.gui_regular.render(16, "Zipline", True, colors.black)
+    bench(fonts.gui_regular.render, 16, "Zipline", True, colors.black)
+
+
+def test_cached_texts(bench, simulation):
+    texts = [f"{i}: {i * 0.5:.1f} m/s" for i in range(512)]
+
+    def render():
+        for text in texts:
+            fonts.gui_regular.render(16, text, True, colors.black)
+
+    render()
+    bench(render)
+
+
+def test_uncached_text(bench, simulation):
+    texts = iter(range(10**9))
+
+    def render():
+        fonts.gui_regular.render(16, f"{next(texts)}", True, colors.black)
+
+    bench(render)
+
+
+@pytest.mark.parametrize("convert", [False, True], ids=["raw", "converted"])
+def test_image(bench, simulation, convert):
+    bench(images.zls_icon.as_surface, convert)
+
+
+def test_atlas(bench, simulation):
+    images.icons.get(images.zls_icon)
+    bench(images.icons.get, images.zls_icon)
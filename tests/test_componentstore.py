@@ -0,0 +1,123 @@
+import numpy as np
+import pygame as pg
+import pytest
+
+from core.api._commandbuffer import _COLUMNS
+from core.states.runtime_test import _create_entities
+from core.types import ComponentStore
+
+
+def create_store():
+    return ComponentStore(
+        {"position": (np.float64, (2,)), "color": (np.uint32, ())}, capacity=2
+    )
+
+
+def test_add_remove():
+    store = create_store()
+    ids = store.add(5, position=np.arange(10).reshape(5, 2), color=7)
+    assert ids.tolist() == [0, 1, 2, 3, 4]
+    assert store.capacity >= 5
+    assert store["color"].tolist() == [7] * 5
+
+    store.remove([1, 3])
+    assert store.ids.tolist() == [0, 2, 4]
+    assert store["position"][store.rows(4)].tolist() == [8, 9]
+
+    # The ids of removed entities are reused.
+    new = store.add(3)
+    assert sorted(new.tolist()) == [1, 3, 5]
+    assert store["position"][store.rows(new)].tolist() == [[0, 0]] * 3
+
+    with pytest.raises(KeyError):
+        store.rows([1, 6])
+    with pytest.raises(KeyError):
+        store.remove([99])
+    with pytest.raises(KeyError):
+        store.rows(-1)
+    with pytest.raises(KeyError):
+        store.add(velocity=1)
+
+
+def test_systems(renderer):
+    store = create_store()
+    store.add(3, position=1.0)
+    calls = []
+
+    def move(s: ComponentStore, dt):
+        s["position"] += dt
+
+    def draw(s: ComponentStore, r):
+        calls.append(len(s))
+
+    store.add_system(move)
+    store.add_draw_system(draw)
+    store.update(0.5)
+    store.draw(renderer)
+    assert store["position"].tolist() == [[1.5, 1.5]] * 3
+    assert calls == [3]
+
+
+def queued(renderer):
+    queue = renderer._queue
+    n = queue.count
+    columns = {name: getattr(queue, name)[:n].copy() for name in _COLUMNS}
+    objects = queue.objects[:n]
+    queue.clear()
+    return columns, objects
+
+
+def assert_same_commands(renderer, draw_batched, draw_each):
+    draw_batched()
+    batched, batched_objects = queued(renderer)
+    draw_each()
+    each, each_objects = queued(renderer)
+
+    for name in _COLUMNS:
+        assert np.array_equal(batched[name], each[name]), name
+    assert all(a is b for a, b in zip(batched_objects, each_objects, strict=True))
+
+
+def test_batched_draw(renderer):
+    # The batched draw methods queue the same commands as the single ones.
+    rng = np.random.default_rng(0)
+    points = rng.integers(0, 500, (16, 2))
+    colors = rng.integers(0, 2**32, 16, dtype=np.uint32)
+    radii = rng.integers(1, 10, 16)
+    sizes = rng.integers(1, 10, (16, 2))
+    surfaces = [pg.Surface((4, 4)), pg.Surface((8, 2))]
+    surfaces[1].set_alpha(100)
+    ids = np.arange(16) % 2
+
+    assert_same_commands(
+        renderer,
+        lambda: renderer.draw_circles(2, colors, points, radii, 1),
+        lambda: [
+            renderer.draw_circle(2, pg.Color(int(c)), p, r, 1)
+            for c, p, r in zip(colors, points, radii)
+        ],
+    )
+    assert_same_commands(
+        renderer,
+        lambda: renderer.draw_rects(1, pg.Color("red"), np.hstack((points, sizes))),
+        lambda: [
+            renderer.draw_rect(1, pg.Color("red"), (*p, *s))
+            for p, s in zip(points, sizes)
+        ],
+    )
+    assert_same_commands(
+        renderer,
+        lambda: renderer.draw_surfaces(3, surfaces, points, ids),
+        lambda: [renderer.draw_surface(3, surfaces[i], p) for i, p in zip(ids, points)],
+    )
+
+
+@pytest.mark.parametrize("count", [256, 4096])
+def test_entities_frame(bench, renderer, count):
+    store = _create_entities(count)
+
+    def frame():
+        store.update(1 / 240)
+        store.draw(renderer)
+
+    bench(frame, setup=renderer._queue.clear)
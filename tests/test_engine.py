@@ -0,0 +1,26 @@
+import numpy as np
+
+from core.physics import ZiplineEngine
+
+
+def test_arrival():
+    engine = ZiplineEngine(2, drop=[10.0, 20.0])
+    engine.run(1e-3, 600)
+
+    assert not engine.active.any()
+    assert np.allclose(engine.position, engine.length)
+    # The steeper cable is faster.
+    assert engine.arrival_time[1] < engine.arrival_time[0]
+    assert engine.impact_speed[1] > engine.impact_speed[0]
+
+
+def test_uphill():
+    # A rider pulled back at the upper anchor is done right away.
+    engine = ZiplineEngine(3, drop=[-5.0, 0.0, 10.0])
+    engine.run(1e-3, 600)
+
+    assert engine.time < 60
+    assert not engine.active.any()
+    assert engine.position[:2].tolist() == [0.0, 0.0]
+    assert np.isnan(engine.arrival_time[:2]).all()
+    assert not np.isnan(engine.arrival_time[2])
@@ -0,0 +1,132 @@
+import pygame as pg
+import pytest
+
+from core.api import HandlerPolicy
+
+
+@pytest.fixture
+def handlers(eventmanager):
+    ids = []
+    yield ids
+    for id in ids:
+        eventmanager.remove_handler(id)
+    eventmanager._update()
+
+
+def post_events(count):
+    pg.event.clear()
+    for i in range(count):
+        pg.event.post(pg.event.Event(pg.USEREVENT, index=i))
+
+
+@pytest.mark.parametrize("policy", list(HandlerPolicy), ids=lambda p: p.name)
+def test_dispatch(bench, eventmanager, handlers, policy):
+    calls = []
+
+    def on_event(event):
+        calls.append(event)
+
+    for _ in range(1024):
+        handlers.append(
+            eventmanager.add_new_handler(
+                on_event, pg.USEREVENT, pass_event=True, policy=policy
+            )
+        )
+
+    bench(eventmanager._update, setup=lambda: post_events(64))
+
+    calls.clear()
+    post_events(64)
+    eventmanager._update()
+    expected = 1024 * 64 if policy is HandlerPolicy.EVERY else 1024
+    assert len(calls) == expected
+
+
+def test_policies(eventmanager, handlers):
+    calls = []
+
+    for policy in HandlerPolicy:
+
+        def on_event(event, policy=policy):
+            calls.append((policy, event.index))
+
+        handlers.append(
+            eventmanager.add_new_handler(
+                on_event, pg.USEREVENT, pass_event=True, policy=policy
+            )
+        )
+
+    post_events(3)
+    eventmanager._update()
+
+    # ONCE gets the first event, EVERY each event in order, and LATEST the last
+    # event after all other handlers.
+    assert calls == [
+        (HandlerPolicy.ONCE, 0),
+        (HandlerPolicy.EVERY, 0),
+        (HandlerPolicy.EVERY, 1),
+        (HandlerPolicy.EVERY, 2),
+        (HandlerPolicy.LATEST, 2),
+    ]
+
+    # ONCE is called again in the next frame.
+    calls.clear()
+    post_events(1)
+    eventmanager._update()
+    assert sorted(calls, key=lambda c: c[0].value) == [
+        (HandlerPolicy.ONCE, 0),
+        (HandlerPolicy.EVERY, 0),
+        (HandlerPolicy.LATEST, 0),
+    ]
+
+
+def test_unrelated_events(bench, eventmanager, handlers):
+    # Handlers of other event types must not slow down the dispatch.
+    for type in range(pg.USEREVENT + 1, pg.USEREVENT + 1025):
+        handlers.append(eventmanager.add_new_handler(lambda: None, type))
+
+    bench(eventmanager._update, setup=lambda: post_events(64))
+
+
+def test_add_remove(bench, eventmanager):
+    def add_remove():
+        ids = [
+            eventmanager.add_new_handler(lambda: None, pg.USEREVENT) for _ in range(256)
+        ]
+        for id in ids:
+            eventmanager.remove_handler(id)
+        eventmanager._update()
+
+    bench(add_remove)
+
+
+def test_add_remove_during_dispatch(eventmanager, handlers):
+    calls = []
+
+    def on_added(event):
+        calls.append(("added", event.index))
+
+    def on_event(event):
+        calls.append(("first", event.index))
+        if event.index == 0:
+            handlers.append(
+                eventmanager.add_new_handler(
+                    on_added, pg.USEREVENT, pass_event=True, policy=HandlerPolicy.EVERY
+                )
+            )
+            eventmanager.remove_handler(first)
+
+    first = eventmanager.add_new_handler(
+        on_event, pg.USEREVENT, pass_event=True, policy=HandlerPolicy.EVERY
+    )
+
+    # The added handler is called from the next frame on, and the removed
+    # handler is still called in the frame it was removed in.
+    post_events(2)
+    eventmanager._update()
+    assert calls == [("first", 0), ("first", 1)]
+
+    calls.clear()
+    post_events(2)
+    eventmanager._update()
+    assert calls == [("added", 0), ("added", 1)]
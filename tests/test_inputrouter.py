@@ -0,0 +1,113 @@
+import pygame as pg
+import pytest
+
+from core.api import InputRouter
+
+
+class Target:
+    def __init__(self, rect):
+        self.rect = pg.Rect(rect)
+        self.calls = []
+
+    def on_mouse_enter(self):
+        self.calls.append("enter")
+
+    def on_mouse_leave(self):
+        self.calls.append("leave")
+
+    def on_mouse_down(self, event):
+        self.calls.append("down")
+
+    def on_mouse_up(self, event):
+        self.calls.append("up")
+
+    def on_mouse_motion(self, event):
+        self.calls.append("motion")
+
+
+@pytest.fixture
+def router(simulation):
+    router = InputRouter()
+    targets = []
+    yield router, targets
+    for target in targets:
+        router.remove(target)
+    router._mouse_pos = None
+
+
+def add_grid(router, targets, count, size=16):
+    columns = 64
+    for i in range(count):
+        row, column = divmod(i, columns)
+        target = Target((column * size, row * size, size - 2, size - 2))
+        router.add(target)
+        targets.append(target)
+
+
+def mouse(type, pos, button=1):
+    if type == pg.MOUSEMOTION:
+        return pg.event.Event(type, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+    return pg.event.Event(type, pos=pos, button=button)
+
+
+def test_topmost(router):
+    router, targets = router
+    below = Target((0, 0, 100, 100))
+    above = Target((50, 50, 100, 100))
+    higher = Target((0, 0, 20, 20))
+    targets += [below, above, higher]
+    router.add(higher, z=1)
+    router.add(below)
+    router.add(above)
+
+    assert router.hit((10, 10)) is higher
+    assert router.hit((30, 30)) is below
+    assert router.hit((60, 60)) is above
+    assert router.hit((200, 200)) is None
+
+    router.remove(higher)
+    assert router.hit((10, 10)) is below
+
+
+def test_routing(router):
+    router, targets = router
+    first = Target((0, 0, 100, 100))
+    second = Target((200, 0, 100, 100))
+    targets += [first, second]
+    router.add(first)
+    router.add(second)
+
+    router._on_motion(mouse(pg.MOUSEMOTION, (10, 10)))
+    router._on_down(mouse(pg.MOUSEBUTTONDOWN, (10, 10)))
+    # The pressed target keeps receiving the mouse, until it is released.
+    router._on_motion(mouse(pg.MOUSEMOTION, (210, 10)))
+    router._on_up(mouse(pg.MOUSEBUTTONUP, (210, 10)))
+
+    assert first.calls == ["enter", "down", "leave", "motion", "up"]
+    assert second.calls == ["enter"]
+
+
+def test_reindex(router, simulation):
+    router, targets = router
+    target = Target((0, 0, 10, 10))
+    targets.append(target)
+    router.add(target)
+
+    target.rect.topleft = (500, 500)
+    simulation.renderer.layout()
+    assert router.hit((5, 5)) is None
+    assert router.hit((505, 505)) is target
+
+
+@pytest.mark.parametrize("count", [16, 4096])
+def test_hit(bench, router, count):
+    # The cost of a mouse event does not depend on the number of targets.
+    router, targets = router
+    add_grid(router, targets, count)
+    events = [mouse(pg.MOUSEMOTION, (x * 7 % 1024, x * 3 % 64)) for x in range(64)]
+
+    def route():
+        for event in events:
+            router._on_motion(event)
+
+    bench(route)
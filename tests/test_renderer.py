@@ -0,0 +1,124 @@
+import numpy as np
+import pygame as pg
+import pytest
+
+from core.assets import colors, fonts
+
+COUNT = 4096
+
+
+def queue_primitives(renderer, pos, size=8):
+    for i, (x, y) in enumerate(pos.tolist()):
+        kind = i % 3
+        if kind == 0:
+            renderer.draw_rect(1, colors.red, (x, y, size, size))
+        elif kind == 1:
+            renderer.draw_line(1, colors.blue, (x, y), (x + size, y + size))
+        else:
+            renderer.draw_circle(1, colors.dark_green, (x, y), size // 2)
+
+
+@pytest.fixture
+def positions(renderer):
+    rng = np.random.default_rng(0)
+    return (renderer.dpos + rng.random((COUNT, 2)) * renderer.dsize).astype(int)
+
+
+def test_partial_redraw(renderer):
+    # Redrawing only the changed regions gives the same pixels as redrawing
+    # the whole scene.
+    rng = np.random.default_rng(1)
+    count = 256
+    pos = renderer.dpos + rng.random((count, 2)) * renderer.dsize
+    vel = rng.uniform(-20, 20, (count, 2))
+    surface = pg.Surface((24, 12))
+    surface.fill(colors.purple)
+    polyline = np.array(((0, 0), (40, 30), (80, 0), (120, 30)))
+
+    renderer.invalidate()
+    for frame in range(40):
+        # Only some of the primitives move in a frame.
+        moving = rng.random(count) < 0.1
+        pos[moving] += vel[moving]
+        points = pos.astype(int)
+
+        queue_primitives(renderer, points[: count // 2], size=12)
+        for x, y in points[count // 2 : count // 2 + 16].tolist():
+            renderer.draw_surface(2, surface, (x, y), alpha=128)
+        if frame % 8 < 4:
+            renderer.draw_lines(3, colors.black, polyline + points[-1], 3)
+        renderer.draw_line(0, colors.orange, points[-2], points[-3], 5)
+        renderer._update()
+
+        partial = pg.surfarray.array3d(renderer.screen)
+        renderer._redraw(renderer._scene, [renderer.drect])
+        full = pg.surfarray.array3d(renderer.screen)
+        assert np.array_equal(partial, full), f"frame {frame}"
+
+
+def test_queue(bench, renderer, positions):
+    bench(queue_primitives, renderer, positions, setup=renderer._queue.clear)
+
+
+def test_static_scene(bench, renderer, positions):
+    # Nothing changes between the frames, so nothing is redrawn.
+    def frame():
+        queue_primitives(renderer, positions)
+        renderer._update()
+
+    bench(frame)
+
+    frame()
+    assert not renderer.presented
+
+
+def test_moving_scene(bench, renderer, positions):
+    # Every primitive moves in every frame.
+    offset = 0
+
+    def frame():
+        nonlocal offset
+        offset = (offset + 1) % 8
+        queue_primitives(renderer, positions + offset)
+        renderer._update()
+
+    bench(frame)
+
+
+def test_partially_changing_scene(bench, renderer, positions):
+    # A few primitives move in every frame, the rest is static.
+    moving = positions.copy()
+    offset = 0
+
+    def frame():
+        nonlocal offset
+        offset = (offset + 1) % 8
+        moving[:16] = positions[:16] + offset
+        queue_primitives(renderer, moving)
+        renderer._update()
+
+    bench(frame)
+
+
+def test_texts(bench, renderer, positions):
+    surfaces = [
+        fonts.gui_regular.render(16, f"text {i}", True, colors.black)
+        for i in range(256)
+    ]
+    pos = positions[:1024].tolist()
+
+    def frame():
+        for i, p in enumerate(pos):
+            renderer.draw_surface(2, surfaces[i % len(surfaces)], p)
+        renderer._update()
+
+    bench(frame)
+
+
+def test_full_redraw(bench, renderer, positions):
+    def frame():
+        queue_primitives(renderer, positions)
+        renderer.invalidate()
+        renderer._update()
+
+    bench(frame)
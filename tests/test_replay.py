@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from core.physics import Replay, TelemetryRecorder
+
+
+def create_run(tmp_path, times):
+    recorder = TelemetryRecorder(
+        2, ("position",), directory=str(tmp_path / "run"), dtype=np.float64
+    )
+    engine = SimpleNamespace(time=0.0, position=None)
+    for time in times:
+        engine.time = time
+        engine.position = np.array([2 * time, -time])
+        recorder.record(engine)
+    return recorder.close()
+
+
+def test_even(tmp_path):
+    replay = Replay(create_run(tmp_path, np.arange(11) * 0.5))
+    assert replay.meta["interval"] == 0.5
+    assert replay.duration == 5.0
+
+    assert replay.seek(1.25) == (2, pytest.approx(0.5))
+    for time in (0.0, 0.3, 1.25, 4.9, 5.0):
+        assert replay.sample("position", time) == pytest.approx([2 * time, -time])
+
+
+def test_uneven(tmp_path):
+    times = [1.0, 1.1, 1.5, 4.0, 4.2, 4.25, 9.0]
+    replay = Replay(create_run(tmp_path, times), index_size=4)
+    assert replay.meta["interval"] is None
+
+    for i, time in enumerate(times[:-1]):
+        assert replay.seek(time) == (i, 0.0)
+        middle = (time + times[i + 1]) / 2
+        assert replay.seek(middle) == (i, pytest.approx(0.5))
+        assert replay.sample("position", middle) == pytest.approx([2 * middle, -middle])
+
+
+@pytest.mark.parametrize("times", [np.arange(5.0), [0.0, 1.0, 3.0, 7.0]])
+def test_clamp(tmp_path, times):
+    replay = Replay(create_run(tmp_path, times))
+    last = len(times) - 1
+
+    assert replay.seek(-1.0) == (0, 0.0)
+    assert replay.seek(100.0) == (last, 0.0)
+    assert replay.sample("position", -1.0).tolist() == [0.0, -0.0]
+    assert replay.sample("position", 100.0).tolist() == [2 * times[-1], -times[-1]]
+    assert replay.window("position", 100.0, 2).shape == (2, 2)
+
+
+def test_no_rows(tmp_path):
+    with pytest.raises(ValueError):
+        Replay(create_run(tmp_path, []))
@@ -0,0 +1,24 @@
+import pytest
+
+from core import startup
+
+
+def test_lazy_imports():
+    result = startup.measure()
+
+    modules = {m.module for m in result["modules"]}
+    assert "core.simulation" in modules
+    assert not {m.split(".")[0] for m in modules} & set(startup.LAZY_MODULES)
+
+
+@pytest.mark.startup
+def test_first_frame(bench):
+    # Each round starts the simulation in a new interpreter.
+    result = bench(startup.measure, warmup=1, min_rounds=3)
+    assert result["first_frame"] < startup.FIRST_FRAME_BUDGET
+
+
+def test_no_first_frame():
+    # The help is printed without running the simulation.
+    with pytest.raises(RuntimeError):
+        startup.measure("--help")
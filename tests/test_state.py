@@ -0,0 +1,161 @@
+import threading
+import time
+
+import pytest
+
+# The simulation is imported before the objects, which import it themselves.
+import core.simulation  # noqa: F401
+from core.assets import colors
+from core.objects import Graph, Layer
+from core.states.visual import VisualState
+from core.types import State
+
+
+def create_layers(count):
+    columns = 8
+    layers = []
+    for i in range(count):
+        row, column = divmod(i, columns)
+        rows = -(-count // columns)
+        layers.append(
+            Layer(
+                f"layer_{i}",
+                (column / columns, row / rows),
+                ((column + 1) / columns, (row + 1) / rows),
+                f"Layer {i}",
+                colors.light_gray,
+                colors.black,
+                1,
+                20,
+                colors.dark_gray,
+                16,
+                4,
+                colors.white,
+            )
+        )
+    return layers
+
+
+def test_layer_draw(bench, renderer):
+    layers = create_layers(64)
+    for layer in layers:
+        layer.start()
+
+    def draw():
+        for layer in layers:
+            layer.draw(renderer)
+
+    bench(draw, setup=renderer._queue.clear)
+
+    for layer in layers:
+        layer.end()
+
+
+def test_layer_resize(bench, renderer):
+    # A new size rasterizes the layers again.
+    layers = create_layers(64)
+    for layer in layers:
+        layer.start()
+
+    def draw():
+        for layer in layers:
+            layer._surface_key = None
+            layer.draw(renderer)
+
+    bench(draw, setup=renderer._queue.clear)
+
+    for layer in layers:
+        layer.end()
+
+
+def test_graph_without_series(renderer):
+    layer = create_layers(1)[0]
+    layer.start()
+    graph = Graph("graph", layer, [])
+    graph.update(1 / 240)
+    graph.draw(renderer)
+    layer.end()
+
+
+def test_state_cycle(bench, renderer):
+    state = State("bench")
+
+    def cycle():
+        state.set_objects(create_layers(64))
+        state.start()
+        state.update(1 / 240)
+        state.draw(renderer)
+        renderer._update()
+        state.end()
+
+    bench(cycle)
+
+
+@pytest.fixture
+def visual(simulation):
+    state = VisualState()
+    state.start()
+    yield state
+    state.end()
+
+
+def test_visual_frame(bench, simulation, visual):
+    def frame():
+        for _ in range(4):
+            visual.update(1 / 240)
+        visual.draw(simulation.renderer)
+        simulation.renderer._update()
+
+    bench(frame)
+
+
+def test_visual_cycle(bench, simulation):
+    state = VisualState()
+
+    def cycle():
+        state.start()
+        state.update(1 / 240)
+        state.draw(simulation.renderer)
+        simulation.renderer._update()
+        state.end()
+
+    bench(cycle)
+
+
+class PreparedState(State):
+    def __init__(self):
+        super().__init__("prepared")
+        self.prepare_thread = None
+        self.prepared = False
+        self.prepared_at_start = None
+
+    def prepare(self):
+        self.prepare_thread = threading.current_thread()
+        time.sleep(0.05)
+        self.prepared = True
+
+    def start(self):
+        self.prepared_at_start = self.prepared
+        super().start()
+
+
+def test_prepare(simulation):
+    # A state is prepared in the background, and only started once it is done.
+    state = PreparedState()
+    simulation._states[state.name] = state
+    next_name = simulation.next_state_name
+
+    future = simulation.prepare(state.name)
+    assert simulation.prepare(state.name) is future
+    simulation.next_state_name = state.name
+    simulation.loop_method()
+
+    try:
+        assert future.done()
+        assert state.prepare_thread is not threading.main_thread()
+        assert state.prepared_at_start
+    finally:
+        state.end()
+        simulation._prev_state_name = None
+        simulation.next_state_name = next_name
+        del simulation._states[state.name]
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from core.physics import RESULTS, ZiplineEngine, grid, sweep
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_sweep(workers):
+    # Each row matches the run of a single rider with the same parameters.
+    configs = grid(
+        start_height=[5.0, 20.0],
+        sag=[0.0, 2.0],
+        mass=[60.0, 100.0],
+        brake_position=[np.inf, 80.0],
+    )
+    configs["brake_force"] = 400.0
+    result = sweep(configs, dt=2e-2, max_time=60, workers=workers, chunk_size=5)
+
+    assert len(result) == len(configs)
+    for _, row in result.iterrows():
+        engine = ZiplineEngine(
+            span=row["span"],
+            drop=row["start_height"] - row["end_height"],
+            sag=row["sag"],
+            mass=row["mass"],
+            drag_coefficient=row["drag_coefficient"],
+            frontal_area=row["frontal_area"],
+            rolling_resistance=row["rolling_resistance"],
+            brake_position=row["brake_position"],
+            brake_force=row["brake_force"],
+        )
+        engine.run(2e-2, 60)
+        for name in RESULTS:
+            assert row[name] == pytest.approx(
+                getattr(engine, name)[0], nan_ok=True
+            ), name
+
+
+def test_not_descending():
+    # Riders on cables, which do not descend, stop at the upper anchor.
+    result = sweep({"start_height": [5.0, 10.0]}, workers=1)
+    assert np.isnan(result["arrival_time"]).all()
+    assert (result["peak_speed"] == 0).all()
+
+
+def test_unknown_parameter():
+    with pytest.raises(ValueError):
+        sweep({"height": [1.0]}, workers=1)
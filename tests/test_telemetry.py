@@ -0,0 +1,105 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from core.physics import TelemetryRecorder, read_run
+
+
+def record(recorder, count, times=None):
+    engine = SimpleNamespace(time=0.0, position=None, velocity=None)
+    for i in range(count):
+        engine.time = i * 0.5 if times is None else times[i]
+        engine.position = np.array([i, -i])
+        engine.velocity = np.array([2 * i, 0])
+        recorder.record(engine)
+
+
+def create_recorder(tmp_path, **kwargs):
+    return TelemetryRecorder(
+        2, ("position", "velocity"), directory=str(tmp_path / "run"), **kwargs
+    )
+
+
+def test_read_run(tmp_path):
+    recorder = create_recorder(tmp_path, config={"span": 100})
+    record(recorder, 10)
+    meta, columns = read_run(recorder.close())
+
+    assert meta["rows"] == 10
+    assert meta["start"] == 0.0
+    assert meta["interval"] == 0.5
+    assert meta["config"] == {"span": 100}
+    assert columns["time"].tolist() == [i * 0.5 for i in range(10)]
+    assert columns["position"][:, 0].tolist() == list(range(10))
+    assert columns["velocity"].shape == (10, 2)
+
+
+def test_uneven_time(tmp_path):
+    recorder = create_recorder(tmp_path)
+    record(recorder, 4, times=[1.0, 2.0, 3.0, 5.0])
+    meta, columns = read_run(recorder.close())
+
+    assert meta["start"] == 1.0
+    assert meta["interval"] is None
+
+
+def test_chunk_reuse(tmp_path):
+    # The budget only fits the minimum of two chunks, which are reused once
+    # they are written.
+    recorder = create_recorder(tmp_path, chunk_size=4, max_bytes=0)
+    record(recorder, 101)
+    assert recorder._allocated == 2
+
+    meta, columns = read_run(recorder.close())
+    assert meta["rows"] == 101
+    assert columns["position"][:, 0].tolist() == list(range(101))
+    assert columns["velocity"][:, 0].tolist() == [2 * i for i in range(101)]
+
+
+def test_decimation(tmp_path):
+    recorder = create_recorder(tmp_path, decimation=3, chunk_size=2)
+    record(recorder, 10)
+    meta, columns = read_run(recorder.close())
+
+    assert meta["rows"] == 4
+    assert meta["decimation"] == 3
+    assert meta["interval"] == 1.5
+    assert columns["position"][:, 0].tolist() == [0, 3, 6, 9]
+
+
+def test_npz(tmp_path):
+    recorder = create_recorder(tmp_path, chunk_size=4)
+    record(recorder, 10)
+    path = str(tmp_path / "run.npz")
+    recorder.save_npz(path, compressed=True).result()
+    recorder.close()
+
+    with np.load(path) as data:
+        assert data["time"].tolist() == [i * 0.5 for i in range(10)]
+        assert data["position"][:, 1].tolist() == [-i for i in range(10)]
+
+
+def test_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    recorder = create_recorder(tmp_path, chunk_size=4)
+    record(recorder, 10)
+    path = str(tmp_path / "run.parquet")
+    recorder.save_parquet(path, rows_per_group=6).result()
+    recorder.close()
+
+    table = pq.read_table(path).to_pydict()
+    assert table["time"] == [i * 0.5 for i in range(10) for _ in range(2)]
+    assert table["rider"] == [0, 1] * 10
+    assert table["position"] == [p for i in range(10) for p in (i, -i)]
+
+
+def test_closed(tmp_path):
+    recorder = create_recorder(tmp_path)
+    record(recorder, 2)
+    recorder.close()
+
+    with pytest.raises(RuntimeError):
+        recorder.save_npz(str(tmp_path / "run.npz"))
+    with pytest.raises(RuntimeError):
+        recorder.flush()
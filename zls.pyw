@@ -3,30 +3,171 @@ The main module of the zipline simulation.
 
 Simply run this module by running 'py .\zls.pyw' or double-click on it from windows.
 
+To run the simulation without a window, e.g. in CI or on compute nodes, run
+'python zls.pyw --headless'. See 'python zls.pyw --help' for further options.
+
+To benchmark the engine, run 'python zls.pyw --headless --state runtime_test',
+which writes a report of the frame times to 'runtime_test.json'. To see where
+the time of the frames is spent, add '--profile trace.json' and open the trace
+in 'chrome://tracing' or Perfetto.
+
+To see how long it takes until the first frame is drawn, and which imports
+take the longest, run 'python zls.pyw --startup-report'. Heavy modules, like
+pandas and matplotlib, are only imported once they are used.
+
 Do be aware that it has following dependencies:
  - python 3.11.0
  - pygame 2.1.3.dev8
  - pygame-textinput 1.0.1
- - pywin32 305
+ - pywin32 305 (only on Windows)
  - numpy 1.23.5
  - pandas 1.5.2
  - matplotlib 3.6.2
 
 A standalone binary executable can be found in the 'bin' directory.
 """
+
+import argparse
 import os
 import sys
 
 import pygame as pg
 
+from core import startup
+from core.api import Profiler
 from core.simulation import Simulation
 
+# Paths given as arguments are relative to the directory the module is run from.
+_CWD = os.getcwd()
+
 # https://stackoverflow.com/questions/28033003/pyinstaller-with-pygame
 if getattr(sys, "frozen", False):
     os.chdir(sys._MEIPASS)
+else:
+    # The assets are found relative to this module.
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+
+def user_path(path):
+    return os.path.join(_CWD, path)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="A zipline simulation.")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="run without a window, using SDL's dummy video driver",
+    )
+    parser.add_argument(
+        "--no-render",
+        action="store_true",
+        help="do not render frames (only with --headless)",
+    )
+    parser.add_argument(
+        "--idle-fps",
+        type=int,
+        default=5,
+        help="the framerate when nothing changes or the window is minimized, "
+        "0 to never throttle (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--busy-loop",
+        action="store_true",
+        help="pace the frames by busy waiting, which is more precise but uses "
+        "a whole CPU core",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=None,
+        help="exit after this number of frames",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="DIR",
+        type=user_path,
+        default=None,
+        help="record the telemetry of the simulation to a run directory",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="DIR",
+        type=user_path,
+        default=None,
+        help="replay a run directory recorded with --record",
+    )
+    parser.add_argument(
+        "--state",
+        default=None,
+        help="the state to start in, e.g. 'runtime_test' to run the benchmark",
+    )
+    parser.add_argument(
+        "--report",
+        metavar="PATH",
+        type=user_path,
+        default="runtime_test.json",
+        help="the path of the report of the benchmark (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="measure the time to the first frame and the imports in a new "
+        "interpreter, and exit with an error if it is over budget",
+    )
+    parser.add_argument(
+        "--first-frame",
+        action="store_true",
+        help="print a line once the first frame is done, to measure the startup",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        type=user_path,
+        default=None,
+        help="profile the frames and write a Chrome trace to PATH on exit",
+    )
+
+    args = parser.parse_args()
+    if args.no_render and not args.headless:
+        parser.error("--no-render requires --headless")
+    return args
+
 
 if __name__ == "__main__":
+    args = parse_args()
+
+    if args.startup_report:
+        result = startup.measure()
+        print(startup.format_report(result))
+        sys.exit(result["first_frame"] > startup.FIRST_FRAME_BUDGET)
+
+    if args.headless:
+        # Avoid probing for a real display, when pygame is initialized.
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+
     pg.init()
-    Simulation().run()
+    simulation = Simulation(
+        headless=args.headless,
+        render=not args.no_render,
+        record_directory=args.record,
+        replay_directory=args.replay,
+        state=args.state,
+    )
+    simulation.idle_fps = args.idle_fps or None
+    simulation.busy_loop = args.busy_loop
+    simulation.get_state("runtime_test").report_path = args.report
+    if args.profile is not None:
+        Profiler().enabled = True
+    if args.first_frame:
+        simulation.run(1)
+        print(startup.FIRST_FRAME_LINE, flush=True)
+        if args.frames != 1:
+            simulation.run(None if args.frames is None else args.frames - 1)
+    else:
+        simulation.run(args.frames)
+    simulation.end()
+    if args.profile is not None:
+        Profiler().export_trace(args.profile)
     pg.quit()
     sys.exit()